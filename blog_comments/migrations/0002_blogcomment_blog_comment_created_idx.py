@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_comments', '0001_initial'),
+        ('blogs', '0002_blog_blog_created_idx_blog_blog_owner_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogcomment',
+            index=models.Index(fields=['blog', '-created_at', '-id'], name='blog_comment_created_idx'),
+        ),
+    ]
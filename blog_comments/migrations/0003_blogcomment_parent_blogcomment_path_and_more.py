@@ -0,0 +1,40 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_comments', '0002_blogcomment_blog_comment_created_idx'),
+        ('blogs', '0008_blogactivity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogcomment',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='replies', to='blog_comments.blogcomment'),
+        ),
+        migrations.AddField(
+            model_name='blogcomment',
+            name='path',
+            field=models.CharField(default='', editable=False, max_length=250),
+        ),
+        migrations.AddField(
+            model_name='blogcomment',
+            name='reply_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='blogcomment',
+            index=models.Index(condition=models.Q(('parent__isnull', True)), fields=['blog', '-created_at', '-id'], name='blog_comment_top_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogcomment',
+            index=models.Index(fields=['blog', 'path'], name='blog_comment_path_idx'),
+        ),
+    ]
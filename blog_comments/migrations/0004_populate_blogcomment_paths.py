@@ -0,0 +1,36 @@
+from django.db import migrations
+from ft_api.threads import thread_path
+
+
+def populate_blogcomment_paths(apps, schema_editor):
+    """
+    Give existing comments, which are all top-level, their materialized
+    paths.
+    """
+    BlogComment = apps.get_model('blog_comments', 'BlogComment')
+    last_pk = 0
+    while True:
+        comments = list(
+            BlogComment.objects.filter(pk__gt=last_pk).order_by('pk').only(
+                'pk', 'path'
+            )[:1000]
+        )
+        if not comments:
+            return
+        for comment in comments:
+            comment.path = thread_path(None, comment.pk)
+        BlogComment.objects.bulk_update(comments, ['path'])
+        last_pk = comments[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_comments', '0003_blogcomment_parent_blogcomment_path_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_blogcomment_paths, migrations.RunPython.noop
+        ),
+    ]
@@ -1,6 +1,11 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete
 from django.contrib.auth.models import User
-from blogs.models import Blog
+from blogs.models import Blog, BlogActivity
+from ft_api.counters import adjust_counters
+from ft_api.scores import COMMENT_WEIGHT, decayed_weight
+from ft_api.threads import PATH_LENGTH, PATH_STEP, thread_path
+from ft_api.trending import record_activity
 
 
 class BlogComment(models.Model):
@@ -12,20 +17,168 @@ class BlogComment(models.Model):
             links to User model.
         blog (ForeignKey): The blog post that the comment is related to.
             ForeignKey links to Blog model.
+        parent (ForeignKey): The comment this comment replies to, or None
+            for a top-level comment.
         comment (TextField): The content of the comment.
         created_at (DateTimeField): The date and time when the comment
             was created.
         updated_at (DateTimeField): The date and time when the comment
             was last updated.
+        path (CharField): The materialized path of the comment, the
+            zero-padded ids of its ancestors and itself, so a thread is
+            a single range of the (blog, path) index.
+        reply_count (IntegerField): Stored number of direct replies, kept
+            in sync when replies are created or deleted.
     """
     owner = models.ForeignKey(User, on_delete=models.CASCADE)
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE)
+    parent = models.ForeignKey(
+        'self', null=True, blank=True, related_name='replies',
+        on_delete=models.CASCADE
+    )
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    path = models.CharField(
+        max_length=PATH_LENGTH, default='', editable=False
+    )
+    reply_count = models.IntegerField(default=0)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['blog', '-created_at', '-id'],
+                name='blog_comment_created_idx'
+            ),
+            models.Index(
+                fields=['blog', '-created_at', '-id'],
+                condition=models.Q(parent__isnull=True),
+                name='blog_comment_top_idx'
+            ),
+            models.Index(
+                fields=['blog', 'path'],
+                name='blog_comment_path_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.comment
+
+    @property
+    def depth(self):
+        """
+        The reply level of the comment, 0 for a top-level comment.
+        """
+        return len(self.path) // PATH_STEP - 1
+
+    def save(self, *args, **kwargs):
+        """
+        Save the comment, assigning its materialized path once it has been
+        created and its id is known.
+
+        A new comment is inserted and given its path in one transaction,
+        so it is never visible without the path that threads are read by.
+        """
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            self.path = thread_path(self.parent, self.pk)
+            type(self).objects.filter(pk=self.pk).update(path=self.path)
+
+
+def increment_blog_comments_count(
+    sender, instance, created, raw=False, **kwargs
+):
+    """
+    Signal to increment the comment count stored on the blog, and add the
+    comment's weight to its score, when a new comment is created.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The comment that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw:
+        adjust_counters(
+            Blog, instance.blog_id, blog_comments_count=1, score=COMMENT_WEIGHT
+        )
+
+
+def decrement_blog_comments_count(sender, instance, **kwargs):
+    """
+    Signal to decrement the comment count stored on the blog, and remove
+    the comment's decayed weight from its score, when a comment is
+    deleted.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The comment that was deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    adjust_counters(
+        Blog, instance.blog_id, blog_comments_count=-1,
+        score=-decayed_weight(COMMENT_WEIGHT, instance.created_at)
+    )
+
+
+def record_blog_comment_activity(
+    sender, instance, created, raw=False, **kwargs
+):
+    """
+    Signal to count a new comment in the current hourly activity bucket of
+    the blog, used to rank trending blogs.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The comment that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw:
+        record_activity(
+            BlogActivity, 'blog', instance.blog_id, comments_count=1
+        )
+
+
+def increment_reply_count(
+    sender, instance, created, raw=False, **kwargs
+):
+    """
+    Signal to increment the reply count stored on the parent comment when
+    a new reply is created.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The comment that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw and instance.parent_id:
+        adjust_counters(BlogComment, instance.parent_id, reply_count=1)
+
+
+def decrement_reply_count(sender, instance, **kwargs):
+    """
+    Signal to decrement the reply count stored on the parent comment when
+    a reply is deleted.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The comment that was deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    if instance.parent_id:
+        adjust_counters(BlogComment, instance.parent_id, reply_count=-1)
+
+
+post_save.connect(increment_blog_comments_count, sender=BlogComment)
+post_delete.connect(decrement_blog_comments_count, sender=BlogComment)
+post_save.connect(record_blog_comment_activity, sender=BlogComment)
+post_save.connect(increment_reply_count, sender=BlogComment)
+post_delete.connect(decrement_reply_count, sender=BlogComment)
@@ -1,5 +1,6 @@
-from django.contrib.humanize.templatetags.humanize import naturaltime
 from rest_framework import serializers
+from ft_api.serializers import NaturalTimeField
+from ft_api.threads import MAX_THREAD_DEPTH
 from .models import BlogComment
 
 
@@ -17,8 +18,10 @@ class BlogCommentSerializer(serializers.ModelSerializer):
     profile_image = serializers.ReadOnlyField(
         source='owner.profile.profile_image.url'
     )
-    created_at = serializers.SerializerMethodField()
-    updated_at = serializers.SerializerMethodField()
+    created_at = NaturalTimeField()
+    updated_at = NaturalTimeField()
+    depth = serializers.ReadOnlyField()
+    reply_count = serializers.ReadOnlyField()
 
     def get_is_owner(self, obj):
         """
@@ -33,41 +36,74 @@ class BlogCommentSerializer(serializers.ModelSerializer):
         request = self.context['request']
         return request.user == obj.owner
 
-    def get_created_at(self, obj):
+    class Meta:
+        model = BlogComment
+        fields = [
+            'id', 'owner', 'is_owner', 'profile_id',
+            'profile_image', 'blog', 'parent', 'depth', 'reply_count',
+            'comment', 'created_at', 'updated_at'
+        ]
+
+    def validate(self, data):
         """
-        Get the natural time format of the comment's creation time.
+        Check that a reply is made on the same blog post as its parent
+        comment and within the maximum thread depth.
 
         Args:
-            obj (BlogComment): The comment object being serialized.
+            data (dict): The validated data of the comment.
+
+        Raises:
+            serializers.ValidationError: If the parent comment belongs to
+            another blog post or is already at the maximum depth.
 
         Returns:
-            str: The natural time format of the comment's creation time.
+            dict: The validated data.
         """
-        return naturaltime(obj.created_at)
+        parent = data.get('parent')
+        if parent is not None:
+            if parent.blog_id != data['blog'].id:
+                raise serializers.ValidationError({
+                    'parent': 'The parent comment belongs to another '
+                              'blog post.'
+                })
+            if parent.depth + 1 >= MAX_THREAD_DEPTH:
+                raise serializers.ValidationError({
+                    'parent': 'This thread is too deep to reply to.'
+                })
+        return data
+
+
+class BlogCommentDetailSerializer(BlogCommentSerializer):
+    """
+    Detailed serializer for the BlogComment model with read-only blog field.
+    """
+    blog = serializers.ReadOnlyField(source='blog.id')
+    parent = serializers.ReadOnlyField(source='parent_id')
+
 
-    def get_updated_at(self, obj):
+class BlogCommentThreadSerializer(BlogCommentSerializer):
+    """
+    Serializer for a top-level blog comment with its first replies inlined.
+
+    The replies are read from the `first_replies` prefetched by the view;
+    the rest of the thread is served by the comment thread endpoint.
+    """
+    replies = serializers.SerializerMethodField()
+
+    def get_replies(self, obj):
         """
-        Get the natural time format of the comment's last update time.
+        Serialize the first direct replies of the comment.
 
         Args:
             obj (BlogComment): The comment object being serialized.
 
         Returns:
-            str: The natural time format of the comment's last update time.
+            list: The serialized replies, oldest first.
         """
-        return naturaltime(obj.updated_at)
-
-    class Meta:
-        model = BlogComment
-        fields = [
-            'id', 'owner', 'is_owner', 'profile_id',
-            'profile_image', 'blog', 'comment',
-            'created_at', 'updated_at'
-        ]
+        return BlogCommentSerializer(
+            getattr(obj, 'first_replies', []), many=True,
+            context=self.context
+        ).data
 
-
-class BlogCommentDetailSerializer(BlogCommentSerializer):
-    """
-    Detailed serializer for the BlogComment model with read-only blog field.
-    """
-    blog = serializers.ReadOnlyField(source='blog.id')
+    class Meta(BlogCommentSerializer.Meta):
+        fields = BlogCommentSerializer.Meta.fields + ['replies']
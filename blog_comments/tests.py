@@ -1,3 +1,129 @@
-from django.test import TestCase
+from unittest import mock
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.dateparse import parse_datetime
+from rest_framework.test import APITestCase
+from blogs.models import Blog
+from .models import BlogComment
 
-# Create your tests here.
+
+class BlogCommentListQueryCountTests(APITestCase):
+    """
+    Tests that reading a page of comments costs the same number of
+    queries however long the thread is and however many authors take
+    part in it.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='reader', password='pass'
+        )
+        self.client.force_authenticate(self.user)
+
+    def create_thread(self, count):
+        blog = Blog.objects.create(
+            owner=self.user, title=f'Thread of {count}', content='Content'
+        )
+        for index in range(count):
+            author = User.objects.create(username=f'author{count}-{index}')
+            comment = BlogComment.objects.create(
+                owner=author, blog=blog, comment=f'Comment {index}'
+            )
+            BlogComment.objects.create(
+                owner=self.user, blog=blog, parent=comment, comment='Reply'
+            )
+        return blog
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 10)
+        return len(context.captured_queries)
+
+    def test_query_count_is_flat_across_thread_lengths(self):
+        short = self.create_thread(10)
+        long = self.create_thread(100)
+        for url in (
+            '/blog-comments/?blog={}&cursor=',
+            '/blog-comments/?blog={}&timestamps=iso&cursor=',
+            '/blogs/{}/comments/',
+        ):
+            self.assertEqual(
+                self.count_queries(url.format(short.pk)),
+                self.count_queries(url.format(long.pk))
+            )
+
+    def test_iso_timestamps(self):
+        blog = self.create_thread(1)
+        response = self.client.get(
+            f'/blogs/{blog.pk}/comments/?timestamps=iso'
+        )
+        comment = response.data['results'][0]
+        self.assertIsNotNone(parse_datetime(comment['created_at']))
+        self.assertIsNotNone(
+            parse_datetime(comment['replies'][0]['updated_at'])
+        )
+        response = self.client.get(f'/blogs/{blog.pk}/comments/')
+        self.assertEqual(response.data['results'][0]['created_at'], 'now')
+
+
+class BlogCommentPathTests(APITestCase):
+    """
+    Tests that a comment is inserted together with its materialized path.
+    """
+
+    def test_failed_path_write_rolls_back_the_comment(self):
+        user = User.objects.create(username='author')
+        blog = Blog.objects.create(owner=user, title='Blog', content='Text')
+        with mock.patch(
+            'blog_comments.models.thread_path', side_effect=ValueError
+        ):
+            with self.assertRaises(ValueError):
+                BlogComment.objects.create(
+                    owner=user, blog=blog, comment='Lost'
+                )
+        self.assertFalse(BlogComment.objects.exists())
+        blog.refresh_from_db()
+        self.assertEqual(blog.blog_comments_count, 0)
+
+    def test_new_comment_has_its_path(self):
+        user = User.objects.create(username='author')
+        blog = Blog.objects.create(owner=user, title='Blog', content='Text')
+        comment = BlogComment.objects.create(
+            owner=user, blog=blog, comment='Kept'
+        )
+        self.assertEqual(
+            BlogComment.objects.get().path, f'{comment.pk:010d}'
+        )
+
+
+class BlogCommentThreadAccessTests(APITestCase):
+    """
+    Tests that the comment thread endpoints require a logged-in user and
+    that listing the comments of a missing blog is a 404.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.blog = Blog.objects.create(
+            owner=self.user, title='Blog', content='Content'
+        )
+        self.comment = BlogComment.objects.create(
+            owner=self.user, blog=self.blog, comment='Comment'
+        )
+
+    def test_anonymous_access(self):
+        for url in [
+            f'/blogs/{self.blog.pk}/comments/',
+            f'/blog-comments/{self.comment.pk}/thread/',
+        ]:
+            self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_missing_blog(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(f'/blogs/{self.blog.pk}/comments/')
+        self.assertEqual(len(response.data['results']), 1)
+        response = self.client.get('/blogs/0/comments/')
+        self.assertEqual(response.status_code, 404)
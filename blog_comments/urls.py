@@ -3,5 +3,7 @@ from blog_comments import views
 
 urlpatterns = [
     path('blog-comments/', views.BlogCommentList.as_view()),
-    path('blog-comments/<int:pk>/', views.BlogCommentDetail.as_view())
+    path('blog-comments/<int:pk>/', views.BlogCommentDetail.as_view()),
+    path('blog-comments/<int:pk>/thread/', views.BlogCommentThread.as_view()),
+    path('blogs/<int:pk>/comments/', views.BlogCommentThreadList.as_view()),
 ]
@@ -1,8 +1,18 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions
 from django_filters.rest_framework import DjangoFilterBackend
+from ft_api.pagination import KeysetPagination
 from ft_api.permissions import IsOwnerOrReadOnly
+from ft_api.querysets import embed_authors
+from ft_api.threads import first_replies, subtree
+from blogs.models import Blog
 from .models import BlogComment
-from .serializers import BlogCommentSerializer, BlogCommentDetailSerializer
+from .serializers import (
+    BlogCommentSerializer,
+    BlogCommentDetailSerializer,
+    BlogCommentThreadSerializer
+)
 
 
 class BlogCommentList(generics.ListCreateAPIView):
@@ -14,15 +24,17 @@ class BlogCommentList(generics.ListCreateAPIView):
     """
     serializer_class = BlogCommentSerializer
     permission_classes = [permissions.IsAuthenticated]
-    queryset = BlogComment.objects.all()
+    queryset = embed_authors(BlogComment.objects.all())
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['blog']
+    filterset_fields = ['blog', 'parent']
 
     def perform_create(self, serializer):
         """
-        Associates the current user with the comment being created.
+        Associates the current user with the comment being created, in the
+        same transaction as the blog's stored comment count update.
         """
-        serializer.save(owner=self.request.user)
+        with transaction.atomic():
+            serializer.save(owner=self.request.user)
 
 
 class BlogCommentDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -35,4 +47,59 @@ class BlogCommentDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     permission_classes = [IsOwnerOrReadOnly]
     serializer_class = BlogCommentDetailSerializer
-    queryset = BlogComment.objects.all()
+    queryset = embed_authors(BlogComment.objects.all())
+
+
+class BlogCommentThreadList(generics.ListAPIView):
+    """
+    API view to list the top-level comments of a blog, newest first.
+
+    Each comment carries its stored reply count and its first replies,
+    loaded for the whole page by a single windowed query; the rest of a
+    thread is loaded from the comment thread endpoint.
+    """
+    serializer_class = BlogCommentThreadSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+
+    def get_queryset(self):
+        """
+        Return the top-level comments of the blog with their first replies.
+        A missing blog, or one of an account queued for deletion, is a 404.
+        """
+        blog = get_object_or_404(
+            Blog.objects.filter(owner__is_active=True).only('pk'),
+            pk=self.kwargs['pk']
+        )
+        return embed_authors(BlogComment.objects.filter(
+            blog=blog, parent__isnull=True
+        )).prefetch_related(
+            first_replies(embed_authors(BlogComment.objects.all()))
+        )
+
+
+class BlogCommentThread(generics.ListAPIView):
+    """
+    API view to list a comment and all of its replies, at every depth.
+
+    Comments are ordered by materialized path, so each reply follows its
+    parent, and the whole subtree is read as one range of the
+    (blog, path) index.
+    """
+    serializer_class = BlogCommentSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('path',)
+
+    def get_queryset(self):
+        """
+        Return the comment and its replies, depth first.
+        """
+        comment = get_object_or_404(
+            BlogComment.objects.only('blog', 'path'),
+            pk=self.kwargs['pk']
+        )
+        return embed_authors(BlogComment.objects.filter(
+            subtree(comment.path), blog=comment.blog_id
+        ))
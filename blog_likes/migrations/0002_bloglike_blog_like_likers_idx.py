@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_likes', '0001_initial'),
+        ('blogs', '0008_blogactivity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bloglike',
+            index=models.Index(fields=['blog', '-created_at', '-id', 'owner'], name='blog_like_likers_idx'),
+        ),
+    ]
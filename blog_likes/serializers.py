@@ -1,4 +1,4 @@
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from blog_likes.models import BlogLike
 
@@ -41,8 +41,30 @@ class BlogLikeSerializer(serializers.ModelSerializer):
             is detected.
         """
         try:
-            return super().create(validated_data)
+            with transaction.atomic():
+                return super().create(validated_data)
         except IntegrityError:
             raise serializers.ValidationError({
                 'detail': 'Possible duplicate'
             })
+
+
+class BlogLikerSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer for the users who liked a blog post.
+
+    Attributes:
+        owner (ReadOnlyField): The username of the user who liked the
+            blog post.
+        profile_id (ReadOnlyField): The ID of the user's profile.
+        profile_image (ReadOnlyField): The URL of the user's profile image.
+    """
+    owner = serializers.ReadOnlyField(source='owner.username')
+    profile_id = serializers.ReadOnlyField(source='owner.profile.id')
+    profile_image = serializers.ReadOnlyField(
+        source='owner.profile.profile_image.url'
+    )
+
+    class Meta:
+        model = BlogLike
+        fields = ['id', 'owner', 'profile_id', 'profile_image', 'created_at']
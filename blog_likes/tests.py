@@ -1,3 +1,94 @@
-from django.test import TestCase
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from blogs.models import Blog
+from ft_api.scores import LIKE_WEIGHT, decay_scores
+from .models import BlogLike
 
-# Create your tests here.
+OLD_LIKE_HOURS = 3 * 24
+
+
+class BlogLikeScoreTests(APITestCase):
+    """
+    Tests that removing a like subtracts its decayed weight from the
+    blog's score, leaving the weight of newer likes in place.
+    """
+
+    def setUp(self):
+        self.author = User.objects.create(username='author')
+        self.blog = Blog.objects.create(
+            owner=self.author, title='Blog', content='Content'
+        )
+        self.old_liker = User.objects.create(username='old')
+        BlogLike.objects.create(owner=self.old_liker, blog=self.blog)
+        BlogLike.objects.filter(owner=self.old_liker).update(
+            created_at=timezone.now() - timedelta(hours=OLD_LIKE_HOURS)
+        )
+        decay_scores(Blog, OLD_LIKE_HOURS)
+        for index in range(5):
+            BlogLike.objects.create(
+                owner=User.objects.create(username=f'new{index}'),
+                blog=self.blog
+            )
+
+    def assertScore(self, expected):
+        self.blog.refresh_from_db()
+        self.assertAlmostEqual(self.blog.score, expected, places=3)
+
+    def test_deleting_an_old_like_keeps_newer_weight(self):
+        self.assertScore(5 * LIKE_WEIGHT + LIKE_WEIGHT * 0.5 ** 3)
+        BlogLike.objects.get(owner=self.old_liker).delete()
+        self.assertScore(5 * LIKE_WEIGHT)
+
+    def test_unliking_an_old_like_keeps_newer_weight(self):
+        self.client.force_authenticate(self.old_liker)
+        response = self.client.delete(f'/blogs/{self.blog.pk}/like/')
+        self.assertEqual(response.data['blog_likes_count'], 5)
+        self.assertScore(5 * LIKE_WEIGHT)
+
+
+class BlogLikeToggleTests(APITestCase):
+    """
+    Tests that repeated PUT and DELETE requests on a blog's like keep the
+    stored like count and score in step with the likes.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(self.user)
+        self.blog = Blog.objects.create(
+            owner=User.objects.create(username='author'), title='Blog',
+            content='Content'
+        )
+        self.url = f'/blogs/{self.blog.pk}/like/'
+
+    def assertLikes(self, response, count):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['blog_likes_count'], count)
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.blog_likes_count, count)
+        self.assertEqual(BlogLike.objects.count(), count)
+        self.assertAlmostEqual(
+            self.blog.score, count * LIKE_WEIGHT, places=3
+        )
+
+    def test_put_is_idempotent(self):
+        first = self.client.put(self.url)
+        self.assertLikes(first, 1)
+        second = self.client.put(self.url)
+        self.assertLikes(second, 1)
+        self.assertEqual(
+            first.data['blog_like_id'], second.data['blog_like_id']
+        )
+
+    def test_delete_is_idempotent(self):
+        self.client.put(self.url)
+        self.assertLikes(self.client.delete(self.url), 0)
+        response = self.client.delete(self.url)
+        self.assertLikes(response, 0)
+        self.assertIsNone(response.data['blog_like_id'])
+
+    def test_missing_blog(self):
+        self.assertEqual(self.client.put('/blogs/0/like/').status_code, 404)
+        self.assertFalse(BlogLike.objects.exists())
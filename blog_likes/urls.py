@@ -4,4 +4,6 @@ from blog_likes import views
 urlpatterns = [
     path('blog-likes/', views.BlogLikeList.as_view()),
     path('blog-likes/<int:pk>/', views.BlogLikeDetail.as_view()),
-]
\ No newline at end of file
+    path('blogs/<int:pk>/like/', views.BlogLikeToggle.as_view()),
+    path('blogs/<int:pk>/likers/', views.BlogLikerList.as_view()),
+]
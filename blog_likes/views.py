@@ -1,7 +1,14 @@
 from rest_framework import generics, permissions
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from django.shortcuts import get_object_or_404
+from ft_api.likes import add_like, remove_like
+from ft_api.pagination import KeysetPagination
 from ft_api.permissions import IsOwnerOrReadOnly
+from ft_api.querysets import embed_authors, viewer_relation_id
+from blogs.models import Blog
 from blog_likes.models import BlogLike
-from blog_likes.serializers import BlogLikeSerializer
+from blog_likes.serializers import BlogLikerSerializer, BlogLikeSerializer
 
 
 class BlogLikeList(generics.ListCreateAPIView):
@@ -13,7 +20,7 @@ class BlogLikeList(generics.ListCreateAPIView):
     """
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = BlogLikeSerializer
-    queryset = BlogLike.objects.all()
+    queryset = embed_authors(BlogLike.objects.all(), with_profile=False)
 
     def perform_create(self, serializer):
         """
@@ -35,4 +42,61 @@ class BlogLikeDetail(generics.RetrieveDestroyAPIView):
     """
     permission_classes = [IsOwnerOrReadOnly]
     serializer_class = BlogLikeSerializer
-    queryset = BlogLike.objects.all()
+    queryset = embed_authors(BlogLike.objects.all(), with_profile=False)
+
+
+class BlogLikeToggle(generics.GenericAPIView):
+    """
+    API view to like or unlike a blog post by its ID.
+
+    - PUT: Likes the blog post, doing nothing if it is already liked.
+    - DELETE: Removes the like, doing nothing if there is none.
+
+    Both are idempotent, run a single write statement and respond with
+    the current user's like ID and the blog post's new like count.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def put(self, request, pk):
+        add_like(BlogLike, 'blog', request.user, pk)
+        return self.like_response(pk)
+
+    def delete(self, request, pk):
+        remove_like(BlogLike, 'blog', request.user, pk)
+        return self.like_response(pk)
+
+    def like_response(self, pk):
+        """
+        Returns the current user's like ID and the like count of the
+        blog post.
+
+        Raises:
+            NotFound: If the blog post does not exist.
+        """
+        state = Blog.objects.filter(pk=pk).annotate(
+            blog_like_id=viewer_relation_id(
+                self.request.user, BlogLike, blog='pk'
+            )
+        ).values('blog_like_id', 'blog_likes_count').first()
+        if state is None:
+            raise NotFound()
+        return Response(state)
+
+
+class BlogLikerList(generics.ListAPIView):
+    """
+    API view to list the users who liked a blog post.
+
+    - GET: Returns the likes of the blog post, newest first, with each
+      liker's username, profile ID and profile image.
+
+    Pages are read by keyset pagination over the (blog, created_at, id,
+    owner) index, joining the likers and their profiles in one query.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = BlogLikerSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        blog = get_object_or_404(Blog, pk=self.kwargs['pk'])
+        return embed_authors(BlogLike.objects.filter(blog=blog))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from blogs.models import Blog
+from ft_api.scores import HALF_LIFE_HOURS, decay_scores
+
+
+class Command(BaseCommand):
+    """
+    Decay the stored engagement scores of blog posts. Meant to run on a
+    schedule, passing the number of hours between runs.
+    """
+    help = 'Decay the stored engagement scores of blog posts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours', type=float, default=1,
+            help='Number of hours since the previous run.'
+        )
+        parser.add_argument(
+            '--half-life', type=float, default=HALF_LIFE_HOURS,
+            help='Number of hours after which a score is halved.'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of blog posts updated per statement.'
+        )
+
+    def handle(self, *args, **options):
+        updated = decay_scores(
+            Blog, options['hours'], half_life=options['half_life'],
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f'Decayed scores of {updated} blog posts.')
+        )
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from blogs.models import BlogActivity
+from ft_api.trending import prune_buckets, refresh_trending
+
+
+class Command(BaseCommand):
+    """
+    Delete the hourly activity buckets of blog posts that are older than
+    the longest trending window, and cache the trending rankings of the
+    current bucket. Meant to run at the start of every hour, when the
+    bucket rolls.
+    """
+    help = (
+        'Delete hourly blog activity buckets outside trending windows and '
+        'cache the current trending blogs.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of buckets deleted per statement.'
+        )
+
+    def handle(self, *args, **options):
+        deleted = prune_buckets(
+            BlogActivity, batch_size=options['batch_size']
+        )
+        refreshed = refresh_trending(BlogActivity, 'blog')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Deleted {deleted} blog activity buckets and cached '
+                f'{refreshed} trending rankings.'
+            )
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from blogs.models import Blog
+from blog_likes.models import BlogLike
+from blog_comments.models import BlogComment
+from ft_api.counters import repair_counters
+
+
+class Command(BaseCommand):
+    """
+    Recompute the stored like and comment counts of every blog post from
+    the like and comment tables.
+    """
+    help = 'Recompute the stored like and comment counts of blog posts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of blog posts updated per statement.'
+        )
+
+    def handle(self, *args, **options):
+        updated = repair_counters(Blog, {
+            'blog_likes_count': (BlogLike, 'blog'),
+            'blog_comments_count': (BlogComment, 'blog'),
+        }, batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Repaired counters of {updated} blog posts.')
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0002_blog_blog_created_idx_blog_blog_owner_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='blog_comments_count',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='blog_likes_count',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+    ]
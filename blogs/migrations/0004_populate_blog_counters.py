@@ -0,0 +1,29 @@
+from django.db import migrations
+from ft_api.counters import repair_counters
+
+
+def populate_blog_counters(apps, schema_editor):
+    """
+    Fill the stored like and comment counts of existing blog posts.
+    """
+    repair_counters(apps.get_model('blogs', 'Blog'), {
+        'blog_likes_count': (apps.get_model('blog_likes', 'BlogLike'), 'blog'),
+        'blog_comments_count': (
+            apps.get_model('blog_comments', 'BlogComment'), 'blog'
+        ),
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_comments', '0002_blogcomment_blog_comment_created_idx'),
+        ('blog_likes', '0001_initial'),
+        ('blogs', '0003_blog_blog_comments_count_blog_blog_likes_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_blog_counters, migrations.RunPython.noop
+        ),
+    ]
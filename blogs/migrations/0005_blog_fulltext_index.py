@@ -0,0 +1,13 @@
+from django.db import migrations
+from ft_api.search import CreateFullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0004_populate_blog_counters'),
+    ]
+
+    operations = [
+        CreateFullTextIndex(model_name='blog'),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations
+from ft_api.scores import rebuild_scores
+
+
+def populate_blog_scores(apps, schema_editor):
+    """
+    Estimate the engagement scores of existing blog posts from their
+    stored counters.
+    """
+    rebuild_scores(
+        apps.get_model('blogs', 'Blog'),
+        'blog_likes_count',
+        'blog_comments_count',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0006_blog_score_blog_blog_score_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_blog_scores, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0007_populate_blog_scores'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('likes_count', models.IntegerField(default=0)),
+                ('comments_count', models.IntegerField(default=0)),
+                ('blog', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity', to='blogs.blog')),
+            ],
+            options={
+                'verbose_name': 'Blog Activity',
+                'verbose_name_plural': 'Blog Activity',
+                'indexes': [models.Index(fields=['hour', 'blog'], name='blog_activity_hour_idx')],
+                'unique_together': {('blog', 'hour')},
+            },
+        ),
+    ]
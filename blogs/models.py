@@ -1,5 +1,8 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
 from django.contrib.auth.models import User
+from ft_api.counters import edit_fields
+from ft_api.search import index_search_document, remove_search_document
 
 
 class Blog(models.Model):
@@ -16,6 +19,12 @@ class Blog(models.Model):
         banner (ImageField): Optional banner image, with a default.
         image (ImageField): Optional content image, with a default
             set so we can always reference an image url.
+        blog_likes_count (IntegerField): Stored number of likes, kept in
+            sync when likes are created or deleted.
+        blog_comments_count (IntegerField): Stored number of comments, kept
+            in sync when comments are created or deleted.
+        score (FloatField): Stored engagement score, raised by likes and
+            comments and decayed over time by `decay_blog_scores`.
 
     Meta:
         ordering: Blog posts are ordered by creation date, newest first.
@@ -35,9 +44,87 @@ class Blog(models.Model):
         upload_to='blog_images/', default='../default_post_eznpr6',
         blank=True
     )
+    blog_likes_count = models.IntegerField(default=0, db_index=True)
+    blog_comments_count = models.IntegerField(default=0, db_index=True)
+    score = models.FloatField(default=0)
+
+    stored_counters = ('blog_likes_count', 'blog_comments_count', 'score')
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='blog_created_idx'
+            ),
+            models.Index(
+                fields=['owner', '-created_at', '-id'],
+                name='blog_owner_created_idx'
+            ),
+            models.Index(
+                fields=['-score', '-id'],
+                name='blog_score_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.id} {self.title}'
+
+    def save(self, *args, **kwargs):
+        """
+        Save the blog post. Edits of an existing blog post leave out the
+        stored counters and score, which are only changed by
+        single-statement updates.
+        """
+        if (
+            not self._state.adding and not kwargs.get('force_insert')
+            and kwargs.get('update_fields') is None
+        ):
+            kwargs['update_fields'] = edit_fields(
+                self, self.stored_counters
+            )
+        super().save(*args, **kwargs)
+
+
+class BlogActivity(models.Model):
+    """
+    Counts the likes and comments received by a blog post in one hour.
+
+    Buckets are written when likes and comments are created and summed
+    over the trailing window by the trending endpoint, so trending never
+    scans the like and comment tables. Buckets older than the longest
+    window are deleted by `prune_blog_activity`.
+
+    Attributes:
+        blog (ForeignKey): The blog post that received the activity.
+        hour (DateTimeField): The start of the hour the bucket covers.
+        likes_count (IntegerField): The number of likes in the hour.
+        comments_count (IntegerField): The number of comments in the hour.
+
+    Meta:
+        unique_together: A blog post has one bucket per hour.
+    """
+    blog = models.ForeignKey(
+        Blog, related_name='activity', on_delete=models.CASCADE
+    )
+    hour = models.DateTimeField()
+    likes_count = models.IntegerField(default=0)
+    comments_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('blog', 'hour')
+        indexes = [
+            models.Index(
+                fields=['hour', 'blog'],
+                name='blog_activity_hour_idx'
+            ),
+        ]
+        verbose_name = 'Blog Activity'
+        verbose_name_plural = 'Blog Activity'
+
+    def __str__(self):
+        return f'{self.blog_id} at {self.hour}'
+
+
+post_save.connect(index_search_document, sender=Blog)
+post_delete.connect(remove_search_document, sender=Blog)
@@ -136,6 +136,10 @@ class BlogSerializer(serializers.ModelSerializer):
         Get the ID of the 'BlogLike' instance if the current user has liked the
         given blog.
 
+        The views annotate the ID for the whole page in one query, the
+        lookup below is only used for blogs that were not annotated, such
+        as a newly created one.
+
         Args:
             obj (Blog): The blog object being serialized.
 
@@ -143,6 +147,8 @@ class BlogSerializer(serializers.ModelSerializer):
             int or None: The ID of the 'BlogLike' instance if the current user
             has liked the blog, None otherwise.
         """
+        if hasattr(obj, 'blog_like_id'):
+            return obj.blog_like_id
         user = self.context['request'].user
         if user.is_authenticated:
             like = BlogLike.objects.filter(owner=user, blog=obj).first()
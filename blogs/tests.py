@@ -1,3 +1,146 @@
-from django.test import TestCase
+from unittest import mock
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from blog_likes.models import BlogLike
+from ft_api.scores import LIKE_WEIGHT
+from .models import Blog
+from .serializers import BlogSerializer
 
-# Create your tests here.
+
+class BlogListQueryCountTests(APITestCase):
+    """
+    Tests that listing blogs costs the same number of queries however
+    many authors appear on the page.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='reader', password='pass'
+        )
+        self.client.force_authenticate(self.user)
+
+    def create_blogs(self, count):
+        for index in range(count):
+            author = User.objects.create_user(
+                username=f'author{index}', password='pass'
+            )
+            Blog.objects.create(
+                owner=author, title=f'Blog {index}', content='Content'
+            )
+
+    def count_list_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/blogs/')
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_query_count_is_flat_across_page_sizes(self):
+        self.create_blogs(2)
+        small_page = self.count_list_queries()
+        Blog.objects.all().delete()
+        User.objects.exclude(pk=self.user.pk).delete()
+        self.create_blogs(10)
+        full_page = self.count_list_queries()
+        self.assertEqual(small_page, full_page)
+
+
+class BlogSearchTests(APITestCase):
+    """
+    Tests that `?search=` matches blog content through the full-text
+    index and authors by username prefix.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(self.user)
+        author = User.objects.create(username='bob')
+        Blog.objects.create(
+            owner=author, title='Morning run', content='Easy pace'
+        )
+        Blog.objects.create(
+            owner=self.user, title='Leg day', content='Heavy squats'
+        )
+
+    def search(self, term):
+        response = self.client.get('/blogs/', {'search': term})
+        self.assertEqual(response.status_code, 200)
+        return [blog['title'] for blog in response.data['results']]
+
+    def test_matches_content(self):
+        self.assertEqual(self.search('squats'), ['Leg day'])
+
+    def test_matches_username_prefix(self):
+        self.assertEqual(self.search('bob'), ['Morning run'])
+        self.assertEqual(self.search('Bo'), ['Morning run'])
+
+
+class BlogKeysetPaginationTests(APITestCase):
+    """
+    Tests that `?cursor=` pages through blogs sharing a creation date
+    without skipping or repeating any, in both directions.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(self.user)
+        for index in range(25):
+            Blog.objects.create(
+                owner=self.user, title=f'Blog {index}', content='Content'
+            )
+        Blog.objects.update(created_at=timezone.now())
+
+    def walk(self, url, link):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([blog['id'] for blog in response.data['results']])
+            url = response.data[link]
+        return pages
+
+    def test_round_trip_over_tied_timestamps(self):
+        forward = self.walk('/blogs/?cursor=', 'next')
+        ids = [pk for page in forward for pk in page]
+        expected = Blog.objects.order_by('-id').values_list('id', flat=True)
+        self.assertEqual(ids, list(expected))
+        self.assertEqual([len(page) for page in forward], [10, 10, 5])
+        last = self.client.get('/blogs/?cursor=')
+        for _ in range(2):
+            last = self.client.get(last.data['next'])
+        backward = self.walk(last.data['previous'], 'previous')
+        self.assertEqual(backward, forward[-2::-1])
+
+
+class BlogUpdateCounterTests(APITestCase):
+    """
+    Tests that editing a blog post keeps the like count and score
+    written while the edit was in progress.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='author')
+        self.client.force_authenticate(self.user)
+        self.blog = Blog.objects.create(
+            owner=self.user, title='Blog', content='Content'
+        )
+        self.liker = User.objects.create(username='liker')
+
+    def test_like_during_edit(self):
+        update = BlogSerializer.update
+
+        def update_after_like(serializer, instance, validated_data):
+            BlogLike.objects.create(owner=self.liker, blog=instance)
+            return update(serializer, instance, validated_data)
+
+        with mock.patch.object(BlogSerializer, 'update', update_after_like):
+            response = self.client.put(f'/blogs/{self.blog.pk}/', {
+                'title': 'Edited', 'content': 'Content',
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.title, 'Edited')
+        self.assertEqual(self.blog.blog_likes_count, 1)
+        self.assertAlmostEqual(self.blog.score, LIKE_WEIGHT, places=3)
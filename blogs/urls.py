@@ -3,5 +3,6 @@ from blogs import views
 
 urlpatterns = [
     path('blogs/', views.BlogList.as_view()),
+    path('blogs/trending/', views.BlogTrending.as_view()),
     path('blogs/<int:pk>/', views.BlogDetail.as_view())
 ]
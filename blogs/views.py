@@ -1,9 +1,12 @@
-from django.db.models import Count
 from rest_framework import generics, permissions, filters
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Blog
+from .models import Blog, BlogActivity
 from .serializers import BlogSerializer
+from blog_likes.models import BlogLike
 from ft_api.permissions import IsOwnerOrReadOnly
+from ft_api.search import FullTextSearchFilter
+from ft_api.querysets import embed_authors, viewer_relation_id
+from ft_api.trending import trending_ids, trending_window
 
 
 class BlogList(generics.ListCreateAPIView):
@@ -13,13 +16,10 @@ class BlogList(generics.ListCreateAPIView):
     - GET: Returns a list of all blogs.
     - POST: Creates a new blog.
     """
-    queryset = Blog.objects.annotate(
-        blog_likes_count=Count('blog_likes', distinct=True),
-        blog_comments_count=Count('blogcomment', distinct=True)
-    ).order_by('-created_at')
+    queryset = Blog.objects.order_by('-created_at')
     filter_backends = [
         filters.OrderingFilter,
-        filters.SearchFilter,
+        FullTextSearchFilter,
         DjangoFilterBackend,
     ]
 
@@ -36,10 +36,25 @@ class BlogList(generics.ListCreateAPIView):
         'blog_likes_count',
         'blog_comments_count',
         'likes__created_at',
+        'score',
     ]
     serializer_class = BlogSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        """
+        Annotates the blogs with the current user's like ID and embeds
+        the author and profile in the same query. Blogs of accounts
+        queued for deletion are hidden.
+        """
+        return embed_authors(
+            super().get_queryset().filter(owner__is_active=True)
+        ).annotate(
+            blog_like_id=viewer_relation_id(
+                self.request.user, BlogLike, blog='pk'
+            )
+        )
+
     def perform_create(self, serializer):
         """
         Associates the current user with the blog being created.
@@ -55,13 +70,24 @@ class BlogDetail(generics.RetrieveUpdateDestroyAPIView):
     - PUT: Update the details of a specific blog.
     - DELETE: Delete a specific blog.
     """
-    queryset = Blog.objects.annotate(
-        blog_likes_count=Count('blog_likes', distinct=True),
-        blog_comments_count=Count('blogcomment', distinct=True)
-    )
+    queryset = Blog.objects.all()
     serializer_class = BlogSerializer
     permission_classes = [IsOwnerOrReadOnly]
 
+    def get_queryset(self):
+        """
+        Annotates the blog with the current user's like ID and embeds
+        the author and profile in the same query. Blogs of accounts
+        queued for deletion are hidden.
+        """
+        return embed_authors(
+            super().get_queryset().filter(owner__is_active=True)
+        ).annotate(
+            blog_like_id=viewer_relation_id(
+                self.request.user, BlogLike, blog='pk'
+            )
+        )
+
     def get_object(self):
         """
         Retrieves the specific blog object, checking for permissions.
@@ -69,3 +95,33 @@ class BlogDetail(generics.RetrieveUpdateDestroyAPIView):
         blog = super().get_object()
         self.check_object_permissions(self.request, blog)
         return blog
+
+
+class BlogTrending(generics.ListAPIView):
+    """
+    API view to retrieve the blog posts with the most likes and comments
+    over the last 24 hours or 7 days.
+
+    - GET: Returns the top blog posts, best first, for `?window=24h` (the
+      default) or `?window=7d`.
+
+    The ranking is read from the cached leaderboard of the hourly
+    activity buckets, so only the top blog posts themselves are queried.
+    """
+    serializer_class = BlogSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+
+    def get_queryset(self):
+        ids = trending_ids(
+            BlogActivity, 'blog', trending_window(self.request)
+        )
+        ranks = {pk: rank for rank, pk in enumerate(ids)}
+        blogs = embed_authors(Blog.objects.filter(
+            pk__in=ids, owner__is_active=True
+        )).annotate(
+            blog_like_id=viewer_relation_id(
+                self.request.user, BlogLike, blog='pk'
+            )
+        )
+        return sorted(blogs, key=lambda blog: ranks[blog.pk])
@@ -0,0 +1,45 @@
+import time
+from django.core.management.base import BaseCommand
+from ft_api.counters import flush_counters
+
+
+class Command(BaseCommand):
+    """
+    Apply the counter deltas buffered while `COUNTER_BUFFER` is enabled.
+
+    Without `--loop` the buffer is drained once. With `--loop` the
+    command keeps draining it, sleeping `--interval` seconds whenever it
+    is empty, which bounds how stale the stored counters can be.
+    """
+    help = 'Apply buffered counter deltas to the stored counters.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of deltas applied per transaction.'
+        )
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep flushing until the process is stopped.'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=1.0,
+            help='Seconds to wait between flushes in loop mode.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            applied = 0
+            while True:
+                flushed = flush_counters(batch_size=options['batch_size'])
+                applied += flushed
+                if flushed < options['batch_size']:
+                    break
+            if not options['loop']:
+                self.stdout.write(
+                    self.style.SUCCESS(f'Applied {applied} counter deltas.')
+                )
+                return
+            if applied:
+                self.stdout.write(f'Applied {applied} counter deltas.')
+            time.sleep(options['interval'])
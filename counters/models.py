@@ -0,0 +1,38 @@
+from django.db import models
+
+
+class CounterDelta(models.Model):
+    """
+    A pending change to a stored counter column, written instead of
+    updating the counter row when counter buffering is enabled.
+
+    Deltas are only ever inserted by writers, so concurrent likes and
+    comments on the same post never wait on the post's row lock. The
+    `flush_counters` command periodically sums the deltas of each row,
+    applies them with one `UPDATE` per row and deletes them in the same
+    transaction, so a crash before commit leaves them to be replayed.
+
+    Attributes:
+        model (CharField): The label of the model holding the counter,
+            e.g. 'blogs.blog'.
+        object_id (BigIntegerField): The primary key of the row to update.
+        field (CharField): The name of the counter field.
+        delta (FloatField): The amount to add to the counter.
+        created_at (DateTimeField): When the change was buffered.
+
+    Meta:
+        ordering: Deltas are applied in the order they were buffered.
+    """
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    field = models.CharField(max_length=100)
+    delta = models.FloatField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+        verbose_name = 'Counter Delta'
+        verbose_name_plural = 'Counter Deltas'
+
+    def __str__(self):
+        return f'{self.model} {self.object_id} {self.field} {self.delta:+g}'
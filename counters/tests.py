@@ -0,0 +1,69 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from blog_likes.models import BlogLike
+from blogs.models import Blog
+from followers.models import Follower
+from ft_api.scores import LIKE_WEIGHT
+from profiles.models import ProfileStats
+from .models import CounterDelta
+
+
+@override_settings(COUNTER_BUFFER=True)
+class FlushCountersTests(APITestCase):
+    """
+    Tests that buffered changes to post counters leave the posts
+    untouched until `flush_counters` applies them, that every delta is
+    applied exactly once across batches, and that other counters are
+    updated at once.
+    """
+
+    def setUp(self):
+        self.blog = Blog.objects.create(
+            owner=User.objects.create(username='author'), title='Blog',
+            content='Content'
+        )
+        for index in range(3):
+            BlogLike.objects.create(
+                owner=User.objects.create(username=f'liker{index}'),
+                blog=self.blog
+            )
+        BlogLike.objects.filter(owner__username='liker0').delete()
+
+    def flush(self, **options):
+        stdout = StringIO()
+        call_command('flush_counters', stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_deltas_are_buffered(self):
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.blog_likes_count, 0)
+        self.assertEqual(self.blog.score, 0)
+        self.assertTrue(
+            CounterDelta.objects.filter(
+                model='blogs.blog', object_id=self.blog.pk
+            ).exists()
+        )
+
+    def test_other_counters_are_not_buffered(self):
+        reader = User.objects.get(username='liker1')
+        Follower.objects.create(owner=reader, followed=self.blog.owner)
+        stats = ProfileStats.objects.get(owner=self.blog.owner)
+        self.assertEqual(stats.followers_count, 1)
+        self.assertFalse(
+            CounterDelta.objects.exclude(model='blogs.blog').exists()
+        )
+
+    def test_flush_applies_deltas(self):
+        deltas = CounterDelta.objects.count()
+        output = self.flush(batch_size=2)
+        self.assertIn(f'Applied {deltas} counter deltas.', output)
+        self.assertFalse(CounterDelta.objects.exists())
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.blog_likes_count, 2)
+        self.assertAlmostEqual(self.blog.score, 2 * LIKE_WEIGHT, places=3)
+        self.assertIn('Applied 0 counter deltas.', self.flush())
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.blog_likes_count, 2)
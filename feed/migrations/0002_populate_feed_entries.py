@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+def populate_feed_entries(apps, schema_editor):
+    """
+    Materialize the feed timeline for existing follow relationships.
+    """
+    Follower = apps.get_model('followers', 'Follower')
+    Blog = apps.get_model('blogs', 'Blog')
+    FeedEntry = apps.get_model('feed', 'FeedEntry')
+
+    follows = Follower.objects.values_list('owner_id', 'followed_id')
+    for owner_id, followed_id in follows.iterator():
+        blogs = Blog.objects.filter(
+            owner_id=followed_id
+        ).values_list('id', 'created_at')
+        FeedEntry.objects.bulk_create(
+            (
+                FeedEntry(
+                    owner_id=owner_id,
+                    blog_id=blog_id,
+                    author_id=followed_id,
+                    created_at=created_at,
+                )
+                for blog_id, created_at in blogs.iterator()
+            ),
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0001_initial'),
+        ('followers', '0001_initial'),
+        ('feed', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_feed_entries, migrations.RunPython.noop
+        ),
+    ]
@@ -1,3 +1,141 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.contrib.auth.models import User
+from blogs.models import Blog
+from followers.models import Follower
 
-# Create your models here.
+
+class FeedEntry(models.Model):
+    """
+    Represents a blog post materialized into a user's feed timeline.
+
+    Entries are written when a followed user publishes a blog post
+    (fan-out-on-write), backfilled when a follow relationship is created
+    and pruned when it is removed, so reading a feed is a single range
+    scan over the (owner, created_at) index.
+
+    Attributes:
+        owner (ForeignKey): The user whose feed the entry belongs to.
+        blog (ForeignKey): The blog post shown in the feed.
+        author (ForeignKey): The owner of the blog post, kept so entries
+            can be pruned on unfollow without joining the blog table.
+        created_at (DateTimeField): The creation date of the blog post,
+            copied from the blog so the timeline can be ordered by it.
+
+    Meta:
+        ordering: Entries are ordered by creation date, newest first.
+        unique_together: A blog post appears at most once in a feed.
+    """
+    owner = models.ForeignKey(
+        User, related_name='feed_entries', on_delete=models.CASCADE
+    )
+    blog = models.ForeignKey(
+        Blog, related_name='feed_entries', on_delete=models.CASCADE
+    )
+    author = models.ForeignKey(
+        User, related_name='+', on_delete=models.CASCADE
+    )
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+        unique_together = ('owner', 'blog')
+        indexes = [
+            models.Index(
+                fields=['owner', '-created_at'],
+                name='feed_entry_timeline_idx'
+            ),
+            models.Index(
+                fields=['owner', 'author'],
+                name='feed_entry_author_idx'
+            ),
+        ]
+        verbose_name = 'Feed Entry'
+        verbose_name_plural = 'Feed Entries'
+
+    def __str__(self):
+        return f'{self.blog_id} in feed of {self.owner_id}'
+
+
+def fan_out_blog(sender, instance, created, raw=False, **kwargs):
+    """
+    Signal to add a newly created blog post to the feed of every user
+    following its owner.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The blog post that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if not created or raw:
+        return
+    follower_ids = Follower.objects.filter(
+        followed=instance.owner_id
+    ).values_list('owner', flat=True)
+    FeedEntry.objects.bulk_create(
+        (
+            FeedEntry(
+                owner_id=follower_id,
+                blog_id=instance.id,
+                author_id=instance.owner_id,
+                created_at=instance.created_at,
+            )
+            for follower_id in follower_ids.iterator()
+        ),
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+def backfill_feed(sender, instance, created, raw=False, **kwargs):
+    """
+    Signal to copy the existing blog posts of a newly followed user into
+    the follower's feed.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The follower relationship that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if not created or raw:
+        return
+    blogs = Blog.objects.filter(
+        owner=instance.followed_id
+    ).values_list('id', 'created_at')
+    FeedEntry.objects.bulk_create(
+        (
+            FeedEntry(
+                owner_id=instance.owner_id,
+                blog_id=blog_id,
+                author_id=instance.followed_id,
+                created_at=created_at,
+            )
+            for blog_id, created_at in blogs.iterator()
+        ),
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+def prune_feed(sender, instance, **kwargs):
+    """
+    Signal to remove an unfollowed user's blog posts from the former
+    follower's feed.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The follower relationship that was deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    FeedEntry.objects.filter(
+        owner=instance.owner_id, author=instance.followed_id
+    ).delete()
+
+
+post_save.connect(fan_out_blog, sender=Blog)
+post_save.connect(backfill_feed, sender=Follower)
+post_delete.connect(prune_feed, sender=Follower)
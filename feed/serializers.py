@@ -0,0 +1,24 @@
+from rest_framework import serializers
+from blogs.models import Blog
+from blogs.serializers import BlogSerializer
+from workouts.models import Workout
+from workouts.serializers import WorkoutSerializer
+
+
+class ActivitySerializer(serializers.BaseSerializer):
+    """
+    Read-only serializer for the items of the activity feed.
+
+    Each item is serialized by the serializer of its model, and tagged
+    with a `type` field telling clients whether it is a blog post or a
+    workout.
+    """
+    item_serializers = {
+        Blog: ('blog', BlogSerializer),
+        Workout: ('workout', WorkoutSerializer),
+    }
+
+    def to_representation(self, instance):
+        item_type, serializer_class = self.item_serializers[type(instance)]
+        data = serializer_class(instance, context=self.context).data
+        return {'type': item_type, **data}
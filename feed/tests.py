@@ -1,3 +1,66 @@
-from django.test import TestCase
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from blogs.models import Blog
+from followers.models import Follower
+from workouts.models import Workout
+from .models import FeedEntry
 
-# Create your tests here.
+
+class ActivityFeedPaginationTests(APITestCase):
+    """
+    Tests that paging through the activity feed returns every blog post
+    and workout of followed users exactly once, newest first, including
+    items created at the same instant.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(self.user)
+        stranger = User.objects.create(username='stranger')
+        Blog.objects.create(owner=stranger, title='Hidden', content='C')
+        now = timezone.now()
+        self.expected = []
+        for author_index in range(2):
+            author = User.objects.create(username=f'author{author_index}')
+            Follower.objects.create(owner=self.user, followed=author)
+            for index in range(7):
+                created_at = now - timedelta(hours=index // 6)
+                blog = Blog.objects.create(
+                    owner=author, title=f'Blog {index}', content='C'
+                )
+                Blog.objects.filter(pk=blog.pk).update(created_at=created_at)
+                FeedEntry.objects.filter(blog=blog).update(
+                    created_at=created_at
+                )
+                workout = Workout.objects.create(
+                    owner=author, title=f'Workout {index}', content='C'
+                )
+                Workout.objects.filter(pk=workout.pk).update(
+                    created_at=created_at
+                )
+                self.expected += [
+                    (created_at, 1, blog.pk, 'blog'),
+                    (created_at, 0, workout.pk, 'workout'),
+                ]
+        self.expected.sort(reverse=True)
+
+    def test_pages_have_no_duplicates_or_gaps(self):
+        url, items, page_sizes = '/feed/activity/', [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            results = response.data['results']
+            page_sizes.append(len(results))
+            items += [(item['type'], item['id']) for item in results]
+            url = response.data['next']
+        self.assertEqual(page_sizes, [10, 10, 8])
+        self.assertEqual(len(set(items)), len(items))
+        self.assertEqual(
+            items, [(kind, pk) for _, _, pk, kind in self.expected]
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/feed/activity/', {'cursor': 'nope'})
+        self.assertEqual(response.status_code, 404)
@@ -1,6 +1,9 @@
 from django.urls import path
-from .views import FeedList
+from .views import ActivityFeedList, FeedList
 
 urlpatterns = [
     path('feed/', FeedList.as_view(), name='feed'),
+    path(
+        'feed/activity/', ActivityFeedList.as_view(), name='activity-feed'
+    ),
 ]
@@ -1,8 +1,21 @@
-from rest_framework import generics, permissions
-from django.db.models import Count
+import heapq
+from collections import OrderedDict
+from itertools import islice
+from rest_framework import filters, generics, permissions
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
 from blogs.models import Blog
 from blogs.serializers import BlogSerializer
-from followers.models import Follower
+from blog_likes.models import BlogLike
+from workouts.models import Workout
+from workout_likes.models import WorkoutLike
+from ft_api.pagination import cursor_value, decode_cursor, encode_cursor
+from ft_api.querysets import embed_authors, viewer_relation_id
+from .serializers import ActivitySerializer
 
 
 class FeedList(generics.ListAPIView):
@@ -10,8 +23,10 @@ class FeedList(generics.ListAPIView):
     API view to retrieve a list of blog posts from followed users.
 
     This view returns a list of blog posts created by users that the
-    current user follows. The posts are annotated with counts for
-    likes and comments, and ordered by creation date in descending order.
+    current user follows, read from the user's materialized feed
+    timeline. The posts carry their stored counts for likes and comments,
+    and are ordered by creation date in descending order, or by their
+    stored engagement score with `?ordering=-score`.
 
     Permission:
     - The user must be authenticated to access this view.
@@ -22,29 +37,155 @@ class FeedList(generics.ListAPIView):
     """
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = BlogSerializer
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = ['score']
+    keyset_ordering = ('-feed_created_at', '-id')
 
     def get_queryset(self):
         """
         Retrieves the queryset of blog posts created by followed users.
 
-        This method filters the blog posts to include only those created
-        by users that the current user follows. The posts are annotated
-        with counts for likes and comments, and ordered by creation date
-        in descending order.
+        This method joins the blog posts through the current user's feed
+        entries, which are kept up to date when followed users post and
+        when follow relationships change, so the timeline is a single
+        range scan over the (owner, created_at) index. The posts are
+        annotated with the current user's like ID, embed their authors,
+        and are ordered by creation date in descending order. Posts of
+        accounts queued for deletion are hidden.
 
         Returns:
             QuerySet: The queryset of filtered blog posts.
         """
+        queryset = embed_authors(Blog.objects.filter(
+            feed_entries__owner=self.request.user, owner__is_active=True
+        )).annotate(
+            feed_created_at=F('feed_entries__created_at'),
+            blog_like_id=viewer_relation_id(
+                self.request.user, BlogLike, blog='pk'
+            )
+        ).order_by('-feed_created_at', '-id')
+
+        return queryset
+
+
+class ActivityFeedList(generics.GenericAPIView):
+    """
+    API view to retrieve the blog posts and workouts of followed users as
+    a single timeline.
+
+    Each source is read with its own bounded query of at most one page
+    plus one row, starting after the cursor position, and the two sorted
+    streams are merged lazily until the page is full. Items are ordered
+    by creation date, newest first, with blog posts before workouts
+    created at the same instant, and carry a `type` field naming their
+    kind. Pages are linked by opaque cursors in the `next` field.
+
+    Permission:
+    - The user must be authenticated to access this view.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ActivitySerializer
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_sources(self):
+        """
+        Returns the sources of the timeline.
+
+        Blog posts are read through the user's feed entries, like
+        `FeedList`, and workouts through the user's follow relationships.
+        Posts of accounts queued for deletion are hidden.
+
+        Returns:
+            list: `(rank, date_field, queryset)` tuples, where `rank`
+            orders items of different sources created at the same instant
+            and `date_field` holds the creation date to order by.
+        """
         user = self.request.user
-        followed_users = Follower.objects.filter(
-            owner=user
-        ).values_list('followed', flat=True)
+        blogs = embed_authors(Blog.objects.filter(
+            feed_entries__owner=user, owner__is_active=True
+        )).annotate(
+            feed_created_at=F('feed_entries__created_at'),
+            blog_like_id=viewer_relation_id(user, BlogLike, blog='pk'),
+        )
+        workouts = embed_authors(Workout.objects.filter(
+            owner__followed__owner=user, owner__is_active=True
+        )).annotate(
+            workout_like_id=viewer_relation_id(
+                user, WorkoutLike, workout='pk'
+            ),
+        ).prefetch_related('workout_items__exercise')
+        return [
+            (1, 'feed_created_at', blogs),
+            (0, 'created_at', workouts),
+        ]
 
-        queryset = Blog.objects.filter(
-            owner__in=followed_users
-        ).annotate(
-            blog_likes_count=Count('blog_likes', distinct=True),
-            blog_comments_count=Count('blogcomment', distinct=True)
-        ).order_by('-created_at')
+    def get(self, request, *args, **kwargs):
+        position = None
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            position = decode_cursor(cursor).get('p')
+            if not isinstance(position, list) or len(position) != 3:
+                raise NotFound(self.invalid_cursor_message)
 
-        return queryset
+        streams = []
+        for rank, date_field, queryset in self.get_sources():
+            if position is not None:
+                try:
+                    queryset = queryset.filter(
+                        self.seek(rank, date_field, position)
+                    )
+                except (TypeError, ValueError, ValidationError):
+                    raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.order_by(f'-{date_field}', '-id')
+            streams.append(self.stream(
+                queryset[:self.page_size + 1], rank, date_field
+            ))
+
+        page = list(islice(
+            heapq.merge(*streams, key=lambda item: item[0], reverse=True),
+            self.page_size + 1
+        ))
+        next_link = None
+        if len(page) > self.page_size:
+            page = page[:self.page_size]
+            next_link = replace_query_param(
+                request.build_absolute_uri(), self.cursor_query_param,
+                encode_cursor({
+                    'p': [cursor_value(value) for value in page[-1][0]]
+                })
+            )
+
+        serializer = self.get_serializer(
+            [obj for key, obj in page], many=True
+        )
+        return Response(OrderedDict([
+            ('next', next_link),
+            ('results', serializer.data),
+        ]))
+
+    @staticmethod
+    def stream(queryset, rank, date_field):
+        """
+        Yield the rows of a source with their `(created_at, rank, id)`
+        ordering key. The query runs when the merge first pulls a row.
+        """
+        for obj in queryset:
+            yield (getattr(obj, date_field), rank, obj.id), obj
+
+    @staticmethod
+    def seek(rank, date_field, position):
+        """
+        Build the condition selecting the rows of a source that come
+        strictly after `position`, a `(created_at, rank, id)` key, in the
+        descending timeline order.
+        """
+        created_at, position_rank, position_id = position
+        if rank < position_rank:
+            return Q(**{f'{date_field}__lte': created_at})
+        if rank > position_rank:
+            return Q(**{f'{date_field}__lt': created_at})
+        return Q(**{f'{date_field}__lt': created_at}) | Q(
+            **{date_field: created_at, 'id__lt': position_id}
+        )
@@ -1,4 +1,5 @@
 from django.contrib import admin
-from .models import Follower
+from .models import Follower, FollowGraph
 
 admin.site.register(Follower)
+admin.site.register(FollowGraph)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from followers.models import Follower, FollowGraph
+from ft_api.graph import rebuild_graph
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the packed follow graph of every user from the follower table,
+    correcting any drift from the incremental patches.
+    """
+    help = 'Rebuild the packed follow graph used for follow suggestions.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of users rebuilt per transaction.'
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_graph(
+            FollowGraph, Follower, batch_size=options['batch_size']
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f'Wrote {written} follow graph rows.')
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('followers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FollowGraph',
+            fields=[
+                ('owner', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='follow_graph', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('following', models.BinaryField(default=bytes)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Follow Graph',
+                'verbose_name_plural': 'Follow Graph',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+from ft_api.graph import rebuild_graph
+
+
+def populate_follow_graph(apps, schema_editor):
+    """
+    Pack the existing follows of every user into the follow graph.
+    """
+    rebuild_graph(
+        apps.get_model('followers', 'FollowGraph'),
+        apps.get_model('followers', 'Follower'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('followers', '0002_followgraph'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_follow_graph, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('followers', '0003_populate_follow_graph'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='follower',
+            index=models.Index(fields=['followed', '-created_at', '-id', 'owner'], name='follower_followers_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='follower',
+            index=models.Index(fields=['owner', '-created_at', '-id', 'followed'], name='follower_following_idx'),
+        ),
+    ]
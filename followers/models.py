@@ -1,5 +1,7 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.contrib.auth.models import User
+from ft_api.graph import add_id, pack_ids, remove_id
 
 
 class Follower(models.Model):
@@ -19,6 +21,9 @@ class Follower(models.Model):
             descending order.
         unique_together (tuple): Ensures that a follower-followed
             relationship is unique.
+        indexes (list): Follows are indexed by followed user and by
+            follower, newest first, for the followers and following lists
+            of a profile.
         verbose_name (str): Adds readable name for the model in singular form.
         verbose_name_plural (str): Adds readable name for the model in plural
             form.
@@ -40,8 +45,120 @@ class Follower(models.Model):
     class Meta:
         ordering = ['-created_at']
         unique_together = ('owner', 'followed')
+        indexes = [
+            models.Index(
+                fields=['followed', '-created_at', '-id', 'owner'],
+                name='follower_followers_idx'
+            ),
+            models.Index(
+                fields=['owner', '-created_at', '-id', 'followed'],
+                name='follower_following_idx'
+            ),
+        ]
         verbose_name = 'Follower'
         verbose_name_plural = 'Followers'
 
     def __str__(self):
         return f'{self.owner.username} follows {self.followed.username}'
+
+
+class FollowGraph(models.Model):
+    """
+    The compact adjacency list of the users a user follows.
+
+    Each row packs the followed user ids into an array of 64-bit
+    integers, in the order they were followed, so follow suggestions can
+    pick the most recently followed users and read one small row each
+    instead of self-joining the follower table. Rows are patched when
+    follows are created or deleted and can be rebuilt from the follower
+    table with `rebuild_follow_graph`.
+
+    Attributes:
+        owner (OneToOneField): The user whose follows are stored, also
+            used as the primary key.
+        following (BinaryField): The packed ids of the followed users.
+        updated_at (DateTimeField): When the row was last written.
+    """
+    owner = models.OneToOneField(
+        User, primary_key=True, related_name='follow_graph',
+        on_delete=models.CASCADE
+    )
+    following = models.BinaryField(default=bytes)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Follow Graph'
+        verbose_name_plural = 'Follow Graph'
+
+    def __str__(self):
+        return f'Follow graph of {self.owner_id}'
+
+
+def patch_follow_graph(owner_id, patch):
+    """
+    Apply `patch` to the follow graph row of a user, under a row lock so
+    concurrent patches are not lost.
+
+    A user without a row yet gets one built from the follower table,
+    which already reflects the follow being created or deleted.
+
+    Args:
+        owner_id (int): The primary key of the following user.
+        patch (callable): Returns the new packed ids from the old ones.
+    """
+    with transaction.atomic():
+        graph = FollowGraph.objects.select_for_update().filter(
+            owner_id=owner_id
+        ).first()
+        if graph is not None:
+            graph.following = patch(graph.following)
+            graph.save(update_fields=['following', 'updated_at'])
+            return
+        following = pack_ids(Follower.objects.filter(
+            owner_id=owner_id
+        ).order_by('created_at', 'id').values_list('followed', flat=True))
+        try:
+            with transaction.atomic():
+                FollowGraph.objects.create(
+                    owner_id=owner_id, following=following
+                )
+        except IntegrityError:
+            patch_follow_graph(owner_id, patch)
+
+
+def add_follow_edge(sender, instance, created, raw=False, **kwargs):
+    """
+    Signal to add a newly followed user to the follower's follow graph.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The follower relationship that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw:
+        patch_follow_graph(
+            instance.owner_id,
+            lambda following: add_id(following, instance.followed_id)
+        )
+
+
+def remove_follow_edge(sender, instance, **kwargs):
+    """
+    Signal to remove an unfollowed user from the former follower's follow
+    graph.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The follower relationship that was deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    patch_follow_graph(
+        instance.owner_id,
+        lambda following: remove_id(following, instance.followed_id)
+    )
+
+
+post_save.connect(add_follow_edge, sender=Follower)
+post_delete.connect(remove_follow_edge, sender=Follower)
@@ -1,5 +1,6 @@
 from django.db import IntegrityError
 from rest_framework import serializers
+from profiles.models import Profile
 from .models import Follower
 
 
@@ -40,3 +41,68 @@ class FollowerSerializer(serializers.ModelSerializer):
         if data['followed'] == self.context['request'].user:
             raise serializers.ValidationError("You cannot follow yourself.")
         return data
+
+
+class ProfileFollowerSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer for the users following a profile.
+
+    Attributes:
+        username (ReadOnlyField): The username of the follower.
+        profile_id (ReadOnlyField): The ID of the follower's profile.
+        profile_image (ReadOnlyField): The URL of the follower's profile
+            image.
+    """
+    username = serializers.ReadOnlyField(source='owner.username')
+    profile_id = serializers.ReadOnlyField(source='owner.profile.id')
+    profile_image = serializers.ReadOnlyField(
+        source='owner.profile.profile_image.url'
+    )
+
+    class Meta:
+        model = Follower
+        fields = [
+            'id', 'username', 'profile_id', 'profile_image', 'created_at'
+        ]
+
+
+class ProfileFollowingSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer for the users a profile follows.
+
+    Attributes:
+        username (ReadOnlyField): The username of the followed user.
+        profile_id (ReadOnlyField): The ID of the followed user's profile.
+        profile_image (ReadOnlyField): The URL of the followed user's
+            profile image.
+    """
+    username = serializers.ReadOnlyField(source='followed.username')
+    profile_id = serializers.ReadOnlyField(source='followed.profile.id')
+    profile_image = serializers.ReadOnlyField(
+        source='followed.profile.profile_image.url'
+    )
+
+    class Meta:
+        model = Follower
+        fields = [
+            'id', 'username', 'profile_id', 'profile_image', 'created_at'
+        ]
+
+
+class FollowSuggestionSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer for the profiles suggested to follow.
+
+    Attributes:
+        username (ReadOnlyField): The username of the profile owner.
+        profile_image (ReadOnlyField): The URL of the profile image.
+        mutual_count (ReadOnlyField): The number of users followed by the
+            viewer who follow the suggested user.
+    """
+    username = serializers.ReadOnlyField(source='owner.username')
+    profile_image = serializers.ReadOnlyField(source='profile_image.url')
+    mutual_count = serializers.ReadOnlyField()
+
+    class Meta:
+        model = Profile
+        fields = ['id', 'owner', 'username', 'profile_image', 'mutual_count']
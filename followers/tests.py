@@ -1,3 +1,81 @@
-from django.test import TestCase
+from unittest import mock
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from ft_api.graph import rebuild_graph, unpack_ids
+from .models import Follower, FollowGraph
 
-# Create your tests here.
+
+class FollowSuggestionTests(APITestCase):
+    """
+    Tests that follow suggestions are ranked from the follow graph by
+    mutual follows, counted over the most recently followed users.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(self.user)
+        self.late = User.objects.create(username='late')
+        self.early = User.objects.create(username='early')
+        self.popular = User.objects.create(username='popular')
+        self.niche = User.objects.create(username='niche')
+        self.follow(self.early, self.popular)
+        self.follow(self.late, self.popular)
+        self.follow(self.late, self.niche)
+        self.follow(self.early, self.user)
+        self.follow(self.user, self.early)
+        self.follow(self.user, self.late)
+
+    def follow(self, owner, followed):
+        Follower.objects.create(owner=owner, followed=followed)
+
+    def suggestions(self, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/followers/suggestions/', params)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any(
+            Follower._meta.db_table in query['sql']
+            for query in context.captured_queries
+        ))
+        return [
+            (profile['username'], profile['mutual_count'])
+            for profile in response.data
+        ]
+
+    def test_ranked_by_mutual_follows(self):
+        self.assertEqual(
+            self.suggestions(), [('popular', 2), ('niche', 1)]
+        )
+
+    def test_skips_accounts_queued_for_deletion(self):
+        self.assertEqual(self.suggestions(limit=1), [('popular', 2)])
+        User.objects.filter(pk=self.popular.pk).update(is_active=False)
+        self.assertEqual(self.suggestions(limit=1), [('niche', 1)])
+
+    def test_counts_the_most_recently_followed(self):
+        with mock.patch('followers.views.MAX_SUGGESTION_SOURCES', 1):
+            self.assertEqual(
+                self.suggestions(), [('niche', 1), ('popular', 1)]
+            )
+
+    def test_graph_keeps_follow_order(self):
+        graph = FollowGraph.objects.get(owner=self.user)
+        self.assertEqual(
+            list(unpack_ids(graph.following)), [self.early.pk, self.late.pk]
+        )
+        Follower.objects.get(owner=self.user, followed=self.early).delete()
+        self.follow(self.user, self.early)
+        rebuilt = {
+            graph.owner_id: bytes(graph.following)
+            for graph in FollowGraph.objects.all()
+        }
+        rebuild_graph(FollowGraph, Follower)
+        graph = FollowGraph.objects.get(owner=self.user)
+        self.assertEqual(
+            list(unpack_ids(graph.following)), [self.late.pk, self.early.pk]
+        )
+        self.assertEqual(rebuilt, {
+            graph.owner_id: bytes(graph.following)
+            for graph in FollowGraph.objects.all()
+        })
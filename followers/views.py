@@ -1,7 +1,16 @@
+from itertools import islice
+from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions
+from ft_api.graph import MAX_SUGGESTION_SOURCES, rank_suggestions, unpack_ids
+from ft_api.pagination import KeysetPagination
 from ft_api.permissions import IsOwnerOrReadOnly
-from .models import Follower
-from .serializers import FollowerSerializer
+from ft_api.querysets import embed_authors
+from profiles.models import Profile
+from .models import Follower, FollowGraph
+from .serializers import (
+    FollowerSerializer, FollowSuggestionSerializer, ProfileFollowerSerializer,
+    ProfileFollowingSerializer
+)
 
 
 class FollowerList(generics.ListCreateAPIView):
@@ -24,7 +33,10 @@ class FollowerList(generics.ListCreateAPIView):
         This view should return a list of all the followers for
         the currently authenticated user.
         """
-        return Follower.objects.filter(owner=self.request.user)
+        return embed_authors(
+            Follower.objects.filter(owner=self.request.user),
+            'owner', 'followed', with_profile=False
+        )
 
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
@@ -42,5 +54,121 @@ class FollowerDetail(generics.RetrieveDestroyAPIView):
     unfollow a user.
     """
     permission_classes = [IsOwnerOrReadOnly]
-    queryset = Follower.objects.all()
+    queryset = embed_authors(
+        Follower.objects.all(), 'owner', 'followed', with_profile=False
+    )
     serializer_class = FollowerSerializer
+
+
+class ProfileFollowerList(generics.ListAPIView):
+    """
+    API view to list the users following a profile.
+
+    - GET: Returns the follows of the profile's owner, newest first, with
+      each follower's username, profile ID and profile image.
+
+    Pages are read by keyset pagination over the (followed, created_at,
+    id, owner) index, joining the followers and their profiles in one
+    query.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ProfileFollowerSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        profile = get_object_or_404(
+            Profile, pk=self.kwargs['pk'], owner__is_active=True
+        )
+        return embed_authors(
+            Follower.objects.filter(followed_id=profile.owner_id), 'owner'
+        )
+
+
+class ProfileFollowingList(generics.ListAPIView):
+    """
+    API view to list the users a profile follows.
+
+    - GET: Returns the follows made by the profile's owner, newest first,
+      with each followed user's username, profile ID and profile image.
+
+    Pages are read by keyset pagination over the (owner, created_at, id,
+    followed) index, joining the followed users and their profiles in one
+    query.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ProfileFollowingSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        profile = get_object_or_404(
+            Profile, pk=self.kwargs['pk'], owner__is_active=True
+        )
+        return embed_authors(
+            Follower.objects.filter(owner_id=profile.owner_id), 'followed'
+        )
+
+
+class FollowSuggestionList(generics.ListAPIView):
+    """
+    API view to suggest users to follow: the users followed by the most
+    users the logged-in user follows.
+
+    Suggestions are ranked from the packed follow graph rather than the
+    follower table: one query reads the user's own row and one reads the
+    rows of the `MAX_SUGGESTION_SOURCES` users they followed most
+    recently, which stand for their current interests, and the mutual
+    follows are counted in memory. Only the top `?limit=` profiles are
+    then loaded, taking the next candidates in place of accounts queued
+    for deletion.
+    """
+    serializer_class = FollowSuggestionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    limit_query_param = 'limit'
+    default_limit = 10
+    max_limit = 50
+
+    def get_limit(self):
+        """
+        Returns the requested number of results, bounded by `max_limit`.
+        """
+        try:
+            limit = int(self.request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_queryset(self):
+        """
+        Returns the suggested profiles, most mutual follows first, each
+        annotated with its `mutual_count`.
+        """
+        user_id = self.request.user.pk
+        graph = FollowGraph.objects.filter(owner_id=user_id).values_list(
+            'following', flat=True
+        ).first()
+        following = unpack_ids(graph)
+        if not following:
+            return []
+        second_hop = FollowGraph.objects.filter(
+            owner_id__in=following[-MAX_SUGGESTION_SOURCES:]
+        ).values_list('following', flat=True)
+        ranked = rank_suggestions(
+            user_id, following, map(unpack_ids, second_hop)
+        )
+        limit = self.get_limit()
+        suggestions = []
+        while len(suggestions) < limit:
+            counts = dict(islice(ranked, limit - len(suggestions)))
+            if not counts:
+                break
+            profiles = Profile.objects.select_related('owner').filter(
+                owner__in=counts, owner__is_active=True
+            ).only('id', 'owner', 'profile_image', 'owner__username')
+            for profile in profiles:
+                profile.mutual_count = counts[profile.owner_id]
+                suggestions.append(profile)
+        return sorted(
+            suggestions,
+            key=lambda profile: (-profile.mutual_count, -profile.owner_id)
+        )
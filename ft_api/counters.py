@@ -0,0 +1,172 @@
+from collections import defaultdict
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Count, F, IntegerField, OuterRef, Subquery, Value
+)
+from django.db.models.functions import Coalesce
+from counters.models import CounterDelta
+
+# Models whose counters are buffered when `COUNTER_BUFFER` is enabled:
+# the posts every like and comment writes to.
+BUFFERED_MODELS = ('blogs.blog', 'workouts.workout')
+
+
+def adjust_counters(model, pk, **deltas):
+    """
+    Add deltas to stored counter columns of a single row.
+
+    The update is a single `UPDATE ... SET field = field + delta`
+    statement, so concurrent writers never lose increments and no row is
+    read back into Python.
+
+    When the `COUNTER_BUFFER` setting is enabled, the deltas of the
+    posts in `BUFFERED_MODELS` are inserted into the `CounterDelta`
+    buffer instead and applied by `flush_counters`, so writers never
+    contend for the lock of a popular post and readers see its counters
+    lag by at most one flush interval. Other counters, such as profile
+    stats and reply counts, are always updated at once.
+
+    Args:
+        model (Model): The model holding the counters, e.g. Blog.
+        pk (int): The primary key of the row to update.
+        **deltas: Maps counter field names to the amount to add.
+    """
+    if (
+        getattr(settings, 'COUNTER_BUFFER', False)
+        and model._meta.label_lower in BUFFERED_MODELS
+    ):
+        CounterDelta.objects.bulk_create([
+            CounterDelta(
+                model=model._meta.label_lower, object_id=pk, field=field,
+                delta=delta
+            )
+            for field, delta in deltas.items()
+        ])
+        return
+    model.objects.filter(pk=pk).update(**{
+        field: F(field) + delta for field, delta in deltas.items()
+    })
+
+
+def edit_fields(instance, stored_fields):
+    """
+    List the fields written when an existing row is saved, leaving out
+    its stored counters.
+
+    Counters are only changed by single-statement updates, so a
+    full-row save would write back the values loaded before the edit
+    and lose every increment committed in between.
+
+    Args:
+        instance (Model): The row being saved.
+        stored_fields (tuple): The names of the stored counter fields.
+
+    Returns:
+        list: The names of the concrete fields to update.
+    """
+    return [
+        field.name for field in instance._meta.concrete_fields
+        if not field.primary_key and field.name not in stored_fields
+    ]
+
+
+def flush_counters(batch_size=1000):
+    """
+    Apply a batch of buffered counter deltas to the counter columns.
+
+    The oldest deltas are summed per row and field, and each row with a
+    non-zero total is updated by one `UPDATE ... SET field = field +
+    total` statement, in a consistent order so concurrent flushes cannot
+    deadlock. The deltas are deleted in the same transaction, so they
+    are applied exactly once, or replayed by the next flush if the
+    process dies first. On PostgreSQL the batch is claimed with `SKIP
+    LOCKED`, so several flushers can run side by side.
+
+    Args:
+        batch_size (int): The maximum number of deltas applied.
+
+    Returns:
+        int: The number of deltas applied.
+    """
+    with transaction.atomic():
+        rows = list(
+            CounterDelta.objects.select_for_update(
+                skip_locked=True
+            ).order_by('id').values_list(
+                'id', 'model', 'object_id', 'field', 'delta'
+            )[:batch_size]
+        )
+        if not rows:
+            return 0
+        totals = defaultdict(lambda: defaultdict(float))
+        for _, label, object_id, field, delta in rows:
+            totals[label, object_id][field] += delta
+        for (label, object_id), fields in sorted(totals.items()):
+            model = apps.get_model(label)
+            updates = {}
+            for field, total in fields.items():
+                if isinstance(model._meta.get_field(field), IntegerField):
+                    total = round(total)
+                if total:
+                    updates[field] = F(field) + total
+            if updates:
+                model.objects.filter(pk=object_id).update(**updates)
+        CounterDelta.objects.filter(
+            id__in=[row[0] for row in rows]
+        ).delete()
+    return len(rows)
+
+
+def count_subquery(related_model, field, queryset=None):
+    """
+    Build a subquery counting the `related_model` rows whose `field`
+    points at the outer row, or 0 when there are none.
+
+    Passing `queryset` counts only its rows, so that a count can share
+    the filters of a list or preview of the same rows.
+    """
+    if queryset is None:
+        queryset = related_model.objects.all()
+    counts = queryset.filter(
+        **{field: OuterRef('pk')}
+    ).order_by().values(field).annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts), Value(0))
+
+
+def repair_counters(model, counters, batch_size=1000):
+    """
+    Recompute stored counter columns from the related tables.
+
+    Rows are updated in primary key batches so the repair never holds
+    locks on the whole table.
+
+    Args:
+        model (Model): The model holding the counters, e.g. Blog.
+        counters (dict): Maps counter field names to a
+            `(related_model, field)` pair, where `field` is the foreign
+            key on the related model pointing at `model`.
+        batch_size (int): The number of rows updated per statement.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    updates = {
+        name: count_subquery(related_model, field)
+        for name, (related_model, field) in counters.items()
+    }
+    updated = 0
+    last_pk = 0
+    while True:
+        pks = list(
+            model.objects.filter(pk__gt=last_pk).order_by('pk').values_list(
+                'pk', flat=True
+            )[:batch_size]
+        )
+        if not pks:
+            return updated
+        updated += model.objects.filter(pk__in=pks).update(**updates)
+        last_pk = pks[-1]
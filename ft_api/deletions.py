@@ -0,0 +1,169 @@
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Length
+from django.utils import timezone
+from ft_api.threads import subtree
+from profiles.models import AccountDeletion
+
+
+def thread_replies(post_field):
+    """
+    Build a deletion step selecting the replies under a user's comments,
+    whoever wrote them, one thread at a time.
+
+    Deleting a comment cascades to its whole subtree, so the replies are
+    deleted first. The thread of the user's oldest comment that still
+    has replies is selected, as a range of the (post, path) index, and
+    the step moves on to the next thread once it is empty.
+
+    Args:
+        post_field (str): The comment's foreign key to the post, e.g.
+            'blog'.
+
+    Returns:
+        callable: Maps a comment model and a user id to the replies.
+    """
+    def select(model, user_id):
+        root = model.objects.filter(owner=user_id).filter(Exists(
+            model.objects.filter(parent=OuterRef('pk'))
+        )).order_by('pk').only('pk', 'path', post_field).first()
+        if root is None:
+            return model.objects.none()
+        return model.objects.filter(
+            subtree(root.path),
+            **{post_field: getattr(root, f'{post_field}_id')}
+        ).exclude(pk=root.pk)
+    return select
+
+
+# Tables emptied of a deleted user's rows, in order, as pairs of a model
+# label and the lookup from the model to the user, or a function
+# selecting the rows. Rows depending on the user's posts and comments
+# come before the posts and comments, and comments are deleted deepest
+# first, so each batch only cascades to a bounded number of rows.
+DELETION_STEPS = (
+    ('feed.FeedEntry', 'owner'),
+    ('feed.FeedEntry', 'author'),
+    ('blog_likes.BlogLike', 'owner'),
+    ('blog_likes.BlogLike', 'blog__owner'),
+    ('workout_likes.WorkoutLike', 'owner'),
+    ('workout_likes.WorkoutLike', 'workout__owner'),
+    ('blog_comments.BlogComment', 'blog__owner'),
+    ('blog_comments.BlogComment', thread_replies('blog')),
+    ('blog_comments.BlogComment', 'owner'),
+    ('workout_comments.WorkoutComment', 'workout__owner'),
+    ('workout_comments.WorkoutComment', thread_replies('workout')),
+    ('workout_comments.WorkoutComment', 'owner'),
+    ('blogs.BlogActivity', 'blog__owner'),
+    ('workouts.WorkoutActivity', 'workout__owner'),
+    ('workouts.WorkoutItem', 'workout__owner'),
+    ('workouts.ExerciseRollup', 'owner'),
+    ('blogs.Blog', 'owner'),
+    ('workouts.Workout', 'owner'),
+    ('followers.Follower', 'owner'),
+    ('followers.Follower', 'followed'),
+    ('groups.Membership', 'user'),
+    ('group_events.EventMembership', 'user'),
+    ('profiles.Profile', 'owner'),
+)
+
+
+def step_rows(model, lookup, user_id):
+    """
+    Select the rows of a deletion step, in the order they are deleted.
+
+    Comments are ordered deepest first, so that a comment is only
+    deleted once the replies selected with it are gone.
+
+    Args:
+        model (Model): The model of the step.
+        lookup (str): The lookup from the model to the user, or a
+            function selecting the rows, see `thread_replies`.
+        user_id (int): The primary key of the user being deleted.
+
+    Returns:
+        QuerySet: The rows left to delete.
+    """
+    if callable(lookup):
+        rows = lookup(model, user_id)
+    else:
+        rows = model.objects.filter(**{lookup: user_id})
+    if any(field.name == 'path' for field in model._meta.concrete_fields):
+        return rows.order_by(Length('path').desc(), 'pk')
+    return rows.order_by('pk')
+
+
+def request_account_deletion(user):
+    """
+    Deactivate a user and queue the deletion of the account.
+
+    The user is deactivated in the same transaction as the job is
+    queued, so the account can no longer sign in and disappears from the
+    API before the endpoint responds. Requesting the deletion of an
+    account already queued returns the existing job.
+
+    Args:
+        user (User): The user to delete.
+
+    Returns:
+        AccountDeletion: The deletion job.
+    """
+    with transaction.atomic():
+        User.objects.filter(pk=user.pk).update(is_active=False)
+        job, _ = AccountDeletion.objects.get_or_create(
+            user=user, defaults={'username': user.username}
+        )
+    return job
+
+
+def process_account_deletion(batch_size=1000):
+    """
+    Run one batch of the oldest pending account deletion.
+
+    The batch deletes up to `batch_size` rows of the job's current table,
+    through the ORM so that signals keep the counters of other users in
+    sync, and records the progress in the same transaction. Once a step
+    has no rows left the job moves on to the next one, and after the last
+    one the user itself is deleted and the job is completed. On
+    PostgreSQL the job is claimed with `SKIP LOCKED`, so several workers
+    can run different deletions side by side.
+
+    Args:
+        batch_size (int): The maximum number of rows selected for
+            deletion, not counting the rows they cascade to.
+
+    Returns:
+        bool: True if a batch was run, False if no deletion is pending.
+    """
+    with transaction.atomic():
+        job = AccountDeletion.objects.select_for_update(
+            skip_locked=True
+        ).filter(completed_at__isnull=True).order_by(
+            'requested_at', 'id'
+        ).first()
+        if job is None:
+            return False
+        deleted = {}
+        if job.user_id is not None and job.step < len(DELETION_STEPS):
+            label, lookup = DELETION_STEPS[job.step]
+            model = apps.get_model(label)
+            pks = list(step_rows(model, lookup, job.user_id).values_list(
+                'pk', flat=True
+            )[:batch_size])
+            if pks:
+                _, deleted = model.objects.filter(pk__in=pks).delete()
+            if len(pks) < batch_size and not step_rows(
+                model, lookup, job.user_id
+            ).exists():
+                job.step += 1
+        else:
+            if job.user_id is not None:
+                _, deleted = User.objects.filter(pk=job.user_id).delete()
+            job.user = None
+            job.completed_at = timezone.now()
+        for name, count in deleted.items():
+            job.deleted_rows[name] = job.deleted_rows.get(name, 0) + count
+        job.save()
+    return True
@@ -0,0 +1,60 @@
+# Maximum length of an exercise name and of its catalog key
+EXERCISE_NAME_LENGTH = 255
+
+
+def exercise_name(name):
+    """
+    Return `name` with surrounding whitespace removed and inner runs of
+    whitespace collapsed to single spaces.
+    """
+    return ' '.join(name.split())[:EXERCISE_NAME_LENGTH]
+
+
+def exercise_key(name):
+    """
+    Return the key identifying an exercise in the catalog, its
+    normalized name case-folded, so that "Bench  press" and "bench
+    Press" are the same exercise.
+    """
+    return exercise_name(name).casefold()[:EXERCISE_NAME_LENGTH]
+
+
+def resolve_exercises(exercise_model, names):
+    """
+    Map exercise names to the ids of their catalog entries, adding the
+    names that are not in the catalog yet.
+
+    The existing entries are read with one query on the unique key. The
+    missing ones are inserted with one bulk insert that ignores entries
+    created concurrently, and then read back, so a batch of names costs
+    at most three queries.
+
+    Args:
+        exercise_model (Model): The catalog model, e.g. Exercise.
+        names (iterable): The exercise names to resolve.
+
+    Returns:
+        dict: Maps each name to the id of its exercise.
+    """
+    keys = {name: exercise_key(name) for name in names}
+    if not keys:
+        return {}
+    found = dict(exercise_model.objects.filter(
+        name_key__in=set(keys.values())
+    ).values_list('name_key', 'id'))
+    missing = {}
+    for name, key in keys.items():
+        if key not in found:
+            missing.setdefault(key, exercise_name(name))
+    if missing:
+        exercise_model.objects.bulk_create(
+            [
+                exercise_model(name=name, name_key=key)
+                for key, name in missing.items()
+            ],
+            ignore_conflicts=True
+        )
+        found.update(exercise_model.objects.filter(
+            name_key__in=missing
+        ).values_list('name_key', 'id'))
+    return {name: found[key] for name, key in keys.items()}
@@ -0,0 +1,147 @@
+import heapq
+import sys
+from array import array
+from collections import Counter
+from django.db import transaction
+
+# Type code of the 64-bit signed integers user ids are packed as
+ID_TYPECODE = 'q'
+# Number of most recently followed users whose own follows are counted
+# for suggestions
+MAX_SUGGESTION_SOURCES = 1000
+
+
+def pack_ids(ids):
+    """
+    Pack user ids into the compact little-endian byte string stored in
+    the follow graph, keeping their order and dropping repeated ids.
+
+    Args:
+        ids (iterable): The user ids, in the order they were followed.
+
+    Returns:
+        bytes: The packed ids.
+    """
+    packed = array(ID_TYPECODE, dict.fromkeys(ids))
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_ids(data):
+    """
+    Unpack the user ids stored by `pack_ids`.
+
+    Args:
+        data (bytes): The packed ids, or None.
+
+    Returns:
+        array: The user ids, in the order they were followed.
+    """
+    ids = array(ID_TYPECODE)
+    if data:
+        ids.frombytes(bytes(data))
+        if sys.byteorder == 'big':
+            ids.byteswap()
+    return ids
+
+
+def add_id(data, user_id):
+    """
+    Return the packed ids of `data` with `user_id` added last, as the
+    most recently followed user.
+    """
+    ids = unpack_ids(data)
+    if user_id in ids:
+        return bytes(data)
+    return pack_ids([*ids, user_id])
+
+
+def remove_id(data, user_id):
+    """
+    Return the packed ids of `data` without `user_id`.
+    """
+    return pack_ids(
+        other_id for other_id in unpack_ids(data) if other_id != user_id
+    )
+
+
+def rank_suggestions(user_id, following, second_hop):
+    """
+    Rank the users followed by the users `user_id` follows, by the number
+    of them that follow each candidate.
+
+    The candidates are heapified in linear time and popped lazily, so
+    callers that skip some of them, such as accounts queued for
+    deletion, can keep taking candidates until a page is full while
+    only paying for the ones they take.
+
+    Args:
+        user_id (int): The user to suggest follows to.
+        following (iterable): The ids the user follows.
+        second_hop (iterable): The id arrays followed by each of the
+            users in `following`.
+
+    Yields:
+        tuple: `(user_id, mutual_count)` pairs, most mutual follows first
+        and most recent users first among ties.
+    """
+    counts = Counter()
+    for ids in second_hop:
+        counts.update(ids)
+    counts.pop(user_id, None)
+    for followed_id in following:
+        counts.pop(followed_id, None)
+    heap = [(-count, -candidate) for candidate, count in counts.items()]
+    heapq.heapify(heap)
+    while heap:
+        count, candidate = heapq.heappop(heap)
+        yield -candidate, -count
+
+
+def rebuild_graph(graph_model, follower_model, batch_size=1000):
+    """
+    Rebuild the follow graph of every user from the follower table.
+
+    Users are processed in primary key batches: the graph rows of a
+    batch are locked against incremental patches, the batch's follows
+    are read in one query ordered by user and follow date, packed into
+    one row per user and written in place of the old rows, in one
+    transaction per batch.
+
+    Args:
+        graph_model (Model): The graph model, e.g. FollowGraph.
+        follower_model (Model): The follow model, e.g. Follower.
+        batch_size (int): The number of users rebuilt per transaction.
+
+    Returns:
+        int: The number of graph rows written.
+    """
+    users = graph_model._meta.get_field('owner').related_model
+    written = 0
+    last_pk = 0
+    while True:
+        owner_ids = list(
+            users.objects.filter(pk__gt=last_pk).order_by('pk').values_list(
+                'pk', flat=True
+            )[:batch_size]
+        )
+        if not owner_ids:
+            return written
+        with transaction.atomic():
+            rows = graph_model.objects.filter(owner__in=owner_ids)
+            list(rows.select_for_update().values_list('pk', flat=True))
+            following = {}
+            for owner_id, followed_id in follower_model.objects.filter(
+                owner__in=owner_ids
+            ).order_by('owner', 'created_at', 'id').values_list(
+                'owner', 'followed'
+            ):
+                following.setdefault(owner_id, []).append(followed_id)
+            rows.delete()
+            graph_model.objects.bulk_create([
+                graph_model(owner_id=owner_id, following=pack_ids(ids))
+                for owner_id, ids in following.items()
+            ])
+        written += len(following)
+        last_pk = owner_ids[-1]
@@ -0,0 +1,125 @@
+from django.db import connections, router, transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+
+def add_like(model, target_field, owner, target_pk):
+    """
+    Like a post unless the user already likes it.
+
+    The like is written by a single `INSERT ... SELECT ... ON CONFLICT DO
+    NOTHING RETURNING` statement, which inserts nothing when the post
+    does not exist or the like is already there, so a repeated request
+    never raises and rolls back an `IntegrityError`. When a like is
+    inserted, `post_save` is sent as if it had been saved through the
+    ORM so the stored counters stay in sync. Both PostgreSQL and SQLite
+    (3.35+) support this syntax.
+
+    Args:
+        model (Model): The like model, e.g. BlogLike.
+        target_field (str): The like's foreign key to the post, e.g. 'blog'.
+        owner (User): The user liking the post.
+        target_pk (int): The primary key of the post.
+
+    Returns:
+        Model: The new like, or None if nothing was inserted.
+    """
+    using = router.db_for_write(model)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    opts = model._meta
+    target = opts.get_field(target_field)
+    target_opts = target.related_model._meta
+    owner_column = quote(opts.get_field('owner').column)
+    target_column = quote(target.column)
+    created_at = timezone.now()
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {quote(opts.db_table)} '
+                f'({owner_column}, {target_column}, '
+                f'{quote(opts.get_field("created_at").column)}) '
+                f'SELECT %s, {quote(target_opts.pk.column)}, %s '
+                f'FROM {quote(target_opts.db_table)} '
+                f'WHERE {quote(target_opts.pk.column)} = %s '
+                f'ON CONFLICT ({owner_column}, {target_column}) DO NOTHING '
+                f'RETURNING {quote(opts.pk.column)}',
+                [
+                    owner.pk,
+                    opts.get_field('created_at').get_db_prep_value(
+                        created_at, connection
+                    ),
+                    target_pk,
+                ]
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        like = model(
+            pk=row[0], owner=owner, created_at=created_at,
+            **{target.attname: target_pk}
+        )
+        like._state.adding = False
+        like._state.db = using
+        post_save.send(
+            sender=model, instance=like, created=True, update_fields=None,
+            raw=False, using=using
+        )
+    return like
+
+
+def remove_like(model, target_field, owner, target_pk):
+    """
+    Remove a user's like of a post, if there is one.
+
+    The like is deleted by a single `DELETE ... RETURNING` statement
+    matching the owner and the post, and `post_delete` is sent for it as
+    if it had been deleted through the ORM. The like's creation date is
+    returned by the same statement, so the signal handlers can subtract
+    its decayed weight from the post's score.
+
+    Args:
+        model (Model): The like model, e.g. BlogLike.
+        target_field (str): The like's foreign key to the post, e.g. 'blog'.
+        owner (User): The user who liked the post.
+        target_pk (int): The primary key of the post.
+
+    Returns:
+        bool: True if a like was deleted, False otherwise.
+    """
+    using = router.db_for_write(model)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    opts = model._meta
+    target = opts.get_field(target_field)
+    created_field = opts.get_field('created_at')
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {quote(opts.db_table)} '
+                f'WHERE {quote(opts.get_field("owner").column)} = %s '
+                f'AND {quote(target.column)} = %s '
+                f'RETURNING {quote(opts.pk.column)}, '
+                f'{quote(created_field.column)}',
+                [owner.pk, target_pk]
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return False
+        created_at = row[1]
+        column = created_field.get_col(opts.db_table)
+        for converter in (
+            connection.ops.get_db_converters(column)
+            + created_field.get_db_converters(connection)
+        ):
+            created_at = converter(created_at, column, connection)
+        like = model(
+            pk=row[0], owner=owner, created_at=created_at,
+            **{target.attname: target_pk}
+        )
+        like._state.adding = False
+        like._state.db = using
+        post_delete.send(
+            sender=model, instance=like, using=using, origin=like
+        )
+    return True
@@ -0,0 +1,241 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import date, datetime, time
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+def encode_cursor(payload):
+    """
+    Encode a JSON-serializable payload into an opaque, URL-safe cursor.
+
+    Args:
+        payload (dict): The cursor payload.
+
+    Returns:
+        str: The encoded cursor.
+    """
+    data = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The encoded cursor.
+
+    Raises:
+        NotFound: If the cursor cannot be decoded.
+
+    Returns:
+        dict: The cursor payload.
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        payload = json.loads(urlsafe_b64decode(cursor + padding))
+    except (TypeError, ValueError):
+        raise NotFound('Invalid cursor')
+    if not isinstance(payload, dict):
+        raise NotFound('Invalid cursor')
+    return payload
+
+
+def cursor_value(value):
+    """
+    Convert a model value into a JSON-serializable cursor value, keeping
+    full precision for datetimes so that equality comparisons still hold
+    when the cursor is decoded.
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a fixed, unique ordering.
+
+    Pages are located by comparing the ordering columns against the
+    position of the last row of the previous page, so no COUNT(*) is run
+    and deep pages cost the same as the first one when the ordering is
+    backed by an index. Cursors are opaque and encode the position and
+    the direction of travel.
+
+    The ordering defaults to ('-created_at', '-id') and can be changed per
+    view with a `keyset_ordering` attribute. Every field must be a
+    concrete field or an annotation on the queryset, and the last one
+    must be unique.
+    """
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    ordering = ('-created_at', '-id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = tuple(
+            getattr(view, 'keyset_ordering', None) or self.ordering
+        )
+        self.has_cursor = bool(
+            request.query_params.get(self.cursor_query_param)
+        )
+
+        position, reverse = None, False
+        if self.has_cursor:
+            payload = decode_cursor(
+                request.query_params[self.cursor_query_param]
+            )
+            position = payload.get('p')
+            reverse = bool(payload.get('r'))
+            if (
+                not isinstance(position, list)
+                or len(position) != len(self.ordering)
+            ):
+                raise NotFound(self.invalid_cursor_message)
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(self._invert(field) for field in ordering)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self._seek(ordering, position))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.next_position = self.previous_position = None
+        if results:
+            if has_more or reverse:
+                self.next_position = self._position(results[-1])
+            if self.has_cursor and (has_more or not reverse):
+                self.previous_position = self._position(results[0])
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+        return self._link(self.previous_position, reverse=True)
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'The pagination cursor value.',
+            'schema': {'type': 'string'},
+        }]
+
+    def _link(self, position, reverse):
+        cursor = encode_cursor({'p': position, 'r': int(reverse)})
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, cursor
+        )
+
+    def _position(self, obj):
+        return [
+            cursor_value(getattr(obj, field.lstrip('-')))
+            for field in self.ordering
+        ]
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _seek(ordering, position):
+        """
+        Build the row-value comparison that selects rows strictly after
+        `position` in `ordering`, expanded to ORs of ANDs so it works on
+        every backend and mixed sort directions.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+
+class PageNumberOrKeysetPagination(PageNumberPagination):
+    """
+    Default pagination for list views.
+
+    Behaves like `PageNumberPagination` unless the request carries a
+    `cursor` query parameter, in which case the page is served by
+    `KeysetPagination`. Clients opt in by requesting `?cursor=` for the
+    first page and then following the `next` and `previous` links; the
+    response then omits `count` and the view's keyset ordering takes
+    precedence over any `?ordering=` parameter.
+    """
+    keyset_pagination_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        cursor_param = self.keyset_pagination_class.cursor_query_param
+        if cursor_param in request.query_params:
+            self.keyset = self.keyset_pagination_class()
+            self.display_page_controls = False
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return (
+            super().get_schema_operation_parameters(view)
+            + self.keyset_pagination_class().get_schema_operation_parameters(
+                view
+            )
+        )
@@ -0,0 +1,136 @@
+from django.db.models import (
+    BigIntegerField, BooleanField, Exists, OuterRef, Prefetch, Subquery,
+    Value
+)
+from ft_api.counters import count_subquery
+
+# Number of most recent members previewed on each group or event
+RECENT_MEMBERS_SIZE = 5
+
+
+def viewer_relation_id(user, model, user_field='owner', **outer):
+    """
+    Build an annotation resolving the id of the current user's `model` row
+    that points at each object of the outer queryset, such as the user's
+    like on a blog or follow of a profile owner.
+
+    The relation is resolved by a correlated subquery in the same SELECT
+    as the page, so serializers read it from the annotated attribute
+    instead of issuing one query per row.
+
+    Args:
+        user (User): The requesting user.
+        model (Model): The relation model, e.g. BlogLike or Follower.
+        user_field (str): The field on `model` referencing the user.
+        **outer: Maps fields on `model` to the outer field they match,
+            e.g. `blog='pk'` or `followed='owner'`.
+
+    Returns:
+        Expression: The relation id, or None when there is no relation or
+        the user is anonymous.
+    """
+    if not user.is_authenticated:
+        return Value(None, output_field=BigIntegerField())
+    relations = model.objects.filter(
+        **{user_field: user},
+        **{field: OuterRef(ref) for field, ref in outer.items()}
+    ).order_by().values('id')[:1]
+    return Subquery(relations, output_field=BigIntegerField())
+
+
+def viewer_relation_exists(user, model, user_field='user', **outer):
+    """
+    Build an annotation telling whether the current user has a `model` row
+    pointing at each object of the outer queryset, such as a group or
+    event membership.
+
+    Args:
+        user (User): The requesting user.
+        model (Model): The relation model, e.g. Membership.
+        user_field (str): The field on `model` referencing the user.
+        **outer: Maps fields on `model` to the outer field they match,
+            e.g. `group='pk'`.
+
+    Returns:
+        Expression: True if the relation exists, False otherwise or when
+        the user is anonymous.
+    """
+    if not user.is_authenticated:
+        return Value(False, output_field=BooleanField())
+    return Exists(model.objects.filter(
+        **{user_field: user},
+        **{field: OuterRef(ref) for field, ref in outer.items()}
+    ))
+
+
+def embed_authors(queryset, *relations, with_profile=True):
+    """
+    Join the author of each row, and the author's profile, into the same
+    query, loading only the columns the serializers read from them.
+
+    Content serializers expose `owner.username`, `owner.profile.id` and
+    `owner.profile.profile_image.url`; without the join each row lazily
+    loads its User and then its Profile.
+
+    Args:
+        queryset (QuerySet): The queryset to embed the authors into.
+        *relations (str): The user relations to embed, `owner` by default.
+        with_profile (bool): Whether to embed each user's profile too.
+
+    Returns:
+        QuerySet: The queryset with the authors joined.
+    """
+    relations = relations or ('owner',)
+    fields = [
+        field.name for field in queryset.model._meta.concrete_fields
+    ]
+    for relation in relations:
+        fields.append(f'{relation}__username')
+        if with_profile:
+            fields += [
+                f'{relation}__profile__id',
+                f'{relation}__profile__profile_image',
+            ]
+    joins = [
+        f'{relation}__profile' if with_profile else relation
+        for relation in relations
+    ]
+    return queryset.select_related(*joins).only(*fields)
+
+
+def with_members(queryset, user, membership_model, field, flag):
+    """
+    Annotate groups or events with their member count and the current
+    user's membership status, and prefetch a preview of their most
+    recent members into `recent_memberships`.
+
+    The previews of the whole page are loaded by a single query that
+    numbers each row's memberships with a window function and keeps the
+    first `RECENT_MEMBERS_SIZE` of each. The count and the preview are
+    read from the same memberships, so they always agree.
+
+    Args:
+        queryset (QuerySet): The groups or events to annotate.
+        user (User): The requesting user.
+        membership_model (Model): The membership model, e.g. Membership.
+        field (str): The foreign key on `membership_model` pointing at
+            the annotated rows, e.g. 'group'.
+        flag (str): The name of the membership status annotation, e.g.
+            'is_member'.
+
+    Returns:
+        QuerySet: The annotated queryset.
+    """
+    members = membership_model.objects.all()
+    recent = embed_authors(
+        members, 'user', with_profile=False
+    ).order_by('-joined_at', '-id')[:RECENT_MEMBERS_SIZE]
+    accessor = membership_model._meta.get_field(
+        field
+    ).remote_field.get_accessor_name()
+    return queryset.annotate(**{
+        'member_count': count_subquery(membership_model, field, members),
+        flag: viewer_relation_exists(user, membership_model, **{field: 'pk'}),
+    }).prefetch_related(
+        Prefetch(accessor, queryset=recent, to_attr='recent_memberships')
+    )
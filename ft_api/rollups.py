@@ -0,0 +1,166 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateField, F, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+# Periods exercise totals are rolled up by, as accepted by `?period=`
+ROLLUP_PERIODS = ('week', 'month')
+DEFAULT_ROLLUP_PERIOD = 'week'
+
+
+def period_start(period, moment):
+    """
+    Return the first day of the week or month containing `moment`.
+
+    Weeks start on Monday, and datetimes are converted to days in the
+    default time zone, matching the database's `Trunc` functions used by
+    the rebuild.
+
+    Args:
+        period (str): One of `ROLLUP_PERIODS`.
+        moment (date): A date or an aware datetime.
+
+    Returns:
+        date: The first day of the period.
+    """
+    day = moment
+    if isinstance(moment, datetime):
+        day = timezone.localdate(moment)
+    if period == 'week':
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def item_totals(items, key, sign=1, totals=None):
+    """
+    Sum the quantity and the number of items per exercise.
+
+    Args:
+        items (iterable): Mappings or objects with a `quantity` and the
+            exercise `key`.
+        key (str): The name of the exercise key, e.g. 'exercise_name'.
+        sign (int): 1 to add the items to the rollups, -1 to remove them.
+        totals (dict): Totals to add to, as returned by a previous call.
+
+    Returns:
+        dict: Maps each exercise to a `[quantity, items_count]` pair.
+    """
+    if totals is None:
+        totals = defaultdict(lambda: [0, 0])
+    for item in items:
+        if isinstance(item, dict):
+            exercise, quantity = item[key], item['quantity']
+        else:
+            exercise, quantity = getattr(item, key), item.quantity
+        totals[exercise][0] += sign * quantity
+        totals[exercise][1] += sign
+    return totals
+
+
+def adjust_rollups(rollup_model, key, owner_id, moment, totals):
+    """
+    Add quantities to the weekly and monthly rollups of a user's
+    exercises.
+
+    Each rollup row is updated in place with a single `UPDATE`, and
+    created when the user has not logged the exercise in the period yet.
+    A concurrent writer creating the same row first is caught by the
+    unique constraint, in which case the update is retried. Rows are
+    written in a consistent order so concurrent writers cannot deadlock.
+
+    Args:
+        rollup_model (Model): The rollup model, e.g. ExerciseRollup.
+        key (str): The rollup field naming the exercise.
+        owner_id (int): The primary key of the user.
+        moment (datetime): When the workout was logged.
+        totals (dict): Maps each exercise to a `(quantity, items_count)`
+            pair of deltas, as built by `item_totals`.
+    """
+    for period in ROLLUP_PERIODS:
+        start = period_start(period, moment)
+        for exercise, (quantity, items_count) in sorted(totals.items()):
+            if not quantity and not items_count:
+                continue
+            rows = rollup_model.objects.filter(
+                owner_id=owner_id, period=period, period_start=start,
+                **{key: exercise}
+            )
+            updates = {
+                'quantity': F('quantity') + quantity,
+                'items_count': F('items_count') + items_count,
+            }
+            if rows.update(**updates):
+                continue
+            try:
+                with transaction.atomic():
+                    rollup_model.objects.create(
+                        owner_id=owner_id, period=period, period_start=start,
+                        quantity=quantity, items_count=items_count,
+                        **{key: exercise}
+                    )
+            except IntegrityError:
+                rows.update(**updates)
+
+
+def rebuild_rollups(rollup_model, key, items, owner_field, date_field,
+                    batch_size=1000):
+    """
+    Recompute the rollups of every user from their workout items.
+
+    Users are processed in primary key batches: the rollups of a batch
+    are deleted and rebuilt from one aggregate query per period, grouped
+    by user, period and exercise in the database, in one transaction per
+    batch. The history is therefore streamed through in chunks, and no
+    more than one batch of rollups is held in memory or locked at a time.
+
+    Args:
+        rollup_model (Model): The rollup model, e.g. ExerciseRollup.
+        key (str): The field naming the exercise, on both the rollup and
+            the item model.
+        items (QuerySet): The items rolled up, e.g. all workout items.
+        owner_field (str): The path from an item to its user's id, e.g.
+            'workout__owner'.
+        date_field (str): The path from an item to the datetime it was
+            logged at, e.g. 'workout__created_at'.
+        batch_size (int): The number of users rebuilt per transaction.
+
+    Returns:
+        int: The number of rollups written.
+    """
+    users = rollup_model._meta.get_field('owner').related_model
+    attname = rollup_model._meta.get_field(key).attname
+    written = 0
+    last_pk = 0
+    while True:
+        owner_ids = list(
+            users.objects.filter(pk__gt=last_pk).order_by('pk').values_list(
+                'pk', flat=True
+            )[:batch_size]
+        )
+        if not owner_ids:
+            return written
+        with transaction.atomic():
+            rollup_model.objects.filter(owner__in=owner_ids).delete()
+            rollups = []
+            for period in ROLLUP_PERIODS:
+                totals = items.filter(
+                    **{f'{owner_field}__in': owner_ids}
+                ).annotate(
+                    start=Trunc(date_field, period, output_field=DateField())
+                ).values(owner_field, 'start', key).annotate(
+                    total=Sum('quantity'), items_count=Count('pk')
+                ).order_by()
+                rollups += [
+                    rollup_model(
+                        owner_id=row[owner_field], period=period,
+                        period_start=row['start'], quantity=row['total'],
+                        items_count=row['items_count'],
+                        **{attname: row[key]}
+                    )
+                    for row in totals.iterator()
+                ]
+            rollup_model.objects.bulk_create(rollups, batch_size=1000)
+        written += len(rollups)
+        last_pk = owner_ids[-1]
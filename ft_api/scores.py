@@ -0,0 +1,123 @@
+from django.db.models import Case, F, FloatField, Value, When
+from django.utils import timezone
+
+# Score added to a post by each like and each comment
+LIKE_WEIGHT = 1.0
+COMMENT_WEIGHT = 2.0
+# Number of hours after which the weight of an interaction is halved
+HALF_LIFE_HOURS = 24.0
+# Scores decayed below this value are reset to zero and no longer updated
+MIN_SCORE = 0.01
+
+
+def decay_factor(hours, half_life=HALF_LIFE_HOURS):
+    """
+    Return the factor by which a score decays over `hours`.
+    """
+    return 0.5 ** (hours / half_life)
+
+
+def decayed_weight(weight, moment, half_life=HALF_LIFE_HOURS):
+    """
+    Return what is left of the weight of an interaction made at `moment`.
+
+    The stored score holds each interaction's weight decayed by its age,
+    so removing an interaction must subtract the decayed weight rather
+    than the full one, or the weight of newer interactions is removed
+    with it.
+
+    Args:
+        weight (float): The full weight of the interaction.
+        moment (datetime): When the interaction was made, or None if
+            unknown, in which case the full weight is returned.
+        half_life (float): The number of hours after which the weight of
+            an interaction is halved.
+
+    Returns:
+        float: The decayed weight.
+    """
+    if moment is None:
+        return weight
+    hours = max((timezone.now() - moment).total_seconds() / 3600, 0)
+    return weight * decay_factor(hours, half_life)
+
+
+def decay_scores(model, hours, half_life=HALF_LIFE_HOURS, batch_size=1000):
+    """
+    Decay the stored engagement scores of a model by the time elapsed
+    since the last run.
+
+    Likes and comments add their full weight to the stored score when
+    they happen, so multiplying every score by the decay factor at a
+    fixed interval keeps each interaction weighted by its age. Rows are
+    updated in primary key batches, scores that become negligible are
+    reset to zero and rows already at zero are skipped. Removed
+    interactions subtract their decayed weight, see `decayed_weight`, and
+    any negative score left by rounding is reset to zero as well.
+
+    Args:
+        model (Model): The model holding the `score` field, e.g. Blog.
+        hours (float): The number of hours since the last run.
+        half_life (float): The number of hours after which the weight of
+            an interaction is halved.
+        batch_size (int): The number of rows updated per statement.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    factor = decay_factor(hours, half_life)
+    score = Case(
+        When(score__lt=MIN_SCORE / factor, then=Value(0.0)),
+        default=F('score') * factor,
+        output_field=FloatField(),
+    )
+    updated = 0
+    last_pk = 0
+    while True:
+        pks = list(
+            model.objects.filter(pk__gt=last_pk).exclude(score=0).order_by(
+                'pk'
+            ).values_list('pk', flat=True)[:batch_size]
+        )
+        if not pks:
+            return updated
+        updated += model.objects.filter(pk__in=pks).update(score=score)
+        last_pk = pks[-1]
+
+
+def rebuild_scores(model, likes_field, comments_field, batch_size=1000):
+    """
+    Recompute the engagement scores of a model from its stored counters.
+
+    The age of individual likes and comments is not taken into account,
+    every interaction is decayed by the age of the post instead, which
+    approximates the incrementally maintained score.
+
+    Args:
+        model (Model): The model holding the `score` field, e.g. Blog.
+        likes_field (str): The stored like counter of the model.
+        comments_field (str): The stored comment counter of the model.
+        batch_size (int): The number of rows updated per statement.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    now = timezone.now()
+    updated = 0
+    last_pk = 0
+    while True:
+        rows = list(
+            model.objects.filter(pk__gt=last_pk).order_by('pk').only(
+                'pk', 'created_at', likes_field, comments_field
+            )[:batch_size]
+        )
+        if not rows:
+            return updated
+        for row in rows:
+            age = (now - row.created_at).total_seconds() / 3600
+            row.score = decay_factor(age) * (
+                getattr(row, likes_field) * LIKE_WEIGHT
+                + getattr(row, comments_field) * COMMENT_WEIGHT
+            )
+        updated += model.objects.bulk_update(rows, ['score'])
+        last_pk = rows[-1].pk
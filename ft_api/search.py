@@ -0,0 +1,348 @@
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.migrations.operations.base import Operation
+from django.db.models import (
+    BooleanField, CharField, FloatField, Func, Q, Value
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+# Text columns indexed for full-text search on blogs and workouts
+FULLTEXT_FIELDS = ('title', 'content')
+# PostgreSQL text search configuration used to build and query documents
+FULLTEXT_CONFIG = 'english'
+
+
+def fulltext_table(db_table):
+    """
+    Return the name of the SQLite FTS5 table indexing `db_table`.
+    """
+    return f'{db_table}_fts'
+
+
+class CreateFullTextIndex(Operation):
+    """
+    Migration operation creating the full-text index of a model.
+
+    On PostgreSQL it adds a stored, generated `search_vector` tsvector
+    column weighting the first field above the others, with a GIN index,
+    so the database keeps the document up to date on every write. On
+    SQLite it creates an FTS5 table keyed by the model's primary key,
+    filled from the existing rows and kept in sync by the
+    `index_search_document` and `remove_search_document` signals. Other
+    backends are left untouched and fall back to `SearchFilter`.
+    """
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, model_name, fields=FULLTEXT_FIELDS):
+        self.model_name = model_name
+        self.fields = tuple(fields)
+
+    def deconstruct(self):
+        kwargs = {'model_name': self.model_name}
+        if self.fields != FULLTEXT_FIELDS:
+            kwargs['fields'] = list(self.fields)
+        return self.__class__.__qualname__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        table = model._meta.db_table
+        quote = schema_editor.quote_name
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            document = ' || '.join(
+                f"setweight(to_tsvector('{FULLTEXT_CONFIG}', "
+                f"coalesce({quote(field)}, '')), '{'A' if i == 0 else 'B'}')"
+                for i, field in enumerate(self.fields)
+            )
+            schema_editor.execute(
+                f'ALTER TABLE {quote(table)} ADD COLUMN search_vector '
+                f'tsvector GENERATED ALWAYS AS ({document}) STORED'
+            )
+            schema_editor.execute(
+                f'CREATE INDEX {quote(table + "_search_idx")} '
+                f'ON {quote(table)} USING GIN (search_vector)'
+            )
+        elif vendor == 'sqlite':
+            columns = ', '.join(quote(field) for field in self.fields)
+            schema_editor.execute(
+                f'CREATE VIRTUAL TABLE {quote(fulltext_table(table))} '
+                f"USING fts5({columns}, tokenize='porter unicode61')"
+            )
+            schema_editor.execute(
+                f'INSERT INTO {quote(fulltext_table(table))} '
+                f'(rowid, {columns}) '
+                f'SELECT {quote(model._meta.pk.column)}, {columns} '
+                f'FROM {quote(table)}'
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        table = model._meta.db_table
+        quote = schema_editor.quote_name
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            schema_editor.execute(
+                f'DROP INDEX IF EXISTS {quote(table + "_search_idx")}'
+            )
+            schema_editor.execute(
+                f'ALTER TABLE {quote(table)} DROP COLUMN search_vector'
+            )
+        elif vendor == 'sqlite':
+            schema_editor.execute(
+                f'DROP TABLE IF EXISTS {quote(fulltext_table(table))}'
+            )
+
+    def describe(self):
+        return f'Create full-text index on {self.model_name}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'{self.model_name.lower()}_fulltext_index'
+
+
+class CreatePrefixIndex(Operation):
+    """
+    Migration operation creating a case-insensitive prefix index on a
+    text column, serving `istartswith` lookups with an index range scan.
+
+    On PostgreSQL the index is built on `UPPER(column::text)` with
+    `text_pattern_ops`, the exact expression Django compares against
+    for `istartswith`. Such an index cannot return rows in order, so
+    lookups that sort their matches should use `prefix_matches` and a
+    `COLLATE "C"` index instead. On SQLite it uses the NOCASE collation, which
+    lets the LIKE optimization turn the prefix into a range. Other
+    backends are left untouched.
+
+    The model may belong to another app, such as `auth.User`, in which
+    case `app_label` names it and the migration must depend on it.
+    """
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, model_name, field, name, app_label=None):
+        self.model_name = model_name
+        self.field = field
+        self.name = name
+        self.app_label = app_label
+
+    def deconstruct(self):
+        kwargs = {
+            'model_name': self.model_name,
+            'field': self.field,
+            'name': self.name,
+        }
+        if self.app_label:
+            kwargs['app_label'] = self.app_label
+        return self.__class__.__qualname__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        model = to_state.apps.get_model(
+            self.app_label or app_label, self.model_name
+        )
+        table = schema_editor.quote_name(model._meta.db_table)
+        column = schema_editor.quote_name(
+            model._meta.get_field(self.field).column
+        )
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            schema_editor.execute(
+                f'CREATE INDEX {schema_editor.quote_name(self.name)} '
+                f'ON {table} (UPPER({column}::text) text_pattern_ops)'
+            )
+        elif vendor == 'sqlite':
+            schema_editor.execute(
+                f'CREATE INDEX {schema_editor.quote_name(self.name)} '
+                f'ON {table} ({column} COLLATE NOCASE)'
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor in ('postgresql', 'sqlite'):
+            schema_editor.execute(
+                f'DROP INDEX IF EXISTS {schema_editor.quote_name(self.name)}'
+            )
+
+    def describe(self):
+        return f'Create prefix index {self.name} on {self.model_name}'
+
+    @property
+    def migration_name_fragment(self):
+        return self.name.lower()
+
+
+
+class PrefixKey(Func):
+    """
+    The case-insensitive match and sort key of a text column, the
+    expression its prefix index is built on.
+
+    On PostgreSQL the key is `UPPER(column::text) COLLATE "C"`. Its
+    btree order is byte order, so a single index on it serves both the
+    `LIKE` prefix range and the `ORDER BY` of the matches. On SQLite it
+    is the column with the NOCASE collation of its prefix index.
+    """
+    function = 'UPPER'
+    output_field = CharField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template='(UPPER(%(expressions)s::text) COLLATE "C")',
+            **extra_context
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template='(%(expressions)s COLLATE NOCASE)', **extra_context
+        )
+
+
+def prefix_matches(queryset, field, prefix):
+    """
+    Filter a queryset to the rows whose `field` starts with `prefix`,
+    ignoring case, sorted by the same key.
+
+    The filter and the ordering both use `PrefixKey`, so a limited slice
+    of the result is read from the key's index in order and never sorts
+    every match.
+
+    Args:
+        queryset (QuerySet): The rows to search.
+        field (str): The text field to match, e.g. 'owner__username'.
+        prefix (str): The prefix typed by the user.
+
+    Returns:
+        QuerySet: The matching rows, in key order.
+    """
+    return queryset.alias(prefix_key=PrefixKey(field)).filter(
+        prefix_key__startswith=prefix.upper()
+    ).order_by('prefix_key')
+
+def index_search_document(sender, instance, raw=False, using=None,
+                          **kwargs):
+    """
+    Signal to write a saved blog or workout into its SQLite FTS5 table.
+
+    PostgreSQL maintains its generated tsvector column itself, so this is
+    a no-op there.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The instance that was saved.
+        raw (bool): True when the instance is being loaded from a fixture.
+        using (str): The alias of the database the instance was saved to.
+        **kwargs: Additional keyword arguments.
+    """
+    connection = connections[using or 'default']
+    if connection.vendor != 'sqlite':
+        return
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(field) for field in FULLTEXT_FIELDS)
+    placeholders = ', '.join(['%s'] * (len(FULLTEXT_FIELDS) + 1))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT OR REPLACE INTO '
+            f'{quote(fulltext_table(sender._meta.db_table))} '
+            f'(rowid, {columns}) VALUES ({placeholders})',
+            [instance.pk] + [
+                getattr(instance, field) for field in FULLTEXT_FIELDS
+            ]
+        )
+
+
+def remove_search_document(sender, instance, using=None, **kwargs):
+    """
+    Signal to remove a deleted blog or workout from its SQLite FTS5
+    table.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The instance that was deleted.
+        using (str): The alias of the database the instance was deleted
+            from.
+        **kwargs: Additional keyword arguments.
+    """
+    connection = connections[using or 'default']
+    if connection.vendor != 'sqlite':
+        return
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {quote(fulltext_table(sender._meta.db_table))} '
+            f'WHERE rowid = %s',
+            [instance.pk]
+        )
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Search filter backed by the full-text index of the model.
+
+    `?search=` matches the title and content of the posts through the
+    PostgreSQL GIN index or the SQLite FTS5 table, and also returns the
+    posts of the users whose username starts with the search term, a
+    lookup served by the username prefix index. Results are
+    ordered by relevance unless an explicit `?ordering=` is requested.
+    On other backends the view's `search_fields` are used as before.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search = request.query_params.get(self.search_param, '').strip()
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        vendor = connections[queryset.db].vendor
+        table = queryset.model._meta.db_table
+        quote = connections[queryset.db].ops.quote_name
+        pk = f'{quote(table)}.{quote(queryset.model._meta.pk.column)}'
+        if vendor == 'postgresql':
+            query = f"websearch_to_tsquery('{FULLTEXT_CONFIG}', %s)"
+            vector = f'{quote(table)}.search_vector'
+            match = RawSQL(
+                f'{vector} @@ {query}', [search], output_field=BooleanField()
+            )
+            rank = RawSQL(
+                f'ts_rank({vector}, {query})', [search],
+                output_field=FloatField()
+            )
+        elif vendor == 'sqlite':
+            fts = quote(fulltext_table(table))
+            expression = ' '.join(
+                '"{}"'.format(term.replace('"', '""')) for term in terms
+            )
+            match = RawSQL(
+                f'{pk} IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)',
+                [expression], output_field=BooleanField()
+            )
+            rank = RawSQL(
+                f'(SELECT -bm25({fts}) FROM {fts} '
+                f'WHERE {fts} MATCH %s AND rowid = {pk})',
+                [expression], output_field=FloatField()
+            )
+        else:
+            return super().filter_queryset(request, queryset, view)
+
+        owners = User.objects.filter(
+            username__istartswith=search
+        ).values('pk')
+        queryset = queryset.filter(
+            Q(match) | Q(owner__in=owners)
+        ).annotate(search_rank=Coalesce(rank, Value(0.0)))
+        if api_settings.ORDERING_PARAM not in request.query_params:
+            queryset = queryset.order_by('-search_rank', '-created_at')
+        return queryset
@@ -1,6 +1,10 @@
+from django.contrib.humanize.templatetags.humanize import naturaltime
 from dj_rest_auth.serializers import UserDetailsSerializer
 from rest_framework import serializers
 
+# Query parameter selecting how comment timestamps are rendered
+TIMESTAMPS_PARAM = 'timestamps'
+
 
 class CurrentUserSerializer(UserDetailsSerializer):
     """
@@ -40,3 +44,31 @@ class CurrentUserSerializer(UserDetailsSerializer):
         fields = UserDetailsSerializer.Meta.fields + (
             'profile_id', 'profile_image', 'is_staff', 'is_superuser'
         )
+
+
+class NaturalTimeField(serializers.DateTimeField):
+    """
+    Read-only datetime field rendered in natural time, such as "2 hours
+    ago".
+
+    Requests with `?timestamps=iso` get the ISO 8601 value instead, so
+    clients rendering long comment threads can humanize the times
+    themselves and the server skips the per-row `naturaltime()` call.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        kwargs.setdefault('format', 'iso-8601')
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        request = self.context.get('request')
+        self.iso = request is not None and request.query_params.get(
+            TIMESTAMPS_PARAM
+        ) == 'iso'
+
+    def to_representation(self, value):
+        if self.iso:
+            return super().to_representation(value)
+        return naturaltime(value)
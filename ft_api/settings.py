@@ -35,7 +35,7 @@ REST_FRAMEWORK = {
         else 'dj_rest_auth.jwt_auth.JWTCookieAuthentication'
     )],
     'DEFAULT_PAGINATION_CLASS':
-        'rest_framework.pagination.PageNumberPagination',
+        'ft_api.pagination.PageNumberOrKeysetPagination',
     'PAGE_SIZE': 10,
     'DATETIME_FORMAT': '%d %b %Y',
 }
@@ -103,6 +103,7 @@ INSTALLED_APPS = [
     'groups',
     'group_events',
     'feed',
+    'counters',
 ]
 
 SITE_ID = 1
@@ -175,6 +176,27 @@ else:
         'default': dj_database_url.parse(os.environ.get("DATABASE_URL"))
     }
 
+# Cache shared by every web process, so that rankings such as trending
+# posts are computed once per hour rather than once per process. The
+# table is created by `createcachetable` in the release phase.
+if 'DEV' in os.environ:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'ft_api_cache',
+        }
+    }
+
+# Buffer like and comment counter updates in the CounterDelta table, to be
+# applied by the flush_counters worker, instead of updating the rows inline
+COUNTER_BUFFER = 'COUNTER_BUFFER' in os.environ
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
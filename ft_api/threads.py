@@ -0,0 +1,74 @@
+from django.db.models import Prefetch, Q
+
+# Width of the zero-padded id of each comment in a materialized path
+PATH_STEP = 10
+# Deepest reply level allowed, bounded by the length of the path column
+MAX_THREAD_DEPTH = 25
+PATH_LENGTH = PATH_STEP * MAX_THREAD_DEPTH
+# Number of replies inlined under each top-level comment
+REPLY_PREVIEW_SIZE = 3
+
+
+def thread_path(parent, pk):
+    """
+    Build the materialized path of a comment.
+
+    The path is the path of the parent followed by the comment's own id,
+    zero-padded to `PATH_STEP` digits, so sorting comments by path lists
+    every thread depth first, in creation order, and the replies of a
+    comment are exactly the comments whose path starts with its own.
+
+    Args:
+        parent (Model): The parent comment, or None for a top-level one.
+        pk (int): The primary key of the comment.
+
+    Returns:
+        str: The materialized path.
+    """
+    prefix = parent.path if parent is not None else ''
+    return f'{prefix}{pk:0{PATH_STEP}d}'
+
+
+def subtree(path):
+    """
+    Build the condition selecting a comment and all of its replies.
+
+    The subtree is expressed as the half-open range from the comment's
+    path to the path of its next sibling, rather than a prefix match, so
+    it is served by a plain index on the path column whatever the
+    collation of the database.
+
+    Args:
+        path (str): The materialized path of the comment.
+
+    Returns:
+        Q: The range condition on `path`.
+    """
+    sibling = int(path[-PATH_STEP:]) + 1
+    return Q(
+        path__gte=path,
+        path__lt=f'{path[:-PATH_STEP]}{sibling:0{PATH_STEP}d}',
+    )
+
+
+def first_replies(queryset, size=REPLY_PREVIEW_SIZE):
+    """
+    Prefetch the first direct replies of each comment of a page into
+    `first_replies`.
+
+    The replies of the whole page are loaded by a single query that
+    numbers each comment's replies with a window function and keeps the
+    first `size` of each.
+
+    Args:
+        queryset (QuerySet): The replies to prefetch from, with the
+            authors embedded.
+        size (int): The number of replies kept per comment.
+
+    Returns:
+        Prefetch: The prefetch of the `replies` relation.
+    """
+    return Prefetch(
+        'replies', queryset=queryset.order_by('path')[:size],
+        to_attr='first_replies'
+    )
@@ -0,0 +1,182 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from ft_api.scores import COMMENT_WEIGHT, LIKE_WEIGHT
+
+# Trending windows accepted by the `?window=` parameter, in hours
+TRENDING_WINDOWS = {'24h': 24, '7d': 24 * 7}
+DEFAULT_TRENDING_WINDOW = '24h'
+# Number of posts ranked on each leaderboard
+TRENDING_SIZE = 20
+
+
+def bucket_hour(moment=None):
+    """
+    Return the start of the hourly bucket containing `moment`, or the
+    current one.
+    """
+    moment = moment or timezone.now()
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def record_activity(bucket_model, field, pk, **deltas):
+    """
+    Add likes or comments to the current hourly bucket of a post.
+
+    The bucket is updated in place with a single `UPDATE`, and created
+    when the post has had no activity yet this hour. A concurrent writer
+    creating the same bucket first is caught by the unique constraint,
+    in which case the update is retried.
+
+    Args:
+        bucket_model (Model): The bucket model, e.g. BlogActivity.
+        field (str): The bucket's foreign key to the post, e.g. 'blog'.
+        pk (int): The primary key of the post.
+        **deltas: Maps bucket counter names to the amount to add.
+    """
+    hour = bucket_hour()
+    buckets = bucket_model.objects.filter(**{f'{field}_id': pk}, hour=hour)
+    updates = {name: F(name) + delta for name, delta in deltas.items()}
+    if buckets.update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            bucket_model.objects.create(
+                **{f'{field}_id': pk}, hour=hour, **deltas
+            )
+    except IntegrityError:
+        buckets.update(**updates)
+
+
+def trending_window(request):
+    """
+    Return the trending window requested with `?window=`.
+
+    Raises:
+        ValidationError: If the window is not one of `TRENDING_WINDOWS`.
+    """
+    window = request.query_params.get('window', DEFAULT_TRENDING_WINDOW)
+    if window not in TRENDING_WINDOWS:
+        raise ValidationError({
+            'window': f'Choose one of {", ".join(TRENDING_WINDOWS)}.'
+        })
+    return window
+
+
+def trending_key(bucket_model, window, size, hour):
+    """
+    Return the cache key of a ranking for an hourly bucket.
+    """
+    return (
+        f'trending:{bucket_model._meta.label_lower}:{window}:{size}:'
+        f'{hour.isoformat()}'
+    )
+
+
+def rank_posts(bucket_model, field, window, size, hour):
+    """
+    Rank posts by their likes and comments over the window ending with
+    the bucket of `hour`.
+
+    Args:
+        bucket_model (Model): The bucket model, e.g. BlogActivity.
+        field (str): The bucket's foreign key to the post, e.g. 'blog'.
+        window (str): A key of `TRENDING_WINDOWS`.
+        size (int): The number of posts to rank.
+        hour (datetime): The start of the latest bucket in the window.
+
+    Returns:
+        list: The primary keys of the top posts, best first.
+    """
+    since = hour - timedelta(hours=TRENDING_WINDOWS[window] - 1)
+    return list(
+        bucket_model.objects.filter(hour__gte=since).values(field).annotate(
+            activity=Sum(
+                F('likes_count') * LIKE_WEIGHT
+                + F('comments_count') * COMMENT_WEIGHT
+            )
+        ).order_by('-activity', field).values_list(field, flat=True)[:size]
+    )
+
+
+def trending_ids(bucket_model, field, window, size=TRENDING_SIZE):
+    """
+    Return the cached ranking of posts over a trailing window.
+
+    The window covers the current hourly bucket and the buckets before
+    it. Rankings are computed ahead of time by `refresh_trending` when
+    the bucket rolls and cached until the next one, so requests only
+    read the cache; a ranking missing from the cache is computed and
+    cached by the first request that needs it.
+
+    Args:
+        bucket_model (Model): The bucket model, e.g. BlogActivity.
+        field (str): The bucket's foreign key to the post, e.g. 'blog'.
+        window (str): A key of `TRENDING_WINDOWS`.
+        size (int): The number of posts to rank.
+
+    Returns:
+        list: The primary keys of the top posts, best first.
+    """
+    hour = bucket_hour()
+    key = trending_key(bucket_model, window, size, hour)
+    ranking = cache.get(key)
+    if ranking is None:
+        ranking = rank_posts(bucket_model, field, window, size, hour)
+        cache.set(key, ranking, 60 * 60)
+    return ranking
+
+
+def refresh_trending(bucket_model, field, size=TRENDING_SIZE):
+    """
+    Compute and cache the rankings of every trending window for the
+    current hourly bucket.
+
+    Meant to run when the bucket rolls, at the start of each hour, so
+    that requests find the new rankings already cached.
+
+    Args:
+        bucket_model (Model): The bucket model, e.g. BlogActivity.
+        field (str): The bucket's foreign key to the post, e.g. 'blog'.
+        size (int): The number of posts to rank.
+
+    Returns:
+        int: The number of rankings cached.
+    """
+    hour = bucket_hour()
+    for window in TRENDING_WINDOWS:
+        cache.set(
+            trending_key(bucket_model, window, size, hour),
+            rank_posts(bucket_model, field, window, size, hour),
+            60 * 60
+        )
+    return len(TRENDING_WINDOWS)
+
+
+def prune_buckets(bucket_model, batch_size=1000):
+    """
+    Delete the hourly buckets that fall outside the longest window.
+
+    Args:
+        bucket_model (Model): The bucket model, e.g. BlogActivity.
+        batch_size (int): The number of buckets deleted per statement.
+
+    Returns:
+        int: The number of buckets deleted.
+    """
+    since = bucket_hour() - timedelta(
+        hours=max(TRENDING_WINDOWS.values()) - 1
+    )
+    deleted = 0
+    while True:
+        pks = list(
+            bucket_model.objects.filter(hour__lt=since).values_list(
+                'pk', flat=True
+            )[:batch_size]
+        )
+        if not pks:
+            return deleted
+        deleted += bucket_model.objects.filter(pk__in=pks).delete()[0]
@@ -1,10 +1,19 @@
-from rest_framework.decorators import api_view
+from rest_framework import permissions
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from blog_likes.models import BlogLike
+from followers.models import Follower
+from groups.models import Membership
+from workout_likes.models import WorkoutLike
 from .settings import (
     JWT_AUTH_COOKIE, JWT_AUTH_REFRESH_COOKIE, JWT_AUTH_SAMESITE,
     JWT_AUTH_SECURE,
 )
 
+# Maximum number of ids accepted per object type by the relations endpoint
+MAX_RELATION_IDS = 500
+
 
 @api_view()
 def root_route(request):
@@ -52,3 +61,82 @@ def logout_route(request):
         secure=JWT_AUTH_SECURE,
     )
     return response
+
+
+def relation_ids(request, name):
+    """
+    Parse the comma-separated ids of one object type from the query
+    parameters of the relations endpoint.
+
+    Raises:
+        ValidationError: If an id is not an integer or there are more
+            than `MAX_RELATION_IDS` of them.
+
+    Returns:
+        list: The unique ids, in the order they were given.
+    """
+    value = request.query_params.get(name, '')
+    try:
+        ids = list(dict.fromkeys(
+            int(pk) for pk in value.split(',') if pk.strip()
+        ))
+    except ValueError:
+        raise ValidationError({name: 'Enter a comma-separated list of ids.'})
+    if len(ids) > MAX_RELATION_IDS:
+        raise ValidationError(
+            {name: f'Enter at most {MAX_RELATION_IDS} ids.'}
+        )
+    return ids
+
+
+@api_view()
+@permission_classes([permissions.IsAuthenticated])
+def relations_route(request):
+    """
+    Relations endpoint of the FitTribe Backend API.
+
+    Returns the current user's relations to the blogs, workouts, profiles
+    and groups whose ids are given as comma-separated `?blogs=`,
+    `?workouts=`, `?profiles=` and `?groups=` lists, so clients caching
+    those objects can refresh the viewer's state without refetching
+    them. Each type is resolved by one query, served by the unique
+    (owner, blog) and (owner, workout) like indexes, the unique (owner,
+    followed) follower index and the membership user index.
+
+    Returns:
+        Response: For each requested type, a mapping of every requested
+        id to the like ID (`blogs`, `workouts`), follow ID (`profiles`)
+        or membership flag (`groups`), null or false when there is none.
+    """
+    user = request.user
+    data = {}
+
+    blog_ids = relation_ids(request, 'blogs')
+    if blog_ids:
+        likes = dict(BlogLike.objects.filter(
+            owner=user, blog__in=blog_ids
+        ).values_list('blog', 'id'))
+        data['blogs'] = {pk: likes.get(pk) for pk in blog_ids}
+
+    workout_ids = relation_ids(request, 'workouts')
+    if workout_ids:
+        likes = dict(WorkoutLike.objects.filter(
+            owner=user, workout__in=workout_ids
+        ).values_list('workout', 'id'))
+        data['workouts'] = {pk: likes.get(pk) for pk in workout_ids}
+
+    profile_ids = relation_ids(request, 'profiles')
+    if profile_ids:
+        follows = dict(Follower.objects.filter(
+            owner=user, followed__profile__in=profile_ids
+        ).values_list('followed__profile', 'id'))
+        data['profiles'] = {pk: follows.get(pk) for pk in profile_ids}
+
+    group_ids = relation_ids(request, 'groups')
+    if group_ids:
+        memberships = set(Membership.objects.filter(
+            user=user, group__in=group_ids
+        ).values_list('group', flat=True))
+        data['groups'] = {pk: pk in memberships for pk in group_ids}
+
+    return Response(data)
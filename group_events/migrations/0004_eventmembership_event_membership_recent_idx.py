@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('group_events', '0003_alter_groupevent_options_groupevent_end_date_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventmembership',
+            index=models.Index(fields=['event', '-joined_at', '-id'], name='event_membership_recent_idx'),
+        ),
+    ]
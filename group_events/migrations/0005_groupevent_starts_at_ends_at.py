@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('group_events', '0004_eventmembership_event_membership_recent_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupevent',
+            name='starts_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='groupevent',
+            name='ends_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
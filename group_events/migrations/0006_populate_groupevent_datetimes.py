@@ -0,0 +1,36 @@
+from django.db import migrations
+from group_events.models import event_datetime
+
+
+def populate_event_datetimes(apps, schema_editor):
+    """
+    Fill in the combined start and end datetimes of existing events.
+    """
+    GroupEvent = apps.get_model('group_events', 'GroupEvent')
+    last_pk = 0
+    while True:
+        events = list(
+            GroupEvent.objects.filter(pk__gt=last_pk).order_by('pk')[:1000]
+        )
+        if not events:
+            return
+        for event in events:
+            event.starts_at = event_datetime(
+                event.start_date, event.start_time
+            )
+            event.ends_at = event_datetime(event.end_date, event.end_time)
+        GroupEvent.objects.bulk_update(events, ['starts_at', 'ends_at'])
+        last_pk = events[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('group_events', '0005_groupevent_starts_at_ends_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_event_datetimes, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('group_events', '0006_populate_groupevent_datetimes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='groupevent',
+            name='starts_at',
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name='groupevent',
+            name='ends_at',
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='groupevent',
+            index=models.Index(
+                fields=['group', 'starts_at'],
+                name='group_event_calendar_idx'
+            ),
+        ),
+    ]
@@ -1,7 +1,33 @@
+from datetime import datetime, timedelta
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 from groups.models import Group
 
+# Longest an event may last, which bounds the calendar's range scans
+MAX_EVENT_DURATION = timedelta(days=31)
+
+
+def event_datetime(date, time):
+    """
+    Combine an event date and time into an aware datetime.
+
+    Event dates and times are entered without a timezone, so they are
+    interpreted in the site's default timezone.
+
+    Args:
+        date (date or str): The date of the event.
+        time (time or str): The time of the event.
+
+    Returns:
+        datetime: The aware datetime.
+    """
+    date = models.DateField().to_python(date)
+    time = models.TimeField().to_python(time)
+    return timezone.make_aware(
+        datetime.combine(date, time), timezone.get_default_timezone()
+    )
+
 
 class GroupEvent(models.Model):
     """
@@ -16,6 +42,10 @@ class GroupEvent(models.Model):
         start_time (TimeField): The start time of the event.
         end_date (DateField): The end date of the event.
         end_time (TimeField): The end time of the event.
+        starts_at (DateTimeField): The start date and time combined, kept
+                                   in sync by `save()` for range queries.
+        ends_at (DateTimeField): The end date and time combined, kept in
+                                 sync by `save()` for range queries.
         banner (ImageField): An optional banner image for the event.
         created_at (DateTimeField): The date and time when the event was
                                     created.
@@ -32,6 +62,8 @@ class GroupEvent(models.Model):
     start_time = models.TimeField(default='00:00:00')
     end_date = models.DateField(default='2024-01-01')
     end_time = models.TimeField(default='00:00:00')
+    starts_at = models.DateTimeField(editable=False)
+    ends_at = models.DateTimeField(editable=False)
     banner = models.ImageField(
         upload_to='event_banners/', blank=True, null=True
     )
@@ -40,12 +72,33 @@ class GroupEvent(models.Model):
 
     class Meta:
         ordering = ['-start_date', '-start_time']
+        indexes = [
+            models.Index(
+                fields=['group', 'starts_at'],
+                name='group_event_calendar_idx'
+            ),
+        ]
         verbose_name = 'Group Event'
         verbose_name_plural = 'Group Events'
 
     def __str__(self):
         return f'{self.name} ({self.group.name})'
 
+    def save(self, *args, **kwargs):
+        """
+        Sync `starts_at` and `ends_at` with the date and time fields
+        before saving. Queryset `update()` calls bypass this and must
+        set them explicitly.
+        """
+        self.starts_at = event_datetime(self.start_date, self.start_time)
+        self.ends_at = event_datetime(self.end_date, self.end_time)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {
+                *update_fields, 'starts_at', 'ends_at'
+            }
+        super().save(*args, **kwargs)
+
 
 class EventMembership(models.Model):
     """
@@ -58,6 +111,12 @@ class EventMembership(models.Model):
     class Meta:
         unique_together = ('user', 'event')
         ordering = ['-joined_at']
+        indexes = [
+            models.Index(
+                fields=['event', '-joined_at', '-id'],
+                name='event_membership_recent_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.user.username} joined {self.event.name}'
@@ -1,5 +1,8 @@
 from rest_framework import serializers
-from .models import GroupEvent, EventMembership
+from ft_api.querysets import RECENT_MEMBERS_SIZE
+from .models import (
+    MAX_EVENT_DURATION, EventMembership, GroupEvent, event_datetime
+)
 
 
 class EventMembershipSerializer(serializers.ModelSerializer):
@@ -15,13 +18,53 @@ class EventMembershipSerializer(serializers.ModelSerializer):
 
 class GroupEventSerializer(serializers.ModelSerializer):
     """
-    Serializer for the GroupEvent model.
+    Serializer for the GroupEvent model, including the number of users
+    who joined the event and a preview of the most recent ones. The full
+    attendee list is served, paginated, by the event attendees endpoint.
     """
-    memberships = EventMembershipSerializer(
-        source='eventmembership_set', many=True, read_only=True
-    )
+    starts_at = serializers.DateTimeField(read_only=True, format='iso-8601')
+    ends_at = serializers.DateTimeField(read_only=True, format='iso-8601')
+    member_count = serializers.SerializerMethodField()
+    recent_members = serializers.SerializerMethodField()
     is_joined = serializers.SerializerMethodField()
 
+    def get_member_count(self, obj):
+        """
+        Get the number of users who joined the event.
+
+        The views annotate the count for the whole page, the query below
+        is only used for events that were not annotated.
+
+        Args:
+            obj (GroupEvent): The event object being serialized.
+
+        Returns:
+            int: The number of users who joined the event.
+        """
+        if hasattr(obj, 'member_count'):
+            return obj.member_count
+        return obj.eventmembership_set.count()
+
+    def get_recent_members(self, obj):
+        """
+        Get the most recent memberships of the event.
+
+        The views prefetch the previews of the whole page in one query,
+        the query below is only used for events that were not prefetched.
+
+        Args:
+            obj (GroupEvent): The event object being serialized.
+
+        Returns:
+            list: The serialized memberships, newest first.
+        """
+        memberships = getattr(obj, 'recent_memberships', None)
+        if memberships is None:
+            memberships = obj.eventmembership_set.select_related(
+                'user'
+            ).order_by('-joined_at', '-id')[:RECENT_MEMBERS_SIZE]
+        return EventMembershipSerializer(memberships, many=True).data
+
     def get_is_joined(self, obj):
         """
         Determine if the current user is a member of the event.
@@ -33,6 +76,8 @@ class GroupEventSerializer(serializers.ModelSerializer):
             bool: True if the current user is a member of the event,
                   False otherwise.
         """
+        if hasattr(obj, 'is_joined'):
+            return obj.is_joined
         request = self.context.get('request', None)
         if request is not None and request.user.is_authenticated:
             return EventMembership.objects.filter(
@@ -80,10 +125,38 @@ class GroupEventSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def validate(self, data):
+        """
+        Check that the event lasts no longer than `MAX_EVENT_DURATION`,
+        so the calendar can bound its scan of events starting before the
+        window.
+
+        Raises:
+            serializers.ValidationError: If the event is too long.
+        """
+        values = {}
+        for name in ('start_date', 'start_time', 'end_date', 'end_time'):
+            if name in data:
+                values[name] = data[name]
+            elif self.instance is not None:
+                values[name] = getattr(self.instance, name)
+            else:
+                values[name] = GroupEvent._meta.get_field(name).get_default()
+        duration = event_datetime(
+            values['end_date'], values['end_time']
+        ) - event_datetime(values['start_date'], values['start_time'])
+        if duration > MAX_EVENT_DURATION:
+            raise serializers.ValidationError({
+                'end_date': 'Events cannot last longer than '
+                            f'{MAX_EVENT_DURATION.days} days.'
+            })
+        return data
+
     class Meta:
         model = GroupEvent
         fields = [
             'id', 'group', 'name', 'description', 'location', 'start_date',
-            'start_time', 'end_date', 'end_time', 'banner', 'created_at',
-            'updated_at', 'memberships', 'is_joined'
+            'start_time', 'end_date', 'end_time', 'starts_at', 'ends_at',
+            'banner', 'created_at', 'updated_at', 'member_count',
+            'recent_members', 'is_joined'
         ]
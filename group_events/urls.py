@@ -1,5 +1,8 @@
 from django.urls import path
-from .views import GroupEventList, GroupEventDetail, JoinEvent, LeaveEvent
+from .views import (
+    GroupEventAttendeeList, GroupEventCalendar, GroupEventDetail,
+    GroupEventList, JoinEvent, LeaveEvent
+)
 
 urlpatterns = [
     path(
@@ -7,11 +10,21 @@ urlpatterns = [
         GroupEventList.as_view(),
         name='group-event-list'
     ),
+    path(
+        'group-events/calendar/',
+        GroupEventCalendar.as_view(),
+        name='group-event-calendar'
+    ),
     path(
         'group-events/<int:pk>/',
         GroupEventDetail.as_view(),
         name='group-event-detail'
     ),
+    path(
+        'group-events/<int:pk>/attendees/',
+        GroupEventAttendeeList.as_view(),
+        name='group-event-attendees'
+    ),
     path(
         'group-events/<int:pk>/join/',
         JoinEvent.as_view(),
@@ -1,9 +1,16 @@
+from datetime import datetime, time, timedelta
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.db import IntegrityError, DatabaseError
-from .models import GroupEvent, EventMembership
-from .serializers import GroupEventSerializer
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from .models import MAX_EVENT_DURATION, GroupEvent, EventMembership
+from groups.models import Membership
+from .serializers import EventMembershipSerializer, GroupEventSerializer
 from ft_api.permissions import IsAdminOrReadOnly
+from ft_api.querysets import embed_authors, with_members
 
 
 class GroupEventList(generics.ListCreateAPIView):
@@ -15,17 +22,111 @@ class GroupEventList(generics.ListCreateAPIView):
     """
     serializer_class = GroupEventSerializer
     permission_classes = [IsAdminOrReadOnly]
+    keyset_ordering = ('-start_date', '-start_time', '-id')
 
     def get_queryset(self):
+        queryset = with_members(
+            GroupEvent.objects.all(), self.request.user, EventMembership,
+            'event', 'is_joined'
+        )
         group_id = self.request.query_params.get('group')
         if group_id:
-            return GroupEvent.objects.filter(group_id=group_id)
-        return GroupEvent.objects.all()
+            return queryset.filter(group_id=group_id)
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save()
 
 
+class GroupEventCalendar(generics.ListAPIView):
+    """
+    API view to list the events of the current user's groups within a
+    date window.
+
+    - GET: Returns the events overlapping `?start=` to `?end=`, ordered by
+      start. Both accept a date or a datetime; a date-only `end` includes
+      the whole day. The window defaults to the next 7 days and is
+      limited to 92 days.
+    """
+    serializer_class = GroupEventSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = ('starts_at', 'id')
+    default_window = timedelta(days=7)
+    max_window = timedelta(days=92)
+
+    def parse_bound(self, name, default, inclusive=False):
+        """
+        Parse a window bound from the query parameters.
+
+        Args:
+            name (str): The query parameter holding the bound.
+            default (datetime): The bound used when it is not given.
+            inclusive (bool): Whether a date-only bound covers the whole
+                day, i.e. resolves to midnight of the following day.
+
+        Raises:
+            ValidationError: If the value is not a date or a datetime.
+
+        Returns:
+            datetime: The aware bound.
+        """
+        value = self.request.query_params.get(name)
+        if not value:
+            return default
+        try:
+            day = parse_date(value)
+            if day is not None:
+                if inclusive:
+                    day += timedelta(days=1)
+                bound = datetime.combine(day, time.min)
+            else:
+                bound = parse_datetime(value)
+                if bound is None:
+                    raise ValueError
+        except ValueError:
+            raise ValidationError({name: 'Enter a valid date or datetime.'})
+        if timezone.is_naive(bound):
+            bound = timezone.make_aware(
+                bound, timezone.get_default_timezone()
+            )
+        return bound
+
+    def get_queryset(self):
+        """
+        Returns the events of the user's groups overlapping the window.
+
+        The groups are matched by a semi-join on the user's memberships,
+        so an event is listed once however many memberships point at its
+        group, and each group's events are read by a range scan over the
+        (group, starts_at) index. Events last at most
+        `MAX_EVENT_DURATION`, so the scan starts that long before the
+        window rather than at the start of the group's history.
+        """
+        start = self.parse_bound('start', timezone.now())
+        end = self.parse_bound(
+            'end', start + self.default_window, inclusive=True
+        )
+        if end <= start:
+            raise ValidationError({'end': 'End must be after start.'})
+        if end - start > self.max_window:
+            raise ValidationError(
+                {'end': f'The window is limited to {self.max_window.days} '
+                        'days.'}
+            )
+        groups = Membership.objects.filter(
+            user=self.request.user
+        ).values('group')
+        return with_members(
+            GroupEvent.objects.filter(
+                group__in=groups,
+                starts_at__gte=start - MAX_EVENT_DURATION,
+                starts_at__lt=end,
+                ends_at__gte=start
+            ),
+            self.request.user, EventMembership, 'event', 'is_joined'
+        ).order_by('starts_at', 'id')
+
+
 class GroupEventDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     API view to retrieve, update, or delete a group event.
@@ -40,6 +141,16 @@ class GroupEventDetail(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = GroupEventSerializer
     permission_classes = [IsAdminOrReadOnly]
 
+    def get_queryset(self):
+        """
+        Annotates the event with its member count, attendee preview and
+        the current user's membership status.
+        """
+        return with_members(
+            super().get_queryset(), self.request.user, EventMembership,
+            'event', 'is_joined'
+        )
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context.update({"request": self.request})
@@ -102,3 +213,21 @@ class LeaveEvent(generics.GenericAPIView):
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class GroupEventAttendeeList(generics.ListAPIView):
+    """
+    API view to list the users who joined a group event.
+
+    - GET: Returns the memberships of the event, newest first.
+    """
+    serializer_class = EventMembershipSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    keyset_ordering = ('-joined_at', '-id')
+
+    def get_queryset(self):
+        event = get_object_or_404(GroupEvent, pk=self.kwargs['pk'])
+        return embed_authors(
+            EventMembership.objects.filter(event=event), 'user',
+            with_profile=False
+        ).order_by('-joined_at', '-id')
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0002_alter_membership_unique_together'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['group', '-joined_at', '-id'], name='membership_recent_idx'),
+        ),
+    ]
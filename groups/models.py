@@ -64,6 +64,10 @@ class Membership(models.Model):
         joined_at (DateTimeField): The date and time when the user
         joined the group.
 
+    Meta:
+        indexes: Memberships of a group are indexed by join date, newest
+        first, for the member previews and the paginated member list.
+
     Methods:
         __str__(): Returns a string representation of the membership.
     """
@@ -71,5 +75,13 @@ class Membership(models.Model):
     group = models.ForeignKey(Group, on_delete=models.CASCADE)
     joined_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['group', '-joined_at', '-id'],
+                name='membership_recent_idx'
+            ),
+        ]
+
     def __str__(self):
         return f'{self.user.username} joined {self.group.name}'
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from ft_api.querysets import RECENT_MEMBERS_SIZE
 from .models import Group, Membership
 
 
@@ -17,16 +18,54 @@ class MembershipSerializer(serializers.ModelSerializer):
 
 class GroupSerializer(serializers.ModelSerializer):
     """
-    Serializer for the Group model, including a list of members and their
-    memberships.
+    Serializer for the Group model, including the number of members and a
+    preview of the most recent memberships. The full member list is
+    served, paginated, by the group members endpoint.
 
     This serializer validates the banner and group logo images to ensure
     they meet the specified size and dimension requirements.
     """
-    memberships = MembershipSerializer(
-        source='membership_set', many=True, read_only=True)
+    member_count = serializers.SerializerMethodField()
+    recent_members = serializers.SerializerMethodField()
     is_member = serializers.SerializerMethodField()
 
+    def get_member_count(self, obj):
+        """
+        Get the number of members of the group.
+
+        The views annotate the count for the whole page, the query below
+        is only used for groups that were not annotated.
+
+        Args:
+            obj (Group): The group object being serialized.
+
+        Returns:
+            int: The number of members of the group.
+        """
+        if hasattr(obj, 'member_count'):
+            return obj.member_count
+        return obj.membership_set.count()
+
+    def get_recent_members(self, obj):
+        """
+        Get the most recent memberships of the group.
+
+        The views prefetch the previews of the whole page in one query,
+        the query below is only used for groups that were not prefetched.
+
+        Args:
+            obj (Group): The group object being serialized.
+
+        Returns:
+            list: The serialized memberships, newest first.
+        """
+        memberships = getattr(obj, 'recent_memberships', None)
+        if memberships is None:
+            memberships = obj.membership_set.select_related(
+                'user'
+            ).order_by('-joined_at', '-id')[:RECENT_MEMBERS_SIZE]
+        return MembershipSerializer(memberships, many=True).data
+
     def get_is_member(self, obj):
         """
         Determine if the current user is a member of the group.
@@ -38,6 +77,8 @@ class GroupSerializer(serializers.ModelSerializer):
             bool: True if the current user is a member of the group,
                 False otherwise.
         """
+        if hasattr(obj, 'is_member'):
+            return obj.is_member
         request = self.context.get('request', None)
         if request is not None and request.user.is_authenticated:
             return Membership.objects.filter(
@@ -135,5 +176,6 @@ class GroupSerializer(serializers.ModelSerializer):
         model = Group
         fields = [
             'id', 'name', 'description', 'updated_at', 'created_at',
-            'banner', 'group_logo', 'memberships', 'is_member'
+            'banner', 'group_logo', 'member_count', 'recent_members',
+            'is_member'
         ]
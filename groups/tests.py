@@ -1,3 +1,51 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from .models import Group, Membership
 
-# Create your tests here.
+
+class GroupListQueryCountTests(APITestCase):
+    """
+    Tests that listing groups costs the same number of queries however
+    many groups and members appear on the page, and that each group's
+    member count agrees with its member preview.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(self.user)
+
+    def create_groups(self, count, members):
+        for index in range(count):
+            group = Group.objects.create(
+                name=f'Group {index}', description='Description'
+            )
+            for member in range(members):
+                Membership.objects.create(
+                    group=group,
+                    user=User.objects.create(
+                        username=f'member{count}-{index}-{member}'
+                    )
+                )
+
+    def count_list_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/groups/')
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_query_count_is_flat_across_page_sizes(self):
+        self.create_groups(2, 1)
+        small_page = self.count_list_queries()
+        Group.objects.all().delete()
+        self.create_groups(10, 6)
+        full_page = self.count_list_queries()
+        self.assertEqual(small_page, full_page)
+
+    def test_member_count_matches_preview(self):
+        self.create_groups(1, 2)
+        User.objects.filter(username='member1-0-0').update(is_active=False)
+        group = self.client.get('/groups/').data['results'][0]
+        self.assertEqual(group['member_count'], 2)
+        self.assertEqual(len(group['recent_members']), 2)
@@ -1,9 +1,11 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from django.db import IntegrityError, DatabaseError
+from django.shortcuts import get_object_or_404
 from .models import Group, Membership
 from .serializers import GroupSerializer, MembershipSerializer
 from ft_api.permissions import IsAdminOrReadOnly
+from ft_api.querysets import embed_authors, with_members
 
 
 class GroupList(generics.ListCreateAPIView):
@@ -17,6 +19,16 @@ class GroupList(generics.ListCreateAPIView):
     serializer_class = GroupSerializer
     permission_classes = [IsAdminOrReadOnly]
 
+    def get_queryset(self):
+        """
+        Annotates the groups with their member count, member preview and
+        the current user's membership status.
+        """
+        return with_members(
+            super().get_queryset(), self.request.user, Membership, 'group',
+            'is_member'
+        )
+
     def perform_create(self, serializer):
         serializer.save()
 
@@ -35,6 +47,16 @@ class GroupDetail(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = GroupSerializer
     permission_classes = [IsAdminOrReadOnly]
 
+    def get_queryset(self):
+        """
+        Annotates the groups with their member count, member preview and
+        the current user's membership status.
+        """
+        return with_members(
+            super().get_queryset(), self.request.user, Membership, 'group',
+            'is_member'
+        )
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context.update({"request": self.request})
@@ -109,6 +131,25 @@ class MembershipList(generics.ListAPIView):
     """
     serializer_class = MembershipSerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = ('-joined_at', '-id')
 
     def get_queryset(self):
         return Membership.objects.filter(user=self.request.user)
+
+
+class GroupMemberList(generics.ListAPIView):
+    """
+    API view to list the members of a group.
+
+    - GET: Returns the memberships of the group, newest first.
+    """
+    serializer_class = MembershipSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    keyset_ordering = ('-joined_at', '-id')
+
+    def get_queryset(self):
+        group = get_object_or_404(Group, pk=self.kwargs['pk'])
+        return embed_authors(
+            Membership.objects.filter(group=group), 'user',
+            with_profile=False
+        ).order_by('-joined_at', '-id')
@@ -1,4 +1,6 @@
 from django.contrib import admin
-from .models import Profile
+from .models import AccountDeletion, Profile, ProfileStats
 
 admin.site.register(Profile)
+admin.site.register(ProfileStats)
+admin.site.register(AccountDeletion)
@@ -0,0 +1,46 @@
+import time
+from django.core.management.base import BaseCommand
+from ft_api.deletions import process_account_deletion
+
+
+class Command(BaseCommand):
+    """
+    Delete the accounts queued for deletion, in bounded batches.
+
+    Without `--loop` the queue is drained once. With `--loop` the command
+    keeps draining it, sleeping `--interval` seconds whenever it is
+    empty.
+    """
+    help = 'Delete the accounts queued for deletion in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of rows deleted per transaction.'
+        )
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep processing until the process is stopped.'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5.0,
+            help='Seconds to wait between checks of the queue in loop mode.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            batches = 0
+            while process_account_deletion(
+                batch_size=options['batch_size']
+            ):
+                batches += 1
+            if not options['loop']:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'Ran {batches} account deletion batches.'
+                    )
+                )
+                return
+            if batches:
+                self.stdout.write(f'Ran {batches} account deletion batches.')
+            time.sleep(options['interval'])
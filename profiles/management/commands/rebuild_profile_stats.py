@@ -0,0 +1,43 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from blogs.models import Blog
+from workouts.models import Workout
+from followers.models import Follower
+from profiles.models import ProfileStats
+from ft_api.counters import repair_counters
+
+
+class Command(BaseCommand):
+    """
+    Recompute the stored blog, workout, following and followers counts of
+    every profile, creating the stats of any user that lacks them.
+    """
+    help = 'Recompute the stored activity counts of every profile.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of profiles updated per statement.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ProfileStats.objects.bulk_create(
+            (
+                ProfileStats(owner_id=user_id)
+                for user_id in User.objects.filter(
+                    profile_stats__isnull=True
+                ).values_list('id', flat=True).iterator()
+            ),
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        updated = repair_counters(ProfileStats, {
+            'blogs_count': (Blog, 'owner'),
+            'workouts_count': (Workout, 'owner'),
+            'following_count': (Follower, 'owner'),
+            'followers_count': (Follower, 'followed'),
+        }, batch_size=batch_size)
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt stats of {updated} profiles.')
+        )
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('profiles', '0002_profile_display_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileStats',
+            fields=[
+                ('owner', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='profile_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('blogs_count', models.IntegerField(db_index=True, default=0)),
+                ('workouts_count', models.IntegerField(db_index=True, default=0)),
+                ('following_count', models.IntegerField(db_index=True, default=0)),
+                ('followers_count', models.IntegerField(db_index=True, default=0)),
+            ],
+            options={
+                'verbose_name': 'Profile Stats',
+                'verbose_name_plural': 'Profile Stats',
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+from ft_api.counters import repair_counters
+
+
+def populate_profile_stats(apps, schema_editor):
+    """
+    Create the stats of existing users and fill in their counts.
+    """
+    User = apps.get_model('auth', 'User')
+    ProfileStats = apps.get_model('profiles', 'ProfileStats')
+    Follower = apps.get_model('followers', 'Follower')
+
+    ProfileStats.objects.bulk_create(
+        (
+            ProfileStats(owner_id=user_id)
+            for user_id in User.objects.values_list(
+                'id', flat=True
+            ).iterator()
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    repair_counters(ProfileStats, {
+        'blogs_count': (apps.get_model('blogs', 'Blog'), 'owner'),
+        'workouts_count': (apps.get_model('workouts', 'Workout'), 'owner'),
+        'following_count': (Follower, 'owner'),
+        'followers_count': (Follower, 'followed'),
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0001_initial'),
+        ('followers', '0001_initial'),
+        ('workouts', '0001_initial'),
+        ('profiles', '0003_profilestats'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_profile_stats, migrations.RunPython.noop
+        ),
+    ]
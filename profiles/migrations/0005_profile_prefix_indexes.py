@@ -0,0 +1,24 @@
+from django.db import migrations
+from ft_api.search import CreatePrefixIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('profiles', '0004_populate_profile_stats'),
+    ]
+
+    operations = [
+        CreatePrefixIndex(
+            app_label='auth',
+            model_name='user',
+            field='username',
+            name='auth_user_username_prefix_idx',
+        ),
+        CreatePrefixIndex(
+            model_name='profile',
+            field='name',
+            name='profile_name_prefix_idx',
+        ),
+    ]
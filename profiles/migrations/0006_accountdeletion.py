@@ -0,0 +1,34 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0005_profile_prefix_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(max_length=150)),
+                ('requested_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('step', models.IntegerField(default=0)),
+                ('deleted_rows', models.JSONField(default=dict)),
+                ('user', models.OneToOneField(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='account_deletion', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Account Deletion',
+                'ordering': ['requested_at'],
+                'indexes': [models.Index(condition=models.Q(('completed_at__isnull', True)), fields=['requested_at'], name='account_deletion_pending_idx')],
+            },
+        ),
+    ]
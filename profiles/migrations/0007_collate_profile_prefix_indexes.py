@@ -0,0 +1,57 @@
+from django.db import migrations
+
+# Prefix indexes of the profile autocomplete, as (name, table, column)
+PREFIX_INDEXES = [
+    ('auth_user_username_prefix_idx', 'auth_user', 'username'),
+    ('profile_name_prefix_idx', 'profiles_profile', 'name'),
+]
+
+
+def rebuild_prefix_indexes(schema_editor, expression):
+    """
+    Replace the autocomplete prefix indexes on PostgreSQL with indexes
+    on `expression`, formatted with the quoted column.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote = schema_editor.quote_name
+    for name, table, column in PREFIX_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {quote(name)}')
+        schema_editor.execute(
+            f'CREATE INDEX {quote(name)} ON {quote(table)} '
+            f'({expression.format(column=quote(column))})'
+        )
+
+
+def create_collated_indexes(apps, schema_editor):
+    """
+    Index the `PrefixKey` of usernames and names on PostgreSQL.
+
+    A `text_pattern_ops` index serves the prefix match but not the
+    ordering, so a short prefix sorted every match before the limit was
+    applied. With the C collation one index serves both. SQLite keeps
+    its `NOCASE` indexes, which already match the key.
+    """
+    rebuild_prefix_indexes(
+        schema_editor, '(UPPER({column}::text) COLLATE "C")'
+    )
+
+
+def create_pattern_indexes(apps, schema_editor):
+    """
+    Restore the `text_pattern_ops` prefix indexes on PostgreSQL.
+    """
+    rebuild_prefix_indexes(
+        schema_editor, 'UPPER({column}::text) text_pattern_ops'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_accountdeletion'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_collated_indexes, create_pattern_indexes),
+    ]
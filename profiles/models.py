@@ -1,6 +1,10 @@
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.contrib.auth.models import User
+from blogs.models import Blog
+from workouts.models import Workout
+from followers.models import Follower
+from ft_api.counters import adjust_counters
 
 
 class Profile(models.Model):
@@ -45,9 +49,97 @@ class Profile(models.Model):
         return f"{self.owner}'s Profile Page"
 
 
+class ProfileStats(models.Model):
+    """
+    Stored activity counts for each user's profile.
+
+    The counts are kept up to date incrementally when blogs, workouts and
+    follow relationships are created or deleted, so profile lists can
+    read and order by them without aggregating the related tables. They
+    can be recomputed with the `rebuild_profile_stats` command.
+
+    Attributes:
+        owner (OneToOneField): The user the counts belong to, also used
+        as the primary key so updates need no lookup.
+        blogs_count (IntegerField): The number of blogs the user created.
+        workouts_count (IntegerField): The number of workouts the user
+        created.
+        following_count (IntegerField): The number of users the user
+        follows.
+        followers_count (IntegerField): The number of users following the
+        user.
+    """
+    owner = models.OneToOneField(
+        User, primary_key=True, related_name='profile_stats',
+        on_delete=models.CASCADE
+    )
+    blogs_count = models.IntegerField(default=0, db_index=True)
+    workouts_count = models.IntegerField(default=0, db_index=True)
+    following_count = models.IntegerField(default=0, db_index=True)
+    followers_count = models.IntegerField(default=0, db_index=True)
+
+    class Meta:
+        verbose_name = 'Profile Stats'
+        verbose_name_plural = 'Profile Stats'
+
+    def __str__(self):
+        return f"{self.owner}'s Profile Stats"
+
+
+class AccountDeletion(models.Model):
+    """
+    A pending or completed deletion of a user account.
+
+    Deleting an account deactivates the user at once, which hides it
+    from the API, and queues a job that the `process_account_deletions`
+    worker runs in the background: the user's rows are deleted table by
+    table in bounded batches, each committed with the job's progress, so
+    no request or transaction has to cascade through the whole account.
+
+    Attributes:
+        user (OneToOneField): The user being deleted, cleared once the
+            user itself is deleted.
+        username (CharField): The username of the account, kept for
+            reference once the user is deleted.
+        requested_at (DateTimeField): When the deletion was requested.
+        updated_at (DateTimeField): When the job last made progress.
+        completed_at (DateTimeField): When the account was fully deleted,
+            or None while the job is pending.
+        step (IntegerField): The index of the table being deleted from.
+        deleted_rows (JSONField): Maps model labels to the number of
+            rows deleted so far.
+    """
+    user = models.OneToOneField(
+        User, null=True, related_name='account_deletion',
+        on_delete=models.SET_NULL
+    )
+    username = models.CharField(max_length=150)
+    requested_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    step = models.IntegerField(default=0)
+    deleted_rows = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ['requested_at']
+        indexes = [
+            models.Index(
+                fields=['requested_at'],
+                condition=models.Q(completed_at__isnull=True),
+                name='account_deletion_pending_idx'
+            ),
+        ]
+        verbose_name = 'Account Deletion'
+
+    def __str__(self):
+        status = 'completed' if self.completed_at else 'pending'
+        return f'Deletion of {self.username} ({status})'
+
+
 def create_profile(sender, instance, created, **kwargs):
     """
-    Signal to create a Profile object whenever a new User is created.
+    Signal to create a Profile object, along with its stats, whenever a
+    new User is created.
 
     Args:
         sender: The model class sending the signal.
@@ -57,6 +149,84 @@ def create_profile(sender, instance, created, **kwargs):
     """
     if created:
         Profile.objects.create(owner=instance)
+        ProfileStats.objects.create(owner=instance)
+
+
+# Maps content models to the ProfileStats field counting them
+CONTENT_COUNTS = {
+    Blog: 'blogs_count',
+    Workout: 'workouts_count',
+}
+
+
+def count_created_content(sender, instance, created, raw=False, **kwargs):
+    """
+    Signal to increment the owner's blog or workout count when a new blog
+    or workout is created.
+
+    Args:
+        sender: The model class sending the signal, Blog or Workout.
+        instance: The blog or workout that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw:
+        adjust_counters(
+            ProfileStats, instance.owner_id, **{CONTENT_COUNTS[sender]: 1}
+        )
+
+
+def count_deleted_content(sender, instance, **kwargs):
+    """
+    Signal to decrement the owner's blog or workout count when a blog or
+    workout is deleted.
+
+    Args:
+        sender: The model class sending the signal, Blog or Workout.
+        instance: The blog or workout that was deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    adjust_counters(
+        ProfileStats, instance.owner_id, **{CONTENT_COUNTS[sender]: -1}
+    )
+
+
+def count_created_follow(sender, instance, created, raw=False, **kwargs):
+    """
+    Signal to increment the following count of the follower and the
+    followers count of the followed user when a follow is created.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The follower relationship that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw:
+        adjust_counters(ProfileStats, instance.owner_id, following_count=1)
+        adjust_counters(ProfileStats, instance.followed_id, followers_count=1)
+
+
+def count_deleted_follow(sender, instance, **kwargs):
+    """
+    Signal to decrement the following count of the follower and the
+    followers count of the followed user when a follow is deleted.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The follower relationship that was deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    adjust_counters(ProfileStats, instance.owner_id, following_count=-1)
+    adjust_counters(ProfileStats, instance.followed_id, followers_count=-1)
 
 
 post_save.connect(create_profile, sender=User)
+post_save.connect(count_created_content, sender=Blog)
+post_delete.connect(count_deleted_content, sender=Blog)
+post_save.connect(count_created_content, sender=Workout)
+post_delete.connect(count_deleted_content, sender=Workout)
+post_save.connect(count_created_follow, sender=Follower)
+post_delete.connect(count_deleted_follow, sender=Follower)
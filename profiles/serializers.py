@@ -67,6 +67,9 @@ class ProfileSerializer(serializers.ModelSerializer):
         Get the ID of the 'Follower' instance if the current user follows the
         profile owner.
 
+        The views annotate the ID for the whole page in one query, the
+        lookup below is only used for profiles that were not annotated.
+
         Args:
             obj (Profile): The profile object being serialized.
 
@@ -74,6 +77,8 @@ class ProfileSerializer(serializers.ModelSerializer):
             int or None: The ID of the 'Follower' instance if the current user
             follows the profile owner, None otherwise.
         """
+        if hasattr(obj, 'following_id'):
+            return obj.following_id
         user = self.context['request'].user
         if user.is_authenticated:
             following = Follower.objects.filter(
@@ -207,3 +212,19 @@ class ProfileSerializer(serializers.ModelSerializer):
             'following_id', 'following_count', 'followers_count',
             'email', 'display_name'
         ]
+
+
+class ProfileAutocompleteSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer for the profile autocomplete results.
+
+    Attributes:
+        username (ReadOnlyField): The username of the profile owner.
+        profile_image (ReadOnlyField): The URL of the profile image.
+    """
+    username = serializers.ReadOnlyField(source='owner.username')
+    profile_image = serializers.ReadOnlyField(source='profile_image.url')
+
+    class Meta:
+        model = Profile
+        fields = ['id', 'username', 'profile_image']
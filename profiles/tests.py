@@ -1,3 +1,148 @@
-from django.test import TestCase
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from blog_comments.models import BlogComment
+from blog_likes.models import BlogLike
+from blogs.models import Blog
+from followers.models import Follower
+from ft_api.deletions import process_account_deletion
+from .models import AccountDeletion, Profile, ProfileStats
 
-# Create your tests here.
+
+class ProfileAutocompleteTests(APITestCase):
+    """
+    Tests that autocomplete returns username matches before name
+    matches, each sorted case-insensitively and capped at `?limit=`.
+    """
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.create(username='me'))
+        for username in ['BOBCAT', 'bob', 'Bobby', 'alice']:
+            User.objects.create(username=username)
+        Profile.objects.filter(owner__username='alice').update(
+            name='Bo Jackson'
+        )
+
+    def autocomplete(self, **params):
+        response = self.client.get('/profiles/autocomplete/', params)
+        self.assertEqual(response.status_code, 200)
+        return [profile['username'] for profile in response.data]
+
+    def test_usernames_then_names(self):
+        self.assertEqual(
+            self.autocomplete(q='bo'), ['bob', 'Bobby', 'BOBCAT', 'alice']
+        )
+
+    def test_limit(self):
+        self.assertEqual(self.autocomplete(q='BO', limit=2), ['bob', 'Bobby'])
+        self.assertEqual(self.autocomplete(q='bo j'), ['alice'])
+
+
+class AccountDeletionRequestTests(APITestCase):
+    """
+    Tests that deleting a profile hides the account's profile and posts
+    at once, while lists of its likes and follows stay in step with the
+    stored counts until the rows are deleted.
+    """
+
+    def setUp(self):
+        self.reader = User.objects.create(username='reader')
+        self.leaving = User.objects.create(username='leaving')
+        self.blog = Blog.objects.create(
+            owner=self.reader, title='Blog', content='Content'
+        )
+        self.leaving_blog = Blog.objects.create(
+            owner=self.leaving, title='Leaving', content='Content'
+        )
+        BlogLike.objects.create(owner=self.leaving, blog=self.blog)
+        Follower.objects.create(owner=self.leaving, followed=self.reader)
+        self.client.force_authenticate(self.leaving)
+        response = self.client.delete(
+            f'/profiles/{self.leaving.profile.pk}/'
+        )
+        self.assertEqual(response.status_code, 202)
+        self.client.force_authenticate(self.reader)
+
+    def test_profile_and_posts_are_hidden(self):
+        response = self.client.get(f'/profiles/{self.leaving.profile.pk}/')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(f'/blogs/{self.leaving_blog.pk}/')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/blogs/')
+        self.assertEqual(response.data['count'], 1)
+
+    def test_lists_match_stored_counts(self):
+        response = self.client.get(f'/blogs/{self.blog.pk}/')
+        self.assertEqual(response.data['blog_likes_count'], 1)
+        response = self.client.get(f'/blogs/{self.blog.pk}/likers/')
+        self.assertEqual(len(response.data['results']), 1)
+        response = self.client.get(f'/profiles/{self.reader.profile.pk}/')
+        self.assertEqual(response.data['followers_count'], 1)
+        response = self.client.get(
+            f'/profiles/{self.reader.profile.pk}/followers/'
+        )
+        self.assertEqual(len(response.data['results']), 1)
+
+
+class AccountDeletionJobTests(APITestCase):
+    """
+    Tests that the deletion job removes an account in bounded batches,
+    without cascading through other users' replies, and leaves the
+    stored counters of the remaining users correct.
+    """
+
+    def setUp(self):
+        self.reader = User.objects.create(username='reader')
+        self.other = User.objects.create(username='other')
+        self.leaving = User.objects.create(username='leaving')
+        self.blog = Blog.objects.create(
+            owner=self.reader, title='Blog', content='Content'
+        )
+        leaving_blog = Blog.objects.create(
+            owner=self.leaving, title='Leaving', content='Content'
+        )
+        BlogLike.objects.create(owner=self.leaving, blog=self.blog)
+        BlogLike.objects.create(owner=self.reader, blog=leaving_blog)
+        Follower.objects.create(owner=self.leaving, followed=self.reader)
+        Follower.objects.create(owner=self.reader, followed=self.leaving)
+        self.kept = BlogComment.objects.create(
+            owner=self.reader, blog=self.blog, comment='Kept'
+        )
+        parent = BlogComment.objects.create(
+            owner=self.leaving, blog=self.blog, comment='Leaving'
+        )
+        for index in range(3):
+            parent = BlogComment.objects.create(
+                owner=(self.reader, self.other)[index % 2], blog=self.blog,
+                parent=parent, comment=f'Reply {index}'
+            )
+        BlogComment.objects.create(
+            owner=self.reader, blog=leaving_blog, comment='On leaving'
+        )
+        self.client.force_authenticate(self.leaving)
+        self.client.delete(f'/profiles/{self.leaving.profile.pk}/')
+
+    def test_batches_do_not_cascade(self):
+        while True:
+            before = BlogComment.objects.count()
+            if not process_account_deletion(batch_size=1):
+                break
+            self.assertLessEqual(before - BlogComment.objects.count(), 1)
+
+    def test_counters_after_deletion(self):
+        call_command(
+            'process_account_deletions', batch_size=1, stdout=StringIO()
+        )
+        self.assertFalse(User.objects.filter(username='leaving').exists())
+        job = AccountDeletion.objects.get()
+        self.assertIsNotNone(job.completed_at)
+        self.assertEqual(job.deleted_rows['blog_comments.BlogComment'], 5)
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.blog_likes_count, 0)
+        self.assertEqual(self.blog.blog_comments_count, 1)
+        self.assertEqual(list(BlogComment.objects.all()), [self.kept])
+        stats = ProfileStats.objects.get(owner=self.reader)
+        self.assertEqual(stats.followers_count, 0)
+        self.assertEqual(stats.following_count, 0)
+        self.assertEqual(stats.blogs_count, 1)
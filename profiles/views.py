@@ -1,21 +1,30 @@
 from rest_framework import generics, permissions, filters, status
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count
+from django.db.models import F
 from .models import Profile
-from .serializers import ProfileSerializer
+from .serializers import ProfileAutocompleteSerializer, ProfileSerializer
+from followers.models import Follower
+from ft_api.deletions import request_account_deletion
 from ft_api.permissions import IsOwnerOrReadOnly
+from ft_api.querysets import viewer_relation_id
+from ft_api.search import prefix_matches
 
 
 class ProfileList(generics.ListAPIView):
     """
     API view to retrieve list of profiles.
+
+    The blog, workout, following and followers counts are read from each
+    profile's stored stats rather than aggregated per request.
     """
-    queryset = Profile.objects.annotate(
-        blogs_count=Count('owner__blog', distinct=True),
-        workouts_count=Count('owner__workout', distinct=True),
-        following_count=Count('owner__following', distinct=True),
-        followers_count=Count('owner__followed', distinct=True),
+    queryset = Profile.objects.select_related('owner').filter(
+        owner__is_active=True
+    ).annotate(
+        blogs_count=F('owner__profile_stats__blogs_count'),
+        workouts_count=F('owner__profile_stats__workouts_count'),
+        following_count=F('owner__profile_stats__following_count'),
+        followers_count=F('owner__profile_stats__followers_count'),
     ).order_by('-created_at')
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -36,6 +45,16 @@ class ProfileList(generics.ListAPIView):
         'owner__followed__created_at'
     ]
 
+    def get_queryset(self):
+        """
+        Annotates the profiles with the current user's follow ID.
+        """
+        return super().get_queryset().annotate(
+            following_id=viewer_relation_id(
+                self.request.user, Follower, followed='owner'
+            )
+        )
+
     def get_serializer_context(self):
         """
         Adds the request context to the serializer context.
@@ -43,6 +62,56 @@ class ProfileList(generics.ListAPIView):
         return {'request': self.request}
 
 
+class ProfileAutocomplete(generics.ListAPIView):
+    """
+    API view to find profiles whose username or name starts with `?q=`.
+
+    Usernames and names are matched by two separate prefix lookups, each
+    filtered and sorted by the key of a case-insensitive prefix index
+    and capped at `?limit=` rows, so the cost depends on the number of
+    results rather than on the number of users. Username matches come
+    first, followed by name matches that were not already found.
+    """
+    serializer_class = ProfileAutocompleteSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    query_param = 'q'
+    limit_query_param = 'limit'
+    default_limit = 10
+    max_limit = 20
+
+    def get_limit(self):
+        """
+        Returns the requested number of results, bounded by `max_limit`.
+        """
+        try:
+            limit = int(self.request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_queryset(self):
+        """
+        Returns the profiles matching the query prefix.
+        """
+        prefix = self.request.query_params.get(self.query_param, '').strip()
+        if not prefix:
+            return []
+        limit = self.get_limit()
+        profiles = Profile.objects.select_related('owner').filter(
+            owner__is_active=True
+        ).only('id', 'profile_image', 'owner__username')
+        matches = list(
+            prefix_matches(profiles, 'owner__username', prefix)[:limit]
+        )
+        if len(matches) < limit:
+            matches += prefix_matches(
+                profiles.exclude(id__in=[profile.id for profile in matches]),
+                'name', prefix
+            )[:limit - len(matches)]
+        return matches
+
+
 class ProfileDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     API view to retrieve, update, or delete a profile.
@@ -50,17 +119,30 @@ class ProfileDetail(generics.RetrieveUpdateDestroyAPIView):
     - GET: Retrieve details of a specific profile.
     - PUT: Update the details of a specific profile (only allowed if the user
       is the owner).
-    - DELETE: Delete the profile and the associated user.
+    - DELETE: Deactivate the associated user and queue the deletion of
+      the account, which is processed in the background.
     """
-    queryset = Profile.objects.annotate(
-        blogs_count=Count('owner__blog', distinct=True),
-        workouts_count=Count('owner__workout', distinct=True),
-        following_count=Count('owner__following', distinct=True),
-        followers_count=Count('owner__followed', distinct=True),
+    queryset = Profile.objects.select_related('owner').filter(
+        owner__is_active=True
+    ).annotate(
+        blogs_count=F('owner__profile_stats__blogs_count'),
+        workouts_count=F('owner__profile_stats__workouts_count'),
+        following_count=F('owner__profile_stats__following_count'),
+        followers_count=F('owner__profile_stats__followers_count'),
     ).order_by('-created_at')
     serializer_class = ProfileSerializer
     permission_classes = [IsOwnerOrReadOnly]
 
+    def get_queryset(self):
+        """
+        Annotates the profiles with the current user's follow ID.
+        """
+        return super().get_queryset().annotate(
+            following_id=viewer_relation_id(
+                self.request.user, Follower, followed='owner'
+            )
+        )
+
     def get_serializer_context(self):
         """
         Adds the request context to the serializer context.
@@ -70,9 +152,15 @@ class ProfileDetail(generics.RetrieveUpdateDestroyAPIView):
     def delete(self, request, *args, **kwargs):
         """
         Handle deletion of the profile and the associated user.
+
+        The user is deactivated at once, which hides the account, and the
+        profile, content and relations are deleted in batches by the
+        `process_account_deletions` worker, so the request responds with
+        202 Accepted without cascading through the account.
         """
         profile = self.get_object()
-        user = profile.owner
-        profile.delete()
-        user.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        request_account_deletion(profile.owner)
+        return Response(
+            {'detail': 'Account deletion scheduled.'},
+            status=status.HTTP_202_ACCEPTED
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workout_comments', '0001_initial'),
+        ('workouts', '0002_workout_workout_created_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workoutcomment',
+            index=models.Index(fields=['workout', '-created_at', '-id'], name='workout_comment_created_idx'),
+        ),
+    ]
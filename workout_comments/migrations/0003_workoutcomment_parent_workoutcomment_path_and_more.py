@@ -0,0 +1,40 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workout_comments', '0002_workoutcomment_workout_comment_created_idx'),
+        ('workouts', '0008_workoutactivity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workoutcomment',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='replies', to='workout_comments.workoutcomment'),
+        ),
+        migrations.AddField(
+            model_name='workoutcomment',
+            name='path',
+            field=models.CharField(default='', editable=False, max_length=250),
+        ),
+        migrations.AddField(
+            model_name='workoutcomment',
+            name='reply_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='workoutcomment',
+            index=models.Index(condition=models.Q(('parent__isnull', True)), fields=['workout', '-created_at', '-id'], name='workout_comment_top_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutcomment',
+            index=models.Index(fields=['workout', 'path'], name='workout_comment_path_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+from ft_api.threads import thread_path
+
+
+def populate_workoutcomment_paths(apps, schema_editor):
+    """
+    Give existing comments, which are all top-level, their materialized
+    paths.
+    """
+    WorkoutComment = apps.get_model('workout_comments', 'WorkoutComment')
+    last_pk = 0
+    while True:
+        comments = list(
+            WorkoutComment.objects.filter(pk__gt=last_pk).order_by('pk').only(
+                'pk', 'path'
+            )[:1000]
+        )
+        if not comments:
+            return
+        for comment in comments:
+            comment.path = thread_path(None, comment.pk)
+        WorkoutComment.objects.bulk_update(comments, ['path'])
+        last_pk = comments[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            'workout_comments',
+            '0003_workoutcomment_parent_workoutcomment_path_and_more'
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_workoutcomment_paths, migrations.RunPython.noop
+        ),
+    ]
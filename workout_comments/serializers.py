@@ -1,5 +1,6 @@
-from django.contrib.humanize.templatetags.humanize import naturaltime
 from rest_framework import serializers
+from ft_api.serializers import NaturalTimeField
+from ft_api.threads import MAX_THREAD_DEPTH
 from .models import WorkoutComment
 
 
@@ -17,8 +18,10 @@ class WorkoutCommentSerializer(serializers.ModelSerializer):
     profile_image = serializers.ReadOnlyField(
         source='owner.profile.profile_image.url'
     )
-    created_at = serializers.SerializerMethodField()
-    updated_at = serializers.SerializerMethodField()
+    created_at = NaturalTimeField()
+    updated_at = NaturalTimeField()
+    depth = serializers.ReadOnlyField()
+    reply_count = serializers.ReadOnlyField()
 
     def get_is_owner(self, obj):
         """
@@ -27,26 +30,42 @@ class WorkoutCommentSerializer(serializers.ModelSerializer):
         request = self.context['request']
         return request.user == obj.owner
 
-    def get_created_at(self, obj):
-        """
-        Return the natural time format of the comment's creation time.
-        """
-        return naturaltime(obj.created_at)
-
-    def get_updated_at(self, obj):
-        """
-        Return the natural time format of the comment's last update time.
-        """
-        return naturaltime(obj.updated_at)
-
     class Meta:
         model = WorkoutComment
         fields = [
             'id', 'owner', 'is_owner', 'profile_id',
-            'profile_image', 'workout', 'comment',
-            'created_at', 'updated_at'
+            'profile_image', 'workout', 'parent', 'depth', 'reply_count',
+            'comment', 'created_at', 'updated_at'
         ]
 
+    def validate(self, data):
+        """
+        Check that a reply is made on the same workout as its parent
+        comment and within the maximum thread depth.
+
+        Args:
+            data (dict): The validated data of the comment.
+
+        Raises:
+            serializers.ValidationError: If the parent comment belongs to
+            another workout or is already at the maximum depth.
+
+        Returns:
+            dict: The validated data.
+        """
+        parent = data.get('parent')
+        if parent is not None:
+            if parent.workout_id != data['workout'].id:
+                raise serializers.ValidationError({
+                    'parent': 'The parent comment belongs to another '
+                              'workout.'
+                })
+            if parent.depth + 1 >= MAX_THREAD_DEPTH:
+                raise serializers.ValidationError({
+                    'parent': 'This thread is too deep to reply to.'
+                })
+        return data
+
 
 class WorkoutCommentDetailSerializer(WorkoutCommentSerializer):
     """
@@ -56,3 +75,32 @@ class WorkoutCommentDetailSerializer(WorkoutCommentSerializer):
     field.
     """
     workout = serializers.ReadOnlyField(source='workout.id')
+    parent = serializers.ReadOnlyField(source='parent_id')
+
+
+class WorkoutCommentThreadSerializer(WorkoutCommentSerializer):
+    """
+    Serializer for a top-level workout comment with its first replies inlined.
+
+    The replies are read from the `first_replies` prefetched by the view;
+    the rest of the thread is served by the comment thread endpoint.
+    """
+    replies = serializers.SerializerMethodField()
+
+    def get_replies(self, obj):
+        """
+        Serialize the first direct replies of the comment.
+
+        Args:
+            obj (WorkoutComment): The comment object being serialized.
+
+        Returns:
+            list: The serialized replies, oldest first.
+        """
+        return WorkoutCommentSerializer(
+            getattr(obj, 'first_replies', []), many=True,
+            context=self.context
+        ).data
+
+    class Meta(WorkoutCommentSerializer.Meta):
+        fields = WorkoutCommentSerializer.Meta.fields + ['replies']
@@ -3,5 +3,13 @@ from workout_comments import views
 
 urlpatterns = [
     path('workout-comments/', views.WorkoutCommentList.as_view()),
-    path('workout-comments/<int:pk>/', views.WorkoutCommentDetail.as_view())
+    path('workout-comments/<int:pk>/', views.WorkoutCommentDetail.as_view()),
+    path(
+        'workout-comments/<int:pk>/thread/',
+        views.WorkoutCommentThread.as_view()
+    ),
+    path(
+        'workouts/<int:pk>/comments/',
+        views.WorkoutCommentThreadList.as_view()
+    ),
 ]
@@ -1,10 +1,17 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions
 from django_filters.rest_framework import DjangoFilterBackend
+from ft_api.pagination import KeysetPagination
 from ft_api.permissions import IsOwnerOrReadOnly
+from ft_api.querysets import embed_authors
+from ft_api.threads import first_replies, subtree
+from workouts.models import Workout
 from .models import WorkoutComment
 from .serializers import (
     WorkoutCommentSerializer,
-    WorkoutCommentDetailSerializer
+    WorkoutCommentDetailSerializer,
+    WorkoutCommentThreadSerializer
 )
 
 
@@ -17,15 +24,17 @@ class WorkoutCommentList(generics.ListCreateAPIView):
     """
     serializer_class = WorkoutCommentSerializer
     permission_classes = [permissions.IsAuthenticated]
-    queryset = WorkoutComment.objects.all()
+    queryset = embed_authors(WorkoutComment.objects.all())
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['workout']
+    filterset_fields = ['workout', 'parent']
 
     def perform_create(self, serializer):
         """
-        Save the new workout comment with the owner set to the current user.
+        Save the new workout comment with the owner set to the current user,
+        in the same transaction as the workout's stored comment count update.
         """
-        serializer.save(owner=self.request.user)
+        with transaction.atomic():
+            serializer.save(owner=self.request.user)
 
 
 class WorkoutCommentDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -38,4 +47,59 @@ class WorkoutCommentDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     permission_classes = [IsOwnerOrReadOnly]
     serializer_class = WorkoutCommentDetailSerializer
-    queryset = WorkoutComment.objects.all()
+    queryset = embed_authors(WorkoutComment.objects.all())
+
+
+class WorkoutCommentThreadList(generics.ListAPIView):
+    """
+    API view to list the top-level comments of a workout, newest first.
+
+    Each comment carries its stored reply count and its first replies,
+    loaded for the whole page by a single windowed query; the rest of a
+    thread is loaded from the comment thread endpoint.
+    """
+    serializer_class = WorkoutCommentThreadSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+
+    def get_queryset(self):
+        """
+        Return the top-level comments of the workout with their first replies.
+        A missing workout, or one of an account queued for deletion, is a 404.
+        """
+        workout = get_object_or_404(
+            Workout.objects.filter(owner__is_active=True).only('pk'),
+            pk=self.kwargs['pk']
+        )
+        return embed_authors(WorkoutComment.objects.filter(
+            workout=workout, parent__isnull=True
+        )).prefetch_related(
+            first_replies(embed_authors(WorkoutComment.objects.all()))
+        )
+
+
+class WorkoutCommentThread(generics.ListAPIView):
+    """
+    API view to list a comment and all of its replies, at every depth.
+
+    Comments are ordered by materialized path, so each reply follows its
+    parent, and the whole subtree is read as one range of the
+    (workout, path) index.
+    """
+    serializer_class = WorkoutCommentSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('path',)
+
+    def get_queryset(self):
+        """
+        Return the comment and its replies, depth first.
+        """
+        comment = get_object_or_404(
+            WorkoutComment.objects.only('workout', 'path'),
+            pk=self.kwargs['pk']
+        )
+        return embed_authors(WorkoutComment.objects.filter(
+            subtree(comment.path), workout=comment.workout_id
+        ))
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workout_likes', '0001_initial'),
+        ('workouts', '0008_workoutactivity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workoutlike',
+            index=models.Index(fields=['workout', '-created_at', '-id', 'owner'], name='workout_like_likers_idx'),
+        ),
+    ]
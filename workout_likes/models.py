@@ -1,6 +1,10 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
 from django.contrib.auth.models import User
-from workouts.models import Workout
+from workouts.models import Workout, WorkoutActivity
+from ft_api.counters import adjust_counters
+from ft_api.scores import LIKE_WEIGHT, decayed_weight
+from ft_api.trending import record_activity
 
 
 class WorkoutLike(models.Model):
@@ -29,6 +33,74 @@ class WorkoutLike(models.Model):
     class Meta:
         ordering = ['-created_at']
         unique_together = (('owner', 'workout'),)
+        indexes = [
+            models.Index(
+                fields=['workout', '-created_at', '-id', 'owner'],
+                name='workout_like_likers_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.owner.username} likes {self.workout.title}'
+
+
+def increment_workout_likes_count(
+    sender, instance, created, raw=False, **kwargs
+):
+    """
+    Signal to increment the like count stored on the workout, and add the
+    like's weight to its score, when a new like is created.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The like that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw:
+        adjust_counters(
+            Workout, instance.workout_id, workout_likes_count=1,
+            score=LIKE_WEIGHT
+        )
+
+
+def decrement_workout_likes_count(sender, instance, **kwargs):
+    """
+    Signal to decrement the like count stored on the workout, and remove
+    the like's decayed weight from its score, when a like is deleted.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The like that was deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    adjust_counters(
+        Workout, instance.workout_id, workout_likes_count=-1,
+        score=-decayed_weight(LIKE_WEIGHT, instance.created_at)
+    )
+
+
+def record_workout_like_activity(
+    sender, instance, created, raw=False, **kwargs
+):
+    """
+    Signal to count a new like in the current hourly activity bucket of
+    the workout, used to rank trending workouts.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The like that was saved.
+        created (bool): A boolean indicating whether a new record was created.
+        raw (bool): True when the instance is being loaded from a fixture.
+        **kwargs: Additional keyword arguments.
+    """
+    if created and not raw:
+        record_activity(
+            WorkoutActivity, 'workout', instance.workout_id, likes_count=1
+        )
+
+
+post_save.connect(increment_workout_likes_count, sender=WorkoutLike)
+post_delete.connect(decrement_workout_likes_count, sender=WorkoutLike)
+post_save.connect(record_workout_like_activity, sender=WorkoutLike)
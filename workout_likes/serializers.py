@@ -1,4 +1,4 @@
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from workout_likes.models import WorkoutLike
 
@@ -31,8 +31,30 @@ class WorkoutLikeSerializer(serializers.ModelSerializer):
             WorkoutLike: The created WorkoutLike instance.
         """
         try:
-            return super().create(validated_data)
+            with transaction.atomic():
+                return super().create(validated_data)
         except IntegrityError:
             raise serializers.ValidationError({
                 'detail': 'This like already exists.'
             })
+
+
+class WorkoutLikerSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer for the users who liked a workout.
+
+    Attributes:
+        owner (ReadOnlyField): The username of the user who liked the
+            workout.
+        profile_id (ReadOnlyField): The ID of the user's profile.
+        profile_image (ReadOnlyField): The URL of the user's profile image.
+    """
+    owner = serializers.ReadOnlyField(source='owner.username')
+    profile_id = serializers.ReadOnlyField(source='owner.profile.id')
+    profile_image = serializers.ReadOnlyField(
+        source='owner.profile.profile_image.url'
+    )
+
+    class Meta:
+        model = WorkoutLike
+        fields = ['id', 'owner', 'profile_id', 'profile_image', 'created_at']
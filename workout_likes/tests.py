@@ -1,3 +1,37 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+from ft_api.scores import LIKE_WEIGHT
+from workouts.models import Workout
+from .models import WorkoutLike
 
-# Create your tests here.
+
+class WorkoutLikeToggleTests(APITestCase):
+    """
+    Tests that repeated PUT and DELETE requests on a workout's like keep
+    the stored like count and score in step with the likes.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(self.user)
+        self.workout = Workout.objects.create(
+            owner=User.objects.create(username='author'), title='Workout',
+            content='Content'
+        )
+        self.url = f'/workouts/{self.workout.pk}/like/'
+
+    def assertLikes(self, response, count):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['workout_likes_count'], count)
+        self.workout.refresh_from_db()
+        self.assertEqual(self.workout.workout_likes_count, count)
+        self.assertEqual(WorkoutLike.objects.count(), count)
+        self.assertAlmostEqual(
+            self.workout.score, count * LIKE_WEIGHT, places=3
+        )
+
+    def test_put_and_delete_are_idempotent(self):
+        self.assertLikes(self.client.put(self.url), 1)
+        self.assertLikes(self.client.put(self.url), 1)
+        self.assertLikes(self.client.delete(self.url), 0)
+        self.assertLikes(self.client.delete(self.url), 0)
@@ -4,4 +4,6 @@ from workout_likes import views
 urlpatterns = [
     path('workout-likes/', views.WorkoutLikeList.as_view()),
     path('workout-likes/<int:pk>/', views.WorkoutLikeDetail.as_view()),
+    path('workouts/<int:pk>/like/', views.WorkoutLikeToggle.as_view()),
+    path('workouts/<int:pk>/likers/', views.WorkoutLikerList.as_view()),
 ]
@@ -1,7 +1,16 @@
 from rest_framework import generics, permissions
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from django.shortcuts import get_object_or_404
+from ft_api.likes import add_like, remove_like
+from ft_api.pagination import KeysetPagination
 from ft_api.permissions import IsOwnerOrReadOnly
+from ft_api.querysets import embed_authors, viewer_relation_id
+from workouts.models import Workout
 from workout_likes.models import WorkoutLike
-from workout_likes.serializers import WorkoutLikeSerializer
+from workout_likes.serializers import (
+    WorkoutLikerSerializer, WorkoutLikeSerializer
+)
 
 
 class WorkoutLikeList(generics.ListCreateAPIView):
@@ -13,7 +22,7 @@ class WorkoutLikeList(generics.ListCreateAPIView):
     """
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = WorkoutLikeSerializer
-    queryset = WorkoutLike.objects.all()
+    queryset = embed_authors(WorkoutLike.objects.all(), with_profile=False)
 
     def perform_create(self, serializer):
         """
@@ -32,4 +41,61 @@ class WorkoutLikeDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     permission_classes = [IsOwnerOrReadOnly]
     serializer_class = WorkoutLikeSerializer
-    queryset = WorkoutLike.objects.all()
+    queryset = embed_authors(WorkoutLike.objects.all(), with_profile=False)
+
+
+class WorkoutLikeToggle(generics.GenericAPIView):
+    """
+    API view to like or unlike a workout by its ID.
+
+    - PUT: Likes the workout, doing nothing if it is already liked.
+    - DELETE: Removes the like, doing nothing if there is none.
+
+    Both are idempotent, run a single write statement and respond with
+    the current user's like ID and the workout's new like count.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def put(self, request, pk):
+        add_like(WorkoutLike, 'workout', request.user, pk)
+        return self.like_response(pk)
+
+    def delete(self, request, pk):
+        remove_like(WorkoutLike, 'workout', request.user, pk)
+        return self.like_response(pk)
+
+    def like_response(self, pk):
+        """
+        Returns the current user's like ID and the like count of the
+        workout.
+
+        Raises:
+            NotFound: If the workout does not exist.
+        """
+        state = Workout.objects.filter(pk=pk).annotate(
+            workout_like_id=viewer_relation_id(
+                self.request.user, WorkoutLike, workout='pk'
+            )
+        ).values('workout_like_id', 'workout_likes_count').first()
+        if state is None:
+            raise NotFound()
+        return Response(state)
+
+
+class WorkoutLikerList(generics.ListAPIView):
+    """
+    API view to list the users who liked a workout.
+
+    - GET: Returns the likes of the workout, newest first, with each
+      liker's username, profile ID and profile image.
+
+    Pages are read by keyset pagination over the (workout, created_at, id,
+    owner) index, joining the likers and their profiles in one query.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = WorkoutLikerSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        workout = get_object_or_404(Workout, pk=self.kwargs['pk'])
+        return embed_authors(WorkoutLike.objects.filter(workout=workout))
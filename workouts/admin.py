@@ -1,5 +1,10 @@
 from django.contrib import admin
-from .models import Workout, WorkoutItem
+from .models import (
+    Exercise, ExerciseRollup, Workout, WorkoutActivity, WorkoutItem
+)
 
 admin.site.register(Workout)
+admin.site.register(Exercise)
 admin.site.register(WorkoutItem)
+admin.site.register(WorkoutActivity)
+admin.site.register(ExerciseRollup)
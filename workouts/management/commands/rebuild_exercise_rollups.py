@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from workouts.models import ExerciseRollup, WorkoutItem
+from ft_api.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    """
+    Recompute the weekly and monthly exercise rollups of every user from
+    their workout items.
+    """
+    help = 'Recompute the weekly and monthly exercise rollups of users.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of users rebuilt per transaction.'
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_rollups(
+            ExerciseRollup, 'exercise_id', WorkoutItem.objects.all(),
+            owner_field='workout__owner', date_field='workout__created_at',
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f'Wrote {written} exercise rollups.')
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from workouts.models import Workout
+from workout_likes.models import WorkoutLike
+from workout_comments.models import WorkoutComment
+from ft_api.counters import repair_counters
+
+
+class Command(BaseCommand):
+    """
+    Recompute the stored like and comment counts of every workout from
+    the like and comment tables.
+    """
+    help = 'Recompute the stored like and comment counts of workouts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of workouts updated per statement.'
+        )
+
+    def handle(self, *args, **options):
+        updated = repair_counters(Workout, {
+            'workout_likes_count': (WorkoutLike, 'workout'),
+            'workout_comments_count': (WorkoutComment, 'workout'),
+        }, batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Repaired counters of {updated} workouts.')
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0002_workout_workout_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workout',
+            name='workout_comments_count',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='workout',
+            name='workout_likes_count',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+    ]
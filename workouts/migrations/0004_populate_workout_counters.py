@@ -0,0 +1,31 @@
+from django.db import migrations
+from ft_api.counters import repair_counters
+
+
+def populate_workout_counters(apps, schema_editor):
+    """
+    Fill the stored like and comment counts of existing workouts.
+    """
+    repair_counters(apps.get_model('workouts', 'Workout'), {
+        'workout_likes_count': (
+            apps.get_model('workout_likes', 'WorkoutLike'), 'workout'
+        ),
+        'workout_comments_count': (
+            apps.get_model('workout_comments', 'WorkoutComment'), 'workout'
+        ),
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workout_comments', '0002_workoutcomment_workout_comment_created_idx'),
+        ('workout_likes', '0001_initial'),
+        ('workouts', '0003_workout_workout_comments_count_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_workout_counters, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations
+from ft_api.scores import rebuild_scores
+
+
+def populate_workout_scores(apps, schema_editor):
+    """
+    Estimate the engagement scores of existing workouts from their
+    stored counters.
+    """
+    rebuild_scores(
+        apps.get_model('workouts', 'Workout'),
+        'workout_likes_count',
+        'workout_comments_count',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0006_workout_score_workout_workout_score_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_workout_scores, migrations.RunPython.noop
+        ),
+    ]
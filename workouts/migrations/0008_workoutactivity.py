@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0007_populate_workout_scores'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkoutActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('likes_count', models.IntegerField(default=0)),
+                ('comments_count', models.IntegerField(default=0)),
+                ('workout', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity', to='workouts.workout')),
+            ],
+            options={
+                'verbose_name': 'Workout Activity',
+                'verbose_name_plural': 'Workout Activity',
+                'indexes': [models.Index(fields=['hour', 'workout'], name='workout_activity_hour_idx')],
+                'unique_together': {('workout', 'hour')},
+            },
+        ),
+    ]
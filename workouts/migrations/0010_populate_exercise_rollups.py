@@ -0,0 +1,28 @@
+from django.db import migrations
+from ft_api.rollups import rebuild_rollups
+
+
+def populate_exercise_rollups(apps, schema_editor):
+    """
+    Roll up the exercises of existing workouts by week and month.
+    """
+    rebuild_rollups(
+        apps.get_model('workouts', 'ExerciseRollup'),
+        'exercise_name',
+        apps.get_model('workouts', 'WorkoutItem').objects.all(),
+        owner_field='workout__owner',
+        date_field='workout__created_at',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0009_exerciserollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_exercise_rollups, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,33 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0010_populate_exercise_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Exercise',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('name_key', models.CharField(editable=False, max_length=255, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='workoutitem',
+            name='exercise',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='workout_items', to='workouts.exercise'),
+        ),
+        migrations.AddField(
+            model_name='exerciserollup',
+            name='exercise',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='rollups', to='workouts.exercise'),
+        ),
+    ]
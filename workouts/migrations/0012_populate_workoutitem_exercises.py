@@ -0,0 +1,80 @@
+from django.db import migrations
+from ft_api.exercises import resolve_exercises
+from ft_api.rollups import rebuild_rollups
+
+
+def populate_workoutitem_exercises(apps, schema_editor):
+    """
+    Link existing workout items to the exercise catalog, adding each
+    distinct case-folded exercise name to it once.
+
+    Items are processed in primary key batches, with one lookup and at
+    most one bulk insert into the catalog and one bulk update per batch.
+    The exercise rollups, keyed by name until now, are cleared to be
+    rebuilt by exercise once the schema is migrated.
+    """
+    Exercise = apps.get_model('workouts', 'Exercise')
+    WorkoutItem = apps.get_model('workouts', 'WorkoutItem')
+    last_pk = 0
+    while True:
+        items = list(
+            WorkoutItem.objects.filter(pk__gt=last_pk).order_by('pk').only(
+                'id', 'exercise_name'
+            )[:1000]
+        )
+        if not items:
+            break
+        exercise_ids = resolve_exercises(
+            Exercise, [item.exercise_name for item in items]
+        )
+        for item in items:
+            item.exercise_id = exercise_ids[item.exercise_name]
+        WorkoutItem.objects.bulk_update(items, ['exercise'])
+        last_pk = items[-1].pk
+    apps.get_model('workouts', 'ExerciseRollup').objects.all().delete()
+
+
+def restore_workoutitem_exercise_names(apps, schema_editor):
+    """
+    Copy the catalog name of each workout item's exercise back into its
+    exercise name, and rebuild the exercise rollups by name.
+
+    Items are processed in primary key batches, reading each batch's
+    exercise names through one join and writing them with one bulk
+    update.
+    """
+    WorkoutItem = apps.get_model('workouts', 'WorkoutItem')
+    last_pk = 0
+    while True:
+        items = list(
+            WorkoutItem.objects.filter(pk__gt=last_pk).order_by('pk').only(
+                'id', 'exercise__name'
+            ).select_related('exercise')[:1000]
+        )
+        if not items:
+            break
+        for item in items:
+            item.exercise_name = item.exercise.name
+        WorkoutItem.objects.bulk_update(items, ['exercise_name'])
+        last_pk = items[-1].pk
+    rebuild_rollups(
+        apps.get_model('workouts', 'ExerciseRollup'),
+        'exercise_name',
+        WorkoutItem.objects.all(),
+        owner_field='workout__owner',
+        date_field='workout__created_at',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0011_exercise_workoutitem_exercise'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_workoutitem_exercises,
+            restore_workoutitem_exercise_names
+        ),
+    ]
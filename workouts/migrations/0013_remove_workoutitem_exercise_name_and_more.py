@@ -0,0 +1,53 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from ft_api.search import CreatePrefixIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0012_populate_workoutitem_exercises'),
+    ]
+
+    operations = [
+        # The defaults only exist in the migration state, so that the
+        # columns can be added back to existing rows when migrating
+        # backwards, before 0012 restores their values.
+        migrations.AlterField(
+            model_name='workoutitem',
+            name='exercise_name',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='exerciserollup',
+            name='exercise_name',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.RemoveField(
+            model_name='workoutitem',
+            name='exercise_name',
+        ),
+        migrations.AlterField(
+            model_name='workoutitem',
+            name='exercise',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='workout_items', to='workouts.exercise'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='exerciserollup',
+            unique_together={('owner', 'period', 'period_start', 'exercise')},
+        ),
+        migrations.RemoveField(
+            model_name='exerciserollup',
+            name='exercise_name',
+        ),
+        migrations.AlterField(
+            model_name='exerciserollup',
+            name='exercise',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rollups', to='workouts.exercise'),
+        ),
+        CreatePrefixIndex(
+            model_name='exercise',
+            field='name_key',
+            name='exercise_name_key_prefix_idx',
+        ),
+    ]
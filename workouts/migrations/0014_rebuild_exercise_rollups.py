@@ -0,0 +1,36 @@
+from django.db import migrations
+from ft_api.rollups import rebuild_rollups
+
+
+def rebuild_exercise_rollups(apps, schema_editor):
+    """
+    Roll up the exercises of existing workouts by exercise id.
+    """
+    rebuild_rollups(
+        apps.get_model('workouts', 'ExerciseRollup'),
+        'exercise_id',
+        apps.get_model('workouts', 'WorkoutItem').objects.all(),
+        owner_field='workout__owner',
+        date_field='workout__created_at',
+    )
+
+
+def clear_exercise_rollups(apps, schema_editor):
+    """
+    Delete the rollups keyed by exercise id, which 0012 rebuilds by name
+    when migrating backwards.
+    """
+    apps.get_model('workouts', 'ExerciseRollup').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0013_remove_workoutitem_exercise_name_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            rebuild_exercise_rollups, clear_exercise_rollups
+        ),
+    ]
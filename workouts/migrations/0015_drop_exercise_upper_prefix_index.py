@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+def drop_upper_prefix_index(apps, schema_editor):
+    """
+    Drop the `UPPER()` prefix index of the exercise keys on PostgreSQL.
+
+    The keys are already case-folded, so autocomplete matches them with
+    a case-sensitive prefix lookup, served on PostgreSQL by the pattern
+    index Django creates for the unique key. On SQLite, where `LIKE`
+    ignores case, the `NOCASE` prefix index is kept.
+    """
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'DROP INDEX IF EXISTS '
+            f'{schema_editor.quote_name("exercise_name_key_prefix_idx")}'
+        )
+
+
+def create_upper_prefix_index(apps, schema_editor):
+    """
+    Recreate the `UPPER()` prefix index of the exercise keys on
+    PostgreSQL.
+    """
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX '
+            f'{schema_editor.quote_name("exercise_name_key_prefix_idx")} '
+            'ON "workouts_exercise" (UPPER("name_key"::text) '
+            'text_pattern_ops)'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0014_rebuild_exercise_rollups'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            drop_upper_prefix_index, create_upper_prefix_index
+        ),
+    ]
@@ -1,5 +1,11 @@
 from django.db import models
+from django.db.models import Count, Sum
+from django.db.models.signals import post_save, post_delete, pre_delete
 from django.contrib.auth.models import User
+from ft_api.counters import edit_fields
+from ft_api.exercises import EXERCISE_NAME_LENGTH, exercise_key
+from ft_api.rollups import ROLLUP_PERIODS, adjust_rollups
+from ft_api.search import index_search_document, remove_search_document
 
 
 class Workout(models.Model):
@@ -14,6 +20,12 @@ class Workout(models.Model):
         updated_at (DateTimeField): Timestamp when the workout was last updated
         banner (ImageField): Optional banner image for the workout.
         image (ImageField): Optional content image for the workout.
+        workout_likes_count (IntegerField): Stored number of likes, kept in
+            sync when likes are created or deleted.
+        workout_comments_count (IntegerField): Stored number of comments,
+            kept in sync when comments are created or deleted.
+        score (FloatField): Stored engagement score, raised by likes and
+            comments and decayed over time by `decay_workout_scores`.
     """
     owner = models.ForeignKey(User, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
@@ -29,13 +41,81 @@ class Workout(models.Model):
         default='../default_post_eznpr6',
         blank=True
     )
+    workout_likes_count = models.IntegerField(default=0, db_index=True)
+    workout_comments_count = models.IntegerField(default=0, db_index=True)
+    score = models.FloatField(default=0)
+
+    stored_counters = (
+        'workout_likes_count', 'workout_comments_count', 'score'
+    )
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='workout_created_idx'
+            ),
+            models.Index(
+                fields=['owner', '-created_at', '-id'],
+                name='workout_owner_created_idx'
+            ),
+            models.Index(
+                fields=['-score', '-id'],
+                name='workout_score_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.id} {self.title}'
 
+    def save(self, *args, **kwargs):
+        """
+        Save the workout. Edits of an existing workout leave out the
+        stored counters and score, which are only changed by
+        single-statement updates.
+        """
+        if (
+            not self._state.adding and not kwargs.get('force_insert')
+            and kwargs.get('update_fields') is None
+        ):
+            kwargs['update_fields'] = edit_fields(
+                self, self.stored_counters
+            )
+        super().save(*args, **kwargs)
+
+
+class Exercise(models.Model):
+    """
+    Represents an exercise of the catalog shared by all workout items.
+
+    Names are unique once case-folded and with whitespace normalized, so
+    workout items logging "Push-ups" and "push-ups" reference the same
+    exercise and are grouped by its id.
+
+    Attributes:
+        name (CharField): The name of the exercise, as first logged.
+        name_key (CharField): The case-folded name, unique in the
+            catalog.
+    """
+    name = models.CharField(max_length=EXERCISE_NAME_LENGTH)
+    name_key = models.CharField(
+        max_length=EXERCISE_NAME_LENGTH, unique=True, editable=False
+    )
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        """
+        Save the exercise, deriving its catalog key from its name.
+        """
+        self.name_key = exercise_key(self.name)
+        super().save(*args, **kwargs)
+
 
 class WorkoutItem(models.Model):
     """
@@ -43,14 +123,131 @@ class WorkoutItem(models.Model):
 
     Attributes:
         workout (ForeignKey): The workout this item belongs to.
-        exercise_name (CharField): The name of the exercise.
+        exercise (ForeignKey): The exercise of the catalog performed.
         quantity (IntegerField): The quantity or repetitions of the exercise.
     """
     workout = models.ForeignKey(
         Workout, related_name='workout_items', on_delete=models.CASCADE
     )
-    exercise_name = models.CharField(max_length=255)
+    exercise = models.ForeignKey(
+        Exercise, related_name='workout_items', on_delete=models.PROTECT
+    )
     quantity = models.IntegerField()
 
     def __str__(self):
-        return f'{self.exercise_name} - {self.quantity}'
+        return f'{self.exercise_id} - {self.quantity}'
+
+
+class WorkoutActivity(models.Model):
+    """
+    Counts the likes and comments received by a workout in one hour.
+
+    Buckets are written when likes and comments are created and summed
+    over the trailing window by the trending endpoint, so trending never
+    scans the like and comment tables. Buckets older than the longest
+    window are deleted by `prune_workout_activity`.
+
+    Attributes:
+        workout (ForeignKey): The workout that received the activity.
+        hour (DateTimeField): The start of the hour the bucket covers.
+        likes_count (IntegerField): The number of likes in the hour.
+        comments_count (IntegerField): The number of comments in the hour.
+
+    Meta:
+        unique_together: A workout has one bucket per hour.
+    """
+    workout = models.ForeignKey(
+        Workout, related_name='activity', on_delete=models.CASCADE
+    )
+    hour = models.DateTimeField()
+    likes_count = models.IntegerField(default=0)
+    comments_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('workout', 'hour')
+        indexes = [
+            models.Index(
+                fields=['hour', 'workout'],
+                name='workout_activity_hour_idx'
+            ),
+        ]
+        verbose_name = 'Workout Activity'
+        verbose_name_plural = 'Workout Activity'
+
+    def __str__(self):
+        return f'{self.workout_id} at {self.hour}'
+
+
+class ExerciseRollup(models.Model):
+    """
+    Totals of one exercise logged by a user over a week or a month.
+
+    Rollups are adjusted by the workout serializer when workouts and
+    their items are written, and when workouts are deleted, so progress
+    charts read a handful of rows instead of scanning the user's
+    workouts. They can be recomputed from the workout items with
+    `rebuild_exercise_rollups`.
+
+    Attributes:
+        owner (ForeignKey): The user who logged the exercise.
+        exercise (ForeignKey): The exercise of the catalog.
+        period (CharField): The length of the period, 'week' or 'month'.
+        period_start (DateField): The first day of the period, a Monday
+            for weeks.
+        quantity (IntegerField): The total quantity logged in the period.
+        items_count (IntegerField): The number of workout items logged
+            in the period.
+
+    Meta:
+        unique_together: A user has one rollup per exercise and period.
+    """
+    PERIOD_CHOICES = [(period, period.title()) for period in ROLLUP_PERIODS]
+
+    owner = models.ForeignKey(
+        User, related_name='exercise_rollups', on_delete=models.CASCADE
+    )
+    exercise = models.ForeignKey(
+        Exercise, related_name='rollups', on_delete=models.CASCADE
+    )
+    period = models.CharField(max_length=5, choices=PERIOD_CHOICES)
+    period_start = models.DateField()
+    quantity = models.IntegerField(default=0)
+    items_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ['period_start']
+        unique_together = ('owner', 'period', 'period_start', 'exercise')
+        verbose_name = 'Exercise Rollup'
+
+    def __str__(self):
+        return (
+            f'{self.exercise_id} of {self.owner_id} for the {self.period} '
+            f'of {self.period_start}'
+        )
+
+
+def remove_workout_rollups(sender, instance, **kwargs):
+    """
+    Signal to subtract the items of a workout about to be deleted from
+    the exercise rollups of its owner.
+
+    Args:
+        sender: The model class sending the signal.
+        instance: The workout being deleted.
+        **kwargs: Additional keyword arguments.
+    """
+    totals = {
+        row['exercise_id']: (-row['quantity'], -row['items_count'])
+        for row in instance.workout_items.values('exercise_id').annotate(
+            quantity=Sum('quantity'), items_count=Count('pk')
+        ).order_by()
+    }
+    adjust_rollups(
+        ExerciseRollup, 'exercise_id', instance.owner_id,
+        instance.created_at, totals
+    )
+
+
+post_save.connect(index_search_document, sender=Workout)
+post_delete.connect(remove_search_document, sender=Workout)
+pre_delete.connect(remove_workout_rollups, sender=Workout)
@@ -1,15 +1,37 @@
+from django.db import transaction
 from rest_framework import serializers
-from .models import Workout, WorkoutItem
+from ft_api.exercises import EXERCISE_NAME_LENGTH, resolve_exercises
+from ft_api.rollups import adjust_rollups, item_totals
+from .models import Exercise, ExerciseRollup, Workout, WorkoutItem
 from workout_likes.models import WorkoutLike
 
 
 class WorkoutItemSerializer(serializers.ModelSerializer):
     """
     Serializer for the WorkoutItem model.
+
+    The id is writable so that an update of the workout can refer to its
+    existing items. Items are written by exercise name, which the workout
+    serializer resolves to an exercise of the catalog.
     """
+    id = serializers.IntegerField(required=False)
+    exercise = serializers.ReadOnlyField(source='exercise_id')
+    exercise_name = serializers.CharField(
+        source='exercise.name', max_length=EXERCISE_NAME_LENGTH
+    )
+
     class Meta:
         model = WorkoutItem
-        fields = ['id', 'exercise_name', 'quantity']
+        fields = ['id', 'exercise', 'exercise_name', 'quantity']
+
+
+class ExerciseSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the Exercise model.
+    """
+    class Meta:
+        model = Exercise
+        fields = ['id', 'name']
 
 
 class WorkoutSerializer(serializers.ModelSerializer):
@@ -111,6 +133,137 @@ class WorkoutSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def validate_workout_items(self, value):
+        """
+        Check that the items sent with an id are distinct items of the
+        workout being updated.
+
+        Args:
+            value (list): The validated workout items.
+
+        Raises:
+            serializers.ValidationError: If an id is repeated or does not
+            belong to an item of the workout.
+
+        Returns:
+            list: The validated workout items.
+        """
+        ids = [item['id'] for item in value if 'id' in item]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError(
+                'Each workout item can only be sent once.'
+            )
+        if ids:
+            existing = set()
+            if self.instance is not None:
+                existing = set(WorkoutItem.objects.filter(
+                    workout=self.instance, pk__in=ids
+                ).values_list('pk', flat=True))
+            unknown = sorted(set(ids) - existing)
+            if unknown:
+                raise serializers.ValidationError(
+                    f'Workout items {unknown} do not belong to this workout.'
+                )
+        return value
+
+    def resolve_workout_items(self, items):
+        """
+        Replace the exercise names of validated workout items with the ids
+        of their catalog entries, adding the new exercises to the catalog.
+
+        Args:
+            items (list): The validated workout items.
+
+        Returns:
+            list: The items, with an `exercise_id` instead of a name.
+        """
+        exercise_ids = resolve_exercises(
+            Exercise, [item['exercise']['name'] for item in items]
+        )
+        for item in items:
+            item['exercise_id'] = exercise_ids[item.pop('exercise')['name']]
+        return items
+
+    def create(self, validated_data):
+        """
+        Create the workout and insert its items with a single bulk insert,
+        adding them to the owner's exercise rollups in the same
+        transaction.
+        """
+        items = validated_data.pop('workout_items', [])
+        with transaction.atomic():
+            workout = super().create(validated_data)
+            items = self.resolve_workout_items(items)
+            WorkoutItem.objects.bulk_create([
+                WorkoutItem(workout=workout, **item) for item in items
+            ])
+            adjust_rollups(
+                ExerciseRollup, 'exercise_id', workout.owner_id,
+                workout.created_at, item_totals(items, 'exercise_id')
+            )
+        return workout
+
+    def update(self, instance, validated_data):
+        """
+        Update the workout and, when `workout_items` is sent, bring its
+        items in line with the list in one transaction: items with an id
+        are updated when they changed, items without one are created and
+        the items left out are deleted.
+        """
+        items = validated_data.pop('workout_items', None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if items is not None:
+                self.update_workout_items(
+                    instance, self.resolve_workout_items(items)
+                )
+        return instance
+
+    def update_workout_items(self, workout, items):
+        """
+        Apply the difference between the stored items of a workout and
+        `items` with one bulk statement per kind of change, and to the
+        owner's exercise rollups.
+
+        Args:
+            workout (Workout): The workout being updated.
+            items (list): The validated workout items.
+        """
+        existing = {
+            item.pk: item
+            for item in WorkoutItem.objects.filter(workout=workout)
+        }
+        fields = ['exercise_id', 'quantity']
+        created, changed, replaced = [], [], []
+        for data in items:
+            item = existing.pop(data.pop('id', None), None)
+            if item is None:
+                created.append(WorkoutItem(workout=workout, **data))
+            elif any(
+                getattr(item, field) != value for field, value in data.items()
+            ):
+                replaced.append(WorkoutItem(
+                    exercise_id=item.exercise_id, quantity=item.quantity
+                ))
+                for field, value in data.items():
+                    setattr(item, field, value)
+                changed.append(item)
+        if existing:
+            WorkoutItem.objects.filter(pk__in=existing).delete()
+        if changed:
+            WorkoutItem.objects.bulk_update(changed, fields)
+        if created:
+            WorkoutItem.objects.bulk_create(created)
+        totals = item_totals(created + changed, 'exercise_id')
+        item_totals(
+            replaced + list(existing.values()), 'exercise_id', sign=-1,
+            totals=totals
+        )
+        adjust_rollups(
+            ExerciseRollup, 'exercise_id', workout.owner_id,
+            workout.created_at, totals
+        )
+
     def get_is_owner(self, obj):
         """
         Check if the request user is the owner of the workout.
@@ -120,8 +273,11 @@ class WorkoutSerializer(serializers.ModelSerializer):
 
     def get_workout_like_id(self, obj):
         """
-        Get the like ID if the workout is liked by the current user.
+        Get the like ID if the workout is liked by the current user, using
+        the ID annotated by the views when available.
         """
+        if hasattr(obj, 'workout_like_id'):
+            return obj.workout_like_id
         user = self.context['request'].user
         if user.is_authenticated:
             like = WorkoutLike.objects.filter(owner=user, workout=obj).first()
@@ -137,3 +293,17 @@ class WorkoutSerializer(serializers.ModelSerializer):
             'image', 'workout_like_id', 'workout_likes_count',
             'workout_comments_count', 'workout_items'
         ]
+
+
+class ExerciseRollupSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the ExerciseRollup model.
+    """
+    exercise_name = serializers.ReadOnlyField(source='exercise.name')
+
+    class Meta:
+        model = ExerciseRollup
+        fields = [
+            'exercise', 'exercise_name', 'period', 'period_start',
+            'quantity', 'items_count'
+        ]
@@ -1,3 +1,180 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from ft_api.scores import LIKE_WEIGHT
+from workout_likes.models import WorkoutLike
+from .models import ExerciseRollup, Workout, WorkoutItem
+from .serializers import WorkoutSerializer
 
-# Create your tests here.
+
+def create_workout(client, title, items):
+    response = client.post('/workouts/', {
+        'title': title, 'content': 'Content', 'workout_items': items,
+    }, format='json')
+    assert response.status_code == 201, response.data
+    return response.data
+
+
+class WorkoutItemUpdateTests(APITestCase):
+    """
+    Tests that updating a workout with `workout_items` updates the items
+    sent with an id, creates those sent without one and deletes the rest.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='athlete')
+        self.client.force_authenticate(self.user)
+        workout = create_workout(self.client, 'Leg day', [
+            {'exercise_name': 'Squat', 'quantity': 5},
+            {'exercise_name': 'Bench press', 'quantity': 3},
+            {'exercise_name': 'Row', 'quantity': 4},
+        ])
+        self.url = f'/workouts/{workout["id"]}/'
+        self.items = {
+            item['exercise_name']: item['id']
+            for item in workout['workout_items']
+        }
+
+    def put_items(self, items):
+        return self.client.put(self.url, {
+            'title': 'Leg day',
+            'content': 'Content',
+            'workout_items': items,
+        }, format='json')
+
+    def test_mixed_update_create_and_delete(self):
+        response = self.put_items([
+            {'id': self.items['Squat'], 'exercise_name': 'Squat',
+             'quantity': 8},
+            {'id': self.items['Bench press'],
+             'exercise_name': 'Bench press', 'quantity': 3},
+            {'exercise_name': 'Deadlift', 'quantity': 2},
+        ])
+        self.assertEqual(response.status_code, 200)
+        items = {
+            item.exercise.name: (item.pk, item.quantity)
+            for item in WorkoutItem.objects.select_related('exercise')
+        }
+        self.assertEqual(items['Squat'], (self.items['Squat'], 8))
+        self.assertEqual(
+            items['Bench press'], (self.items['Bench press'], 3)
+        )
+        self.assertEqual(items['Deadlift'][1], 2)
+        self.assertNotIn('Row', items)
+        self.assertEqual(
+            sorted(item['exercise_name'] for item in
+                   response.data['workout_items']),
+            ['Bench press', 'Deadlift', 'Squat']
+        )
+
+    def test_item_of_another_workout(self):
+        other = create_workout(self.client, 'Arm day', [
+            {'exercise_name': 'Curl', 'quantity': 1},
+        ])['workout_items'][0]['id']
+        response = self.put_items([
+            {'id': other, 'exercise_name': 'Curl', 'quantity': 2},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(WorkoutItem.objects.get(pk=other).quantity, 1)
+        self.assertEqual(WorkoutItem.objects.count(), 4)
+
+
+class ExerciseRollupTests(APITestCase):
+    """
+    Tests that the exercise rollups kept up to date by workout writes
+    match the rollups rebuilt from the stored items.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='athlete')
+        self.client.force_authenticate(self.user)
+        create_workout(self.client, 'Morning', [
+            {'exercise_name': 'Squat', 'quantity': 10},
+        ])
+        workout = create_workout(self.client, 'Evening', [
+            {'exercise_name': 'Squat', 'quantity': 5},
+            {'exercise_name': 'Squat', 'quantity': 5},
+            {'exercise_name': 'Bench press', 'quantity': 3},
+            {'exercise_name': 'Row', 'quantity': 4},
+        ])
+        self.url = f'/workouts/{workout["id"]}/'
+        self.items = [item['id'] for item in workout['workout_items']]
+
+    def rollups(self):
+        return sorted(
+            ExerciseRollup.objects.exclude(
+                quantity=0, items_count=0
+            ).values_list(
+                'exercise__name', 'period', 'period_start', 'quantity',
+                'items_count'
+            )
+        )
+
+    def assertRollupsMatchItems(self):
+        stored = self.rollups()
+        call_command('rebuild_exercise_rollups', stdout=StringIO())
+        self.assertEqual(stored, self.rollups())
+
+    def test_mixed_item_update(self):
+        response = self.client.put(self.url, {
+            'title': 'Evening',
+            'content': 'Content',
+            'workout_items': [
+                {'id': self.items[0], 'exercise_name': 'Squat',
+                 'quantity': 7},
+                {'id': self.items[2], 'exercise_name': 'Incline press',
+                 'quantity': 3},
+                {'exercise_name': 'Deadlift', 'quantity': 2},
+                {'exercise_name': 'Squat', 'quantity': 1},
+            ],
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        squat = [
+            rollup[3:] for rollup in self.rollups()
+            if rollup[0] == 'Squat'
+        ]
+        self.assertEqual(squat, [(18, 3), (18, 3)])
+        self.assertRollupsMatchItems()
+
+    def test_workout_deletion(self):
+        self.client.delete(self.url)
+        self.assertRollupsMatchItems()
+        self.assertEqual(
+            {rollup[0] for rollup in self.rollups()}, {'Squat'}
+        )
+
+
+class WorkoutUpdateCounterTests(APITestCase):
+    """
+    Tests that editing a workout keeps the like count and score
+    written while the edit was in progress.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='athlete')
+        self.client.force_authenticate(self.user)
+        self.workout = Workout.objects.create(
+            owner=self.user, title='Workout', content='Content'
+        )
+        self.liker = User.objects.create(username='liker')
+
+    def test_like_during_edit(self):
+        update = WorkoutSerializer.update
+
+        def update_after_like(serializer, instance, validated_data):
+            WorkoutLike.objects.create(owner=self.liker, workout=instance)
+            return update(serializer, instance, validated_data)
+
+        with mock.patch.object(
+            WorkoutSerializer, 'update', update_after_like
+        ):
+            response = self.client.put(f'/workouts/{self.workout.pk}/', {
+                'title': 'Edited', 'content': 'Content',
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.workout.refresh_from_db()
+        self.assertEqual(self.workout.title, 'Edited')
+        self.assertEqual(self.workout.workout_likes_count, 1)
+        self.assertAlmostEqual(self.workout.score, LIKE_WEIGHT, places=3)
@@ -1,7 +1,22 @@
 from django.urls import path
-from .views import WorkoutList, WorkoutDetail
+from .views import (
+    ExerciseAutocomplete, ExerciseProgress, WorkoutList, WorkoutDetail,
+    WorkoutTrending
+)
 
 urlpatterns = [
     path('workouts/', WorkoutList.as_view(), name='workout-list'),
+    path(
+        'workouts/trending/', WorkoutTrending.as_view(),
+        name='workout-trending'
+    ),
+    path(
+        'workouts/analytics/', ExerciseProgress.as_view(),
+        name='exercise-progress'
+    ),
+    path(
+        'exercises/autocomplete/', ExerciseAutocomplete.as_view(),
+        name='exercise-autocomplete'
+    ),
     path('workouts/<int:pk>/', WorkoutDetail.as_view(), name='workout-detail'),
 ]
@@ -1,26 +1,54 @@
-from django.db.models import Count
+from datetime import timedelta
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework import generics, permissions, filters
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Workout
-from .serializers import WorkoutSerializer
+from .models import (
+    Exercise, ExerciseRollup, Workout, WorkoutActivity, WorkoutItem
+)
+from .serializers import (
+    ExerciseRollupSerializer, ExerciseSerializer, WorkoutSerializer
+)
+from workout_likes.models import WorkoutLike
 from ft_api.permissions import IsOwnerOrReadOnly
+from ft_api.search import FullTextSearchFilter
+from ft_api.exercises import exercise_key
+from ft_api.querysets import embed_authors, viewer_relation_id
+from ft_api.rollups import DEFAULT_ROLLUP_PERIOD, ROLLUP_PERIODS, period_start
+from ft_api.trending import trending_ids, trending_window
+
+
+def exercise_param(request):
+    """
+    Return the exercise id requested with `?exercise=`, or None.
+
+    Raises:
+        ValidationError: If the value is not an integer.
+    """
+    value = request.query_params.get('exercise')
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError({'exercise': 'Enter a valid exercise id.'})
 
 
 class WorkoutList(generics.ListCreateAPIView):
     """
     API view to retrieve list of workouts or create a new workout.
 
-    - GET: Returns a list of all workouts.
+    - GET: Returns a list of all workouts. `?exercise=` limits it to the
+      workouts logging an exercise of the catalog.
     - POST: Creates a new workout.
     """
-    queryset = Workout.objects.annotate(
-        workout_likes_count=Count('workout_likes', distinct=True),
-        workout_comments_count=Count('workoutcomment', distinct=True)
-    ).order_by('-created_at')
+    queryset = Workout.objects.order_by('-created_at')
     filter_backends = [
         filters.OrderingFilter,
-        filters.SearchFilter,
+        FullTextSearchFilter,
         DjangoFilterBackend,
     ]
     filterset_fields = [
@@ -36,10 +64,36 @@ class WorkoutList(generics.ListCreateAPIView):
         'workout_likes_count',
         'workout_comments_count',
         'workout_likes__created_at',
+        'score',
     ]
     serializer_class = WorkoutSerializer
     permission_classes = [permissions.IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+
+    def get_queryset(self):
+        """
+        Annotates the workouts with the current user's like ID, embeds
+        the author and profile in the same query and prefetches the
+        workout items of the page and their exercises.
+
+        The exercise filter is a semi-join on the workout items, served
+        by their exercise index, so each workout is listed once however
+        many of its items log the exercise. Workouts of accounts queued
+        for deletion are hidden.
+        """
+        workouts = embed_authors(
+            super().get_queryset().filter(owner__is_active=True)
+        ).annotate(
+            workout_like_id=viewer_relation_id(
+                self.request.user, WorkoutLike, workout='pk'
+            )
+        ).prefetch_related('workout_items__exercise')
+        exercise = exercise_param(self.request)
+        if exercise is not None:
+            workouts = workouts.filter(Exists(WorkoutItem.objects.filter(
+                workout=OuterRef('pk'), exercise=exercise
+            )))
+        return workouts
 
     def perform_create(self, serializer):
         """
@@ -56,13 +110,25 @@ class WorkoutDetail(generics.RetrieveUpdateDestroyAPIView):
     - PUT: Update the details of a specific workout.
     - DELETE: Delete a specific workout.
     """
-    queryset = Workout.objects.annotate(
-        workout_likes_count=Count('workout_likes', distinct=True),
-        workout_comments_count=Count('workoutcomment', distinct=True)
-    )
+    queryset = Workout.objects.all()
     serializer_class = WorkoutSerializer
     permission_classes = [IsOwnerOrReadOnly]
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+
+    def get_queryset(self):
+        """
+        Annotates the workout with the current user's like ID, embeds
+        the author and profile in the same query and prefetches the
+        workout items and their exercises. Workouts of accounts queued
+        for deletion are hidden.
+        """
+        return embed_authors(
+            super().get_queryset().filter(owner__is_active=True)
+        ).annotate(
+            workout_like_id=viewer_relation_id(
+                self.request.user, WorkoutLike, workout='pk'
+            )
+        ).prefetch_related('workout_items__exercise')
 
     def get_object(self):
         """
@@ -71,3 +137,152 @@ class WorkoutDetail(generics.RetrieveUpdateDestroyAPIView):
         workout = super().get_object()
         self.check_object_permissions(self.request, workout)
         return workout
+
+
+class WorkoutTrending(generics.ListAPIView):
+    """
+    API view to retrieve the workouts with the most likes and comments
+    over the last 24 hours or 7 days.
+
+    - GET: Returns the top workouts, best first, for `?window=24h` (the
+      default) or `?window=7d`.
+
+    The ranking is read from the cached leaderboard of the hourly
+    activity buckets, so only the top workouts themselves are queried.
+    """
+    serializer_class = WorkoutSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+
+    def get_queryset(self):
+        ids = trending_ids(
+            WorkoutActivity, 'workout', trending_window(self.request)
+        )
+        ranks = {pk: rank for rank, pk in enumerate(ids)}
+        workouts = embed_authors(Workout.objects.filter(
+            pk__in=ids, owner__is_active=True
+        )).annotate(
+            workout_like_id=viewer_relation_id(
+                self.request.user, WorkoutLike, workout='pk'
+            )
+        ).prefetch_related(
+            'workout_items__exercise'
+        )
+        return sorted(workouts, key=lambda workout: ranks[workout.pk])
+
+
+class ExerciseProgress(generics.ListAPIView):
+    """
+    API view to chart the current user's exercise totals over time.
+
+    - GET: Returns the weekly (`?period=week`, the default) or monthly
+      (`?period=month`) totals of each exercise, ordered by exercise and
+      period, for the periods overlapping the `?start=` to `?end=` dates.
+      `?exercise=` limits the totals to one exercise id. The window defaults
+      to the last 12 weeks or months and is limited to 2 years.
+
+    Totals are read from the exercise rollups maintained as workouts are
+    written, so a chart is a range scan of the user's rollups rather
+    than an aggregate over all of their workout items.
+    """
+    serializer_class = ExerciseRollupSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    default_windows = {
+        'week': timedelta(weeks=11),
+        'month': timedelta(days=334),
+    }
+    max_window = timedelta(days=731)
+
+    def parse_day(self, name, default):
+        """
+        Parse a date from the query parameters.
+
+        Raises:
+            ValidationError: If the value is not a date.
+        """
+        value = self.request.query_params.get(name)
+        if not value:
+            return default
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+        if day is None:
+            raise ValidationError({name: 'Enter a valid date.'})
+        return day
+
+    def get_queryset(self):
+        """
+        Returns the user's rollups for the requested period and window.
+        """
+        period = self.request.query_params.get(
+            'period', DEFAULT_ROLLUP_PERIOD
+        )
+        if period not in ROLLUP_PERIODS:
+            raise ValidationError({
+                'period': f'Choose one of {", ".join(ROLLUP_PERIODS)}.'
+            })
+        end = self.parse_day('end', timezone.localdate())
+        start = self.parse_day('start', end - self.default_windows[period])
+        if end < start:
+            raise ValidationError({'end': 'End must not be before start.'})
+        if end - start > self.max_window:
+            raise ValidationError(
+                {'end': f'The window is limited to {self.max_window.days} '
+                        'days.'}
+            )
+        rollups = ExerciseRollup.objects.filter(
+            owner=self.request.user, period=period,
+            period_start__gte=period_start(period, start),
+            period_start__lte=end, items_count__gt=0
+        )
+        exercise = exercise_param(self.request)
+        if exercise is not None:
+            rollups = rollups.filter(exercise=exercise)
+        return rollups.select_related('exercise').order_by(
+            'exercise__name', 'exercise', 'period_start'
+        )
+
+
+class ExerciseAutocomplete(generics.ListAPIView):
+    """
+    API view to find exercises of the catalog whose name starts with
+    `?q=`.
+
+    The prefix is case-folded like the catalog keys, so it is matched
+    with a case-sensitive prefix lookup and ordered by the key itself,
+    both served by the plain index on the key, and capped at `?limit=`
+    rows. The cost therefore depends on the number of results rather
+    than on the size of the catalog.
+    """
+    serializer_class = ExerciseSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    query_param = 'q'
+    limit_query_param = 'limit'
+    default_limit = 10
+    max_limit = 20
+
+    def get_limit(self):
+        """
+        Returns the requested number of results, bounded by `max_limit`.
+        """
+        try:
+            limit = int(self.request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_queryset(self):
+        """
+        Returns the exercises matching the query prefix.
+        """
+        prefix = exercise_key(
+            self.request.query_params.get(self.query_param, '')
+        )
+        if not prefix:
+            return []
+        return Exercise.objects.filter(
+            name_key__startswith=prefix
+        ).order_by('name_key')[:self.get_limit()]